@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""VU göstergesi tepe hesabının tampon başına maliyetini ölçer.
+
+Karşılaştırılan yollar:
+  eski döngü   1.2.2 sürümündeki struct.unpack + örnek başına Python döngüsü
+  memoryview   channel_peaks, NumPy olmadan (memoryview dilimleri)
+  numpy        channel_peaks, NumPy ile
+  halka        AudioRingBuffer.push (float32'ye çözme, analiz iş parçacığının girdisi)
+
+    python3 benchmarks/bench_channel_peaks.py [--frames 4096] [--runs 500]
+"""
+
+import argparse
+import os
+import random
+import struct
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "linamp_pkg1.2.2", "usr", "share", "linamp"))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import linamp_audio
+from audio_stubs import encode_buffer
+from linamp_audio import SAMPLE_FLOAT, SAMPLE_SIGNED_INT, SAMPLE_UNSIGNED_INT, AudioRingBuffer, sample_layout
+
+FORMATS = [
+    ("s16", SAMPLE_SIGNED_INT, 16, 2),
+    ("u8", SAMPLE_UNSIGNED_INT, 8, 1),
+    ("s24 (3 bayt)", SAMPLE_SIGNED_INT, 24, 3),
+    ("s32", SAMPLE_SIGNED_INT, 32, 4),
+    ("f32", SAMPLE_FLOAT, 32, 4),
+]
+
+
+def old_peaks(buffer):
+    """1.2.2'deki _process_audio_buffer'ın tepe hesabı (yalnızca 8/16/32 bit ve float)."""
+    fmt = buffer.format()
+    data = bytes(buffer.constData())
+    if fmt.sampleType() == SAMPLE_FLOAT:
+        code, max_amplitude = ('f' if fmt.sampleSize() == 32 else 'd'), 1.0
+    else:
+        codes = {8: 'b', 16: 'h', 32: 'i'} if fmt.sampleType() == SAMPLE_SIGNED_INT else {8: 'B', 16: 'H', 32: 'I'}
+        code = codes.get(fmt.sampleSize())
+        if code is None or fmt.sampleSize() // 8 * buffer.frameCount() * fmt.channelCount() != len(data):
+            return None
+        max_amplitude = (1 << fmt.sampleSize() - (1 if fmt.sampleType() == SAMPLE_SIGNED_INT else 0)) - 1
+    num_samples = len(data) // (fmt.sampleSize() // 8)
+    samples = struct.unpack(f'<{num_samples}{code}', data)
+    num_channels = fmt.channelCount()
+    peaks = []
+    for channel in range(min(num_channels, 2)):
+        peak = 0
+        for i in range(channel, num_samples, num_channels):
+            if fmt.sampleType() == SAMPLE_UNSIGNED_INT:
+                peak = max(peak, abs(samples[i] - (max_amplitude // 2)))
+            else:
+                peak = max(peak, abs(samples[i]))
+        peaks.append(peak / max_amplitude)
+    return peaks
+
+
+def make_buffer(sample_type, bits, container, frames, channels=2):
+    rng = random.Random(0)
+    if sample_type == SAMPLE_FLOAT:
+        values = [[rng.uniform(-1, 1) for _ in range(channels)] for _ in range(frames)]
+    else:
+        full_scale = 1 << (bits - 1)
+        values = [[rng.randint(-full_scale, full_scale - 1) for _ in range(channels)] for _ in range(frames)]
+    return encode_buffer(values, sample_type, bits, container)
+
+
+def time_us(function, runs):
+    return min(timeit.repeat(function, number=runs, repeat=3)) / runs * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=4096)
+    parser.add_argument('--runs', type=int, default=500)
+    args = parser.parse_args()
+
+    numpy = linamp_audio.np
+    print(f"{args.frames} stereo kare, {args.runs} tekrar, Python {sys.version.split()[0]}, "
+          f"NumPy {numpy.__version__ if numpy is not None else 'yok'}")
+    print(f"{'biçim':<14}{'eski döngü':>14}{'memoryview':>14}{'numpy':>14}{'halka':>14}   (µs/tampon)")
+    for name, sample_type, bits, container in FORMATS:
+        buffer = make_buffer(sample_type, bits, container, args.frames)
+        columns = []
+        old_runs = max(1, args.runs // 10)
+        columns.append(time_us(lambda: old_peaks(buffer), old_runs) if old_peaks(buffer) is not None else None)
+
+        linamp_audio.np = None
+        columns.append(time_us(lambda: linamp_audio.channel_peaks(buffer), args.runs))
+        linamp_audio.np = numpy
+        if numpy is not None:
+            columns.append(time_us(lambda: linamp_audio.channel_peaks(buffer), args.runs))
+            ring = AudioRingBuffer()
+            layout = sample_layout(buffer)
+
+            def push():
+                ring.push(buffer, layout)
+                ring.tail = ring.head
+            columns.append(time_us(push, args.runs))
+        else:
+            columns += [None, None]
+        print(f"{name:<14}" + "".join(f"{value:14.1f}" if value is not None else f"{'-':>14}" for value in columns))
+
+
+if __name__ == '__main__':
+    main()
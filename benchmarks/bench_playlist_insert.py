@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Çalma listesine parça eklemenin parça başına maliyetini 10k ve 100k parçada ölçer.
+
+Karşılaştırılan yollar:
+  tek tek   PlaylistModel.append_path: 1.2.2'deki gibi her yol için ayrı ekleme ve
+            ayrı rowsInserted sinyali
+  toplu     PlaylistModel.append_paths: tekrar denetimi, TrackStore.extend ve tek
+            bir rowsInserted aralığı
+
+Ölçülen model linamp.py'deki PlaylistModel'in kendisidir ve ekrandaki gibi bir
+QListView'a bağlıdır (offscreen). QtMultimedia yüklenemiyorsa (ör. PulseAudio
+kitaplıkları yoksa) linamp.py'nin içe aktarılabilmesi için yalnızca bu betikte
+boş yer tutucularla değiştirilir ve QMediaPlaylist.addMedia ölçümü atlanır.
+Depo belleği tracemalloc ile ölçülür.
+
+    python3 benchmarks/bench_playlist_insert.py [--counts 10000 100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "linamp_pkg1.2.2", "usr", "share", "linamp"))
+
+import types
+
+from PyQt5.QtCore import QUrl
+from PyQt5.QtWidgets import QApplication, QListView
+
+try:
+    from PyQt5.QtMultimedia import QMediaContent, QMediaPlaylist
+except ImportError:
+    QMediaPlaylist = None
+    # linamp.py yalnızca sınıf adlarını içe aktarır; ölçülen kod bunları kullanmaz
+    for module_name, class_names in (
+            ("PyQt5.QtMultimedia", ("QMediaPlayer", "QMediaContent", "QMediaPlaylist",
+                                    "QAudioProbe", "QAudioBuffer")),
+            ("PyQt5.QtMultimediaWidgets", ("QVideoWidget",))):
+        module = types.ModuleType(module_name)
+        for class_name in class_names:
+            setattr(module, class_name, type(class_name, (), {}))
+        sys.modules[module_name] = module
+
+from linamp import PlaylistModel
+from linamp_store import TrackStore
+
+
+def make_paths(count):
+    # Albüm başına 12 parça, sanatçı başına 5 albüm
+    return [f"/home/user/Music/Artist {i // 60}/Album {i // 12}/{i % 12 + 1:02d} - Track title {i}.mp3"
+            for i in range(count)]
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def report(name, count, elapsed):
+    print(f"  {name:<34} {elapsed * 1e3:10.1f} ms  {elapsed / count * 1e6:8.2f} µs/parça")
+
+
+def measure_model(paths, single):
+    view = QListView()
+    view.setUniformItemSizes(True)
+    model = PlaylistModel()
+    view.setModel(model)
+    view.resize(300, 400)
+    view.show()
+    QApplication.processEvents()
+    if single:
+        elapsed = timed(lambda: [model.append_path(path) for path in paths])
+    else:
+        elapsed = timed(lambda: model.append_paths(paths))
+    elapsed += timed(QApplication.processEvents)
+    view.setModel(None)
+    return elapsed
+
+
+def measure_media(paths, single):
+    playlist = QMediaPlaylist()
+    if single:
+        return timed(lambda: [playlist.addMedia(QMediaContent(QUrl.fromLocalFile(path))) for path in paths])
+    return timed(lambda: playlist.addMedia([QMediaContent(QUrl.fromLocalFile(path)) for path in paths]))
+
+
+def measure_memory(paths):
+    tracemalloc.start()
+    store = TrackStore()
+    store.extend(paths)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--counts', type=int, nargs='+', default=[10000, 100000])
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    for count in args.counts:
+        paths = make_paths(count)
+        print(f"{count} parça")
+        report("model, tek tek", count, measure_model(paths, True))
+        report("model, toplu", count, measure_model(paths, False))
+        report("QUrl.fromLocalFile", count, timed(lambda: [QUrl.fromLocalFile(path) for path in paths]))
+        if QMediaPlaylist is not None:
+            report("addMedia, tek tek", count, measure_media(paths, True))
+            report("addMedia(liste)", count, measure_media(paths, False))
+        else:
+            print("  QMediaPlaylist                     QtMultimedia yüklenemedi, atlandı")
+        memory = measure_memory(paths)
+        print(f"  {'TrackStore belleği':<34} {memory / 2**20:10.1f} MiB  {memory / count:8.1f} B/parça")
+    del app
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Başlık bölgesi etiket okuyucusunu mutagen'in tam ayrıştırmasıyla karşılaştırır.
+
+Geçici bir dizinde ID3v2 etiketli (gömülü kapaklı) yapay MP3 dosyaları üretir ve
+her iki yöntem için dosya başına okunan baytı (/proc/self/io rchar) ve süreyi
+ölçer. Soğuk ölçümde dosyalar önce posix_fadvise(DONTNEED) ile sayfa
+önbelleğinden atılır.
+
+    python3 benchmarks/bench_tag_reader.py [--files 200] [--audio-mb 6] [--cover-kb 150]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "linamp_pkg1.2.2", "usr", "share", "linamp"))
+
+from mutagen import File as MutagenFile
+from mutagen.id3 import ID3, APIC, TALB, TIT2, TPE1
+
+from linamp_tags import read_basic_tags, read_id3_header_tags
+
+# MPEG-1 Layer III, 128 kbit/s, 44,1 kHz; çerçeve boyu 417 bayt
+MP3_FRAME = b'\xff\xfb\x90\x00' + bytes(413)
+
+
+def make_files(directory, count, audio_bytes, cover_bytes):
+    audio = MP3_FRAME * (audio_bytes // len(MP3_FRAME))
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"{i:05d}.mp3")
+        with open(path, 'wb') as f:
+            f.write(audio)
+        tags = ID3()
+        tags.add(TIT2(encoding=3, text=f"Title {i}"))
+        tags.add(TPE1(encoding=3, text=f"Artist {i % 17}"))
+        tags.add(TALB(encoding=3, text=f"Album {i % 31}"))
+        if cover_bytes:
+            tags.add(APIC(encoding=3, mime='image/jpeg', type=3, desc='', data=os.urandom(cover_bytes)))
+        tags.save(path)
+        paths.append(path)
+    return paths
+
+
+def read_chars():
+    try:
+        with open('/proc/self/io') as f:
+            for line in f:
+                if line.startswith('rchar:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def drop_cache(paths):
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def full_parse(path):
+    audio = MutagenFile(path)
+    tags = audio.tags
+    return tags.get('TPE1'), tags.get('TIT2'), tags.get('TALB'), audio.info.length
+
+
+def measure(name, function, paths, cold):
+    if cold:
+        drop_cache(paths)
+    before = read_chars()
+    start = time.perf_counter()
+    for path in paths:
+        function(path)
+    elapsed = time.perf_counter() - start
+    after = read_chars()
+    per_file_bytes = (after - before) / len(paths) if before is not None else float('nan')
+    print(f"  {name:<26} {per_file_bytes / 1024:10.1f} KiB/dosya {elapsed / len(paths) * 1e6:10.1f} µs/dosya")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=200)
+    parser.add_argument('--audio-mb', type=float, default=6)
+    parser.add_argument('--cover-kb', type=int, default=150)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_files(directory, args.files, int(args.audio_mb * 1024 * 1024), args.cover_kb * 1024)
+        print(f"{args.files} dosya, {args.audio_mb} MiB ses, {args.cover_kb} KiB gömülü kapak")
+        for cold in (True, False):
+            print("soğuk önbellek" if cold else "sıcak önbellek")
+            measure("mutagen.File (tam)", full_parse, paths, cold)
+            measure("read_id3_header_tags", read_id3_header_tags, paths, cold)
+            measure("read_basic_tags", read_basic_tags, paths, cold)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,24 +1,60 @@
 #!/usr/bin/env python3
 
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent, QMediaPlaylist, QAudioProbe, QAudioFormat, QAudioBuffer
+from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent, QMediaPlaylist, QAudioProbe, QAudioBuffer
 from PyQt5.QtMultimediaWidgets import QVideoWidget
 import sys
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QHBoxLayout,
-    QVBoxLayout, QSizePolicy, QSlider, QListWidget, QLayout, QDialog, QPushButton, QAbstractItemView, QListWidgetItem, QStyleOptionSlider, QStyle
+    QVBoxLayout, QSizePolicy, QSlider, QListView, QLayout, QDialog, QPushButton, QAbstractItemView, QStyleOptionSlider, QStyle,
+    QMenu
 )
-from PyQt5.QtCore import Qt, QPoint, QRect, QEvent, QSize, QPropertyAnimation, QEasingCurve, pyqtSignal, QTimer, QUrl, QStandardPaths
-from PyQt5.QtGui import QPixmap, QMouseEvent, QMovie, QCursor, QFont, QColor, QPainter, QImage, QIcon
+from PyQt5.QtCore import (
+    Qt, QPoint, QRect, QEvent, QSize, QPropertyAnimation, QEasingCurve, pyqtSignal, QTimer, QUrl, QStandardPaths,
+    QAbstractListModel, QModelIndex, QPersistentModelIndex, QMimeData, QByteArray, QObject, QThread,
+    QRunnable, QThreadPool, QBuffer, QIODevice
+)
+from PyQt5.QtGui import QPixmap, QMouseEvent, QMovie, QCursor, QFont, QColor, QPainter, QImage, QIcon, QImageReader
 import random
-import struct
-import json
 import os
+import re
+import time
+import queue
+import threading
+import sqlite3
+import hashlib
+import heapq
+import multiprocessing
+import logging
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, wait as wait_futures, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
 
 # Mutagen kütüphanesi için gerekli import'lar
 # Bu kütüphane şarkının varsa tag bilgilerini okuyup arayüze resim bastırır
-from mutagen.mp3 import MP3
-from mutagen.id3 import ID3NoHeaderError, APIC
+from mutagen import File as MutagenFile, MutagenError
+from mutagen.id3 import ID3
+from mutagen.flac import FLAC, Picture
+from mutagen.wave import WAVE
 from io import BytesIO
+import base64
+
+# NumPy isteğe bağlıdır; yoksa ses seviyeleri saf Python ile hesaplanır
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Ses örneği çözme ve analiz yardımcıları (Qt'den bağımsız, linamp.py ile aynı dizinde)
+from linamp_audio import (
+    SPECTRUM_FFT_SIZE, SPECTRUM_BANDS, METER_MODE_PEAK, METER_MODES, METER_DB_FLOOR, METER_DB_TICKS,
+    sample_layout, channel_peaks, LevelMeter, SpectrumAnalyzer, AudioRingBuffer
+)
+# Çalma listesi deposu ve parça bilgileri (Qt'den bağımsız)
+from linamp_store import TrackMetadata, EMPTY_TRACK_METADATA, TrackStore
+# Yalnızca başlık bölgesini okuyan etiket okuyucu (Qt'den bağımsız)
+from linamp_tags import read_id3_from_fd, id3_text, read_basic_tags, format_track_title
+# Ayarları ve çalma listesini saklayan SQLite veritabanı (Qt'den bağımsız)
+from linamp_db import LibraryDatabase
 
 # --- Sabitler (Resimlerin bulunduğu klasör) ---
 # Program kurulduktan sonraki varsayılan dizin
@@ -37,10 +73,87 @@ if os.path.exists(INSTALLED_ICON_PATH):
 else:
     ICON_PATH = os.path.join(os.path.dirname(__file__), "linamp.png")
 
+# Arka plan iş parçacıklarındaki beklenmeyen hatalar buraya yazılır
+LOGGER = logging.getLogger("linamp")
+
 # Veritabanı dosya yolu için sabitler, doğrudan ana dizinde oluşturulacak şekilde değiştirildi
 HOME_DIR = os.path.expanduser("~")
 APP_DATA_DIR = os.path.join(HOME_DIR, ".LinAMP")
-DB_FILE_PATH = os.path.join(APP_DATA_DIR, "temp.json")
+DB_FILE_PATH = os.path.join(APP_DATA_DIR, "temp.json") # Eski sürümlerin durum dosyası, yalnızca aktarım için okunur
+LIBRARY_DB_PATH = os.path.join(APP_DATA_DIR, "linamp.db")
+METADATA_CACHE_PATH = os.path.join(APP_DATA_DIR, "metadata.db")
+# Kapak küçük resimlerinin disk önbelleği (XDG önbellek dizini altında)
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(HOME_DIR, ".cache"), "linamp")
+COVER_CACHE_DIR = os.path.join(CACHE_DIR, "covers")
+
+# Çalma listesine eklenebilen ses dosyası uzantıları
+SUPPORTED_EXTENSIONS = ('.mp3', '.wav', '.ogg', '.flac')
+
+# Klasör içe aktarma ayarları: tarayıcı en fazla bu kadar dosyayı ya da bu kadar saniyeyi
+# biriktirip bildirir, arayüz ise her tikte en fazla bu kadar parçayı listeye ekler
+FOLDER_SCAN_BATCH_SIZE = 500
+FOLDER_SCAN_BATCH_INTERVAL = 0.1
+FOLDER_IMPORT_TICK_MS = 16
+FOLDER_IMPORT_TRACKS_PER_TICK = 500
+
+# Çalma listesinin kendi içindeki sürükle-bırak işlemleri için MIME türü
+PLAYLIST_ROWS_MIME = "application/x-linamp-playlist-rows"
+# Başlangıçta pencere açılmadan önce okunan çalma listesi satırı sayısı
+PLAYLIST_FIRST_PAGE_SIZE = 200
+# Kalan satırlar pencere açıldıktan sonra her tikte bu kadar satırlık sayfalar halinde yüklenir
+PLAYLIST_RESTORE_TICK_MS = 16
+PLAYLIST_RESTORE_PAGE_SIZE = 500
+
+# Başlangıçtaki dosya varlığı denetimi: bir bağlama noktası bu kadar saniye ilerleme
+# göstermezse erişilemez sayılır; aynı anda en fazla bu kadar bağlama noktası denetlenir
+VALIDATION_MOUNT_TIMEOUT = 5.0
+VALIDATION_MAX_CONCURRENT_MOUNTS = 4
+VALIDATION_REPORT_BATCH = 500
+
+# Albüm kapağı boyutu ve kapakları yükleyen iş parçacığı sayısı
+ALBUM_ART_SIZE = 64
+ALBUM_ART_THREADS = 2
+# Bellekteki kapak önbelleğinin varsayılan bayt bütçesi ve en fazla hatırlanan parça sayısı
+ALBUM_ART_CACHE_BYTES = 4 * 1024 * 1024
+ALBUM_ART_CACHE_KEYS = 4096
+# Bellekteki kapağın dosyası en fazla bu kadar saniyede bir yeniden denetlenir (stat); arada disk erişimi yapılmaz
+ALBUM_ART_REVALIDATE_SECONDS = 60.0
+# Parça klasöründe aranan kapak dosyası adları ve uzantıları (öncelik sırasıyla)
+FOLDER_COVER_NAMES = ('cover', 'folder', 'front', 'album', 'albumart')
+FOLDER_COVER_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+# Diskteki kapak önbelleğinin en büyük boyutu
+COVER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Parça bilgisi dizinleyicisi sonuçları en fazla bu kadar parçalık ya da bu kadar saniyelik gruplar halinde bildirir
+METADATA_REPORT_BATCH = 200
+METADATA_REPORT_INTERVAL = 0.25
+# İçerik hash'i için dosyanın başından ve sonundan okunan bayt sayısı
+METADATA_HASH_CHUNK = 64 * 1024
+# Önbellekte olmayan parçaları okuyan süreç sayısı ve aynı anda bekleyen en fazla okuma
+METADATA_WORKERS = max(1, min(4, os.cpu_count() or 1))
+METADATA_MAX_IN_FLIGHT = METADATA_WORKERS * 4
+# Süre etiketinin seçim ve liste değişikliklerinden sonra güncellenmeden önce beklediği süre
+DURATION_LABEL_DELAY_MS = 50
+
+# Sıradaki parçanın hazırlanması: parça değiştikten bu kadar sonra başlar ve dosyanın ilk bu kadar baytını önceden okutur
+PREFETCH_DELAY_MS = 2000
+PREFETCH_READAHEAD_BYTES = 2 * 1024 * 1024
+PREFETCH_READ_CHUNK = 256 * 1024
+
+# VU göstergelerinin saniyedeki en fazla güncellenme sayısı (ayarlardan değiştirilebilir)
+VISUALIZATION_FPS = 30
+VISUALIZATION_MAX_FPS = 120
+
+# Analiz iş parçacığında bu kadar saniyeden geç işlenen ses tamponu gecikmiş sayılır
+AUDIO_ANALYSIS_LATE_SECONDS = 0.1
+
+# Spektrum göstergesinin saniyedeki düşüşü (tam yüksekliğin oranı)
+SPECTRUM_FALLOFF = 1.5
+
+# Bulunamayan parçaların listedeki rengi
+MISSING_TRACK_COLOR = QColor("#888888")
+# Bu sayıdan fazla ayrık aralık silinirken model satır satır değil, topluca sıfırlanır
+PLAYLIST_RESET_RANGE_LIMIT = 256
 
 # --- Özel Buton Sınıfı (Normal resimli) ---
 class ImageButton(QLabel):
@@ -317,6 +430,8 @@ class VUMeterBar(QWidget):
         self._peak_hold_timer.timeout.connect(self._decay_peak_hold)
         
         self.bar_color = bar_color
+        # True ise gösterge dBFS ölçeğindedir ve ölçek çizgileri çizilir
+        self.db_scale = False
         self.setFixedSize(250, 15) 
         self.setStyleSheet("background-color: #333333; border: none; border-radius: 3px;")
 
@@ -334,6 +449,10 @@ class VUMeterBar(QWidget):
                  self.update()
                  self._peak_hold_timer.stop()
                  
+    def set_db_scale(self, enabled):
+        self.db_scale = enabled
+        self.update()
+
     def _decay_peak_hold(self):
         self._peak_hold_level = max(0.0, self._peak_hold_level * 0.8)
         if self._peak_hold_level > 0.01:
@@ -360,8 +479,234 @@ class VUMeterBar(QWidget):
             painter.setBrush(QColor(255, 255, 0, 200))
             painter.drawRect(peak_x_pos - peak_pixel_width, rect.top(), peak_pixel_width, rect.height())
 
+        if self.db_scale:
+            painter.setPen(QColor(255, 255, 255, 70))
+            for db in METER_DB_TICKS:
+                tick_x = int(rect.width() * (db - METER_DB_FLOOR) / -METER_DB_FLOOR)
+                painter.drawLine(tick_x, rect.top(), tick_x, rect.bottom())
+
         super().paintEvent(event)
 
+# --- Spektrum Göstergesi ---
+class SpectrumWidget(QWidget):
+    """Winamp tarzı çubuk spektrum göstergesi; yalnızca yüksekliği değişen çubukları yeniden çizer."""
+
+    def __init__(self, bands=SPECTRUM_BANDS, falloff=SPECTRUM_FALLOFF, bar_color=QColor("#0071ff"), parent=None):
+        super().__init__(parent)
+        self.bar_color = bar_color
+        self.falloff = falloff # saniyede düşülen yükseklik (tam yüksekliğin oranı olarak)
+        self.setFixedSize(250, 30)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self._last_frame = None
+        self.set_band_count(bands)
+
+    def set_band_count(self, bands):
+        self.bands = max(1, int(bands))
+        self._levels = [0.0] * self.bands
+        self._heights = [0] * self.bands
+        self.update()
+
+    def reset(self):
+        self._last_frame = None
+        self.set_levels([0.0] * self.bands)
+
+    def set_levels(self, levels):
+        """Yeni kare değerlerini düşüş hızıyla birleştirir ve değişen çubukların alanını geçersiz kılar."""
+        now = time.monotonic()
+        drop = self.falloff * (now - self._last_frame) if self._last_frame is not None else 1.0
+        self._last_frame = now
+        if len(levels) != self.bands:
+            self.set_band_count(len(levels))
+
+        height = self.height()
+        for band, level in enumerate(levels):
+            level = max(level, self._levels[band] - drop, 0.0)
+            self._levels[band] = level
+            bar_height = int(round(min(level, 1.0) * height))
+            if bar_height != self._heights[band]:
+                self._heights[band] = bar_height
+                self.update(self._bar_rect(band, height))
+
+    def _bar_rect(self, band, height):
+        left = band * self.width() // self.bands
+        right = (band + 1) * self.width() // self.bands
+        return QRect(left, 0, right - left, height)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setPen(Qt.NoPen)
+        dirty = event.rect()
+        height = self.height()
+        for band in range(self.bands):
+            rect = self._bar_rect(band, height)
+            if not rect.intersects(dirty):
+                continue
+            painter.fillRect(rect, QColor("#333333"))
+            bar_height = self._heights[band]
+            if bar_height > 0:
+                # Çubuklar arasında 1 piksellik boşluk bırakılır
+                painter.fillRect(QRect(rect.left(), height - bar_height, max(1, rect.width() - 1), bar_height),
+                                 self.bar_color)
+
+
+# --- Görselleştirme Saati ---
+class VisualizationClock(QObject):
+    """Göstergeleri ses tamponlarının geliş hızından bağımsız, sabit bir kare hızında günceller.
+
+    İki tik arasında gelen tüm tamponların kanal tepe değerleri en büyükleri
+    alınarak biriktirilir; böylece kısa bir tepe kaçırılmadan her karede tek bir
+    güncelleme yapılır. Tikler arasında hiç tampon gelmezse kare gönderilmez.
+    """
+    # Kanal başına, son kareden bu yana görülen en yüksek tepe değerleri
+    frame = pyqtSignal(list)
+    # Bant başına, son kareden bu yana görülen en yüksek spektrum değerleri
+    spectrum_frame = pyqtSignal(list)
+
+    def __init__(self, fps=VISUALIZATION_FPS, parent=None):
+        super().__init__(parent)
+        self._peaks = None
+        self._spectrum = None
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+        self.set_fps(fps)
+
+    def set_fps(self, fps):
+        self.fps = max(1, min(VISUALIZATION_MAX_FPS, int(fps)))
+        self._timer.setInterval(round(1000 / self.fps))
+
+    def start(self):
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+        self._peaks = None
+        self._spectrum = None
+
+    @staticmethod
+    def _merge(current, values):
+        if current is None or len(current) != len(values):
+            return list(values)
+        return [max(old, new) for old, new in zip(current, values)]
+
+    def add_peaks(self, peaks):
+        self._peaks = self._merge(self._peaks, peaks)
+
+    def add_spectrum(self, bands):
+        self._spectrum = self._merge(self._spectrum, bands)
+
+    def _tick(self):
+        if self._peaks is not None:
+            peaks, self._peaks = self._peaks, None
+            self.frame.emit(peaks)
+        if self._spectrum is not None:
+            bands, self._spectrum = self._spectrum, None
+            self.spectrum_frame.emit(bands)
+
+
+# --- Ses Analizi İş Parçacığı ---
+class AudioAnalysisWorker(QThread):
+    """Ses tamponlarını arayüz iş parçacığı dışında çözümler ve yalnızca küçük sonuçları yayınlar.
+
+    Her uyanışta halkadaki tüm yuvalar seçili ölçüm kipiyle (LevelMeter) işlenir
+    ve kanal başına en yüksek gösterge konumu tek bir sinyalle gönderilir. Halka dolu olduğu için atılan tamponlar
+    (dropped) ve işlenene kadar AUDIO_ANALYSIS_LATE_SECONDS'dan uzun bekleyen
+    tamponlar (late) sayılır.
+    """
+    # Kanal başına 0..1 gösterge konumları
+    levels_ready = pyqtSignal(list)
+    # Bant başına 0..1 spektrum değerleri
+    spectrum_ready = pyqtSignal(list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ring = AudioRingBuffer()
+        self.meter = LevelMeter()
+        self.spectrum = SpectrumAnalyzer()
+        self._requested_mode = None
+        self._requested_bands = None
+        self.late = 0
+        self.processed = 0
+        self._wakeup = threading.Event()
+        self._reset_requested = False
+
+    @property
+    def dropped(self):
+        return self.ring.dropped
+
+    def push(self, buffer):
+        """Arayüz iş parçacığından çağrılır; desteklenmeyen biçimde False döndürür."""
+        layout = sample_layout(buffer)
+        if layout is None:
+            return False
+        if self.ring.push(buffer, layout):
+            self._wakeup.set()
+        return True
+
+    def reset(self):
+        """Bekleyen tamponları atar (ör. çalma durduğunda)."""
+        self._reset_requested = True
+        self._wakeup.set()
+
+    def set_meter_mode(self, mode):
+        """Ölçüm kipini değiştirir; değişiklik analiz iş parçacığında uygulanır."""
+        self._requested_mode = mode
+        self._wakeup.set()
+
+    def set_spectrum_bands(self, bands):
+        self._requested_bands = bands
+        self._wakeup.set()
+
+    def stop(self):
+        self.requestInterruption()
+        self._wakeup.set()
+        self.wait()
+
+    def run(self):
+        ring = self.ring
+        while not self.isInterruptionRequested():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._requested_mode is not None:
+                self.meter.set_mode(self._requested_mode)
+                self._requested_mode = None
+            if self._requested_bands is not None:
+                self.spectrum.set_bands(self._requested_bands)
+                self._requested_bands = None
+            if self._reset_requested:
+                self._reset_requested = False
+                ring.tail = ring.head
+                self.meter.reset()
+                self.spectrum.reset()
+                continue
+
+            peaks = None
+            bands = None
+            now = time.monotonic()
+            while ring.tail < ring.head:
+                slot = ring.tail % ring.slots
+                frames = ring.frames[slot]
+                channels = ring.channels[slot]
+                if now - ring.stamps[slot] > AUDIO_ANALYSIS_LATE_SECONDS:
+                    self.late += 1
+                block = ring.samples[slot, :frames, :channels]
+                slot_peaks = self.meter.process(block, ring.rates[slot])
+                slot_bands = self.spectrum.process(block, ring.rates[slot])
+                if slot_bands is not None:
+                    bands = slot_bands if bands is None else [max(old, new) for old, new in zip(bands, slot_bands)]
+                if peaks is None or len(peaks) != len(slot_peaks):
+                    peaks = slot_peaks
+                else:
+                    peaks = [max(old, new) for old, new in zip(peaks, slot_peaks)]
+                self.processed += 1
+                ring.tail += 1
+            if peaks is not None:
+                self.levels_ready.emit(peaks)
+            if bands is not None:
+                self.spectrum_ready.emit(bands)
+
+
 # --- Özel QSlider Alt Sınıfı (Tıklama ile pozisyon değiştirme için) ---
 class ClickableSlider(QSlider):
     def mousePressEvent(self, event: QMouseEvent):
@@ -476,18 +821,172 @@ class AboutWindow(QDialog):
         close_button.clicked.connect(self.accept)
         layout.addWidget(close_button, alignment=Qt.AlignCenter)
         
-# --- Sürükle-Bırak Özelliği İçin Özel QListWidget Sınıfı ---
-class CustomPlaylistWidget(QListWidget):
+# --- Çalma Listesi Modeli ---
+class PlaylistModel(QAbstractListModel):
+    """TrackStore üzerinde çalışan model; görünüm yalnızca ekrandaki satırları sorgular."""
+    # Listenin toplam süresi ya da süresi bilinen parça sayısı değişti
+    durations_changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = TrackStore()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.store)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.store):
+            return None
+        if role == Qt.DisplayRole:
+            metadata = self.store.metadata(index.row())
+            if metadata is not None:
+                return format_playlist_entry(metadata, self.store.name(index.row()))
+            return self.store.name(index.row())
+        if role == Qt.UserRole:
+            return self.store.path(index.row())
+        if self.store.is_missing(index.row()):
+            # Bulunamayan dosyalar silinmez, soluk ve italik gösterilir
+            if role == Qt.ForegroundRole:
+                return MISSING_TRACK_COLOR
+            if role == Qt.FontRole:
+                font = QFont()
+                font.setItalic(True)
+                return font
+            if role == Qt.ToolTipRole:
+                return f"Dosya bulunamadı: {self.store.path(index.row())}"
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid():
+            return flags | Qt.ItemIsDragEnabled
+        return flags | Qt.ItemIsDropEnabled
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def mimeTypes(self):
+        return [PLAYLIST_ROWS_MIME]
+
+    def mimeData(self, indexes):
+        mime_data = QMimeData()
+        rows = ",".join(str(index.row()) for index in indexes)
+        mime_data.setData(PLAYLIST_ROWS_MIME, QByteArray(rows.encode('ascii')))
+        return mime_data
+
+    def moveRows(self, source_parent, source_row, count, destination_parent, destination_child):
+        if count <= 0 or source_row < 0 or source_row + count > len(self.store):
+            return False
+        # Bloğun kendi üzerine taşınması bir şey değiştirmez
+        if source_row <= destination_child <= source_row + count:
+            return False
+        if not self.beginMoveRows(QModelIndex(), source_row, source_row + count - 1, QModelIndex(), destination_child):
+            return False
+        self.store.move(source_row, count, destination_child)
+        self.endMoveRows()
+        return True
+
+    def paths(self):
+        return self.store.paths()
+
+    def contains(self, file_path):
+        return file_path in self.store
+
+    def mark_missing(self, file_paths, missing=True):
+        if self.store.set_missing(file_paths, missing) and len(self.store):
+            # Görünüm yalnızca ekrandaki satırları yeniden çizer
+            self.dataChanged.emit(self.index(0), self.index(len(self.store) - 1),
+                                  [Qt.ForegroundRole, Qt.FontRole, Qt.ToolTipRole])
+
+    def entry_metadata(self, file_path):
+        return self.store.metadata_of(file_path)
+
+    def set_entry_metadata(self, metadata_by_path):
+        """Dizinleyiciden gelen parça bilgilerini depoya yazar ve satırları yeniden çizdirir."""
+        if self.store.set_metadata(metadata_by_path.items()):
+            self.durations_changed.emit()
+        if len(self.store):
+            self.dataChanged.emit(self.index(0), self.index(len(self.store) - 1), [Qt.DisplayRole])
+
+    def append_path(self, file_path):
+        return self.append_paths([file_path])
+
+    def append_paths(self, file_paths):
+        """Listede olmayan yolları tek bir rowsInserted sinyaliyle ekler ve eklenenleri döndürür."""
+        store = self.store
+        batch = set()
+        new_paths = []
+        for file_path in file_paths:
+            if file_path not in batch and file_path not in store:
+                batch.add(file_path)
+                new_paths.append(file_path)
+        if not new_paths:
+            return new_paths
+
+        first_row = len(store)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(new_paths) - 1)
+        store.extend(new_paths)
+        self.endInsertRows()
+        self.durations_changed.emit()
+        return new_paths
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.store.remove(row)
+        self.endRemoveRows()
+        self.durations_changed.emit()
+
+    def remove_ranges(self, ranges):
+        """Sıralı ve birleştirilmiş satır aralıklarını toplu olarak siler."""
+        if len(ranges) > PLAYLIST_RESET_RANGE_LIMIT:
+            # Çok parçalı seçimlerde yüzlerce rowsRemoved yerine tek bir sıfırlama sinyali gönder
+            self.beginResetModel()
+            self.store.remove_ranges(ranges)
+            self.endResetModel()
+        else:
+            for start, end in reversed(ranges):
+                self.beginRemoveRows(QModelIndex(), start, end)
+                self.store.remove_ranges([(start, end)])
+                self.endRemoveRows()
+        self.durations_changed.emit()
+
+    def clear(self):
+        self.beginResetModel()
+        self.store.clear()
+        self.endResetModel()
+        self.durations_changed.emit()
+
+
+# --- Sürükle-Bırak Özelliği İçin Özel QListView Sınıfı ---
+class CustomPlaylistWidget(QListView):
     files_dropped = pyqtSignal(list)
+    folders_dropped = pyqtSignal(list)
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setModel(PlaylistModel(self))
+        # Tüm satırlar aynı yükseklikte; görünüm her satırı ayrı ayrı ölçmez
+        self.setUniformItemSizes(True)
         self.setAcceptDrops(True)
         self.setDragDropMode(QAbstractItemView.InternalMove)
-        self.setSelectionMode(QListWidget.ExtendedSelection)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.setDragEnabled(True)
         self.setAlternatingRowColors(True)
 
+    def selected_row_ranges(self):
+        """Seçimi sıralı ve birleştirilmiş (başlangıç, bitiş) satır aralıklarına çevirir."""
+        ranges = sorted((selection_range.top(), selection_range.bottom())
+                        for selection_range in self.selectionModel().selection())
+        merged = []
+        for start, end in ranges:
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return [tuple(item) for item in merged]
+
     def dragEnterEvent(self, event):
         # Sadece dosyaları veya kendi içindeki öğeleri kabul et
         if event.mimeData().hasUrls() or event.source() == self:
@@ -505,19 +1004,1205 @@ class CustomPlaylistWidget(QListWidget):
     def dropEvent(self, event):
         if event.mimeData().hasUrls():
             file_paths = []
+            folder_paths = []
             for url in event.mimeData().urls():
-                if url.isLocalFile() and url.toLocalFile().lower().endswith(('.mp3', '.wav', '.ogg', '.flac')):
-                    file_paths.append(url.toLocalFile())
-            self.files_dropped.emit(file_paths)
+                if not url.isLocalFile():
+                    continue
+                local_path = url.toLocalFile()
+                # Klasör adı ses uzantısıyla bitebilir (ör. "Live.mp3"); önce klasör mü diye bak
+                if os.path.isdir(local_path):
+                    folder_paths.append(local_path)
+                elif local_path.lower().endswith(SUPPORTED_EXTENSIONS):
+                    file_paths.append(local_path)
+            if file_paths:
+                self.files_dropped.emit(file_paths)
+            if folder_paths:
+                self.folders_dropped.emit(folder_paths)
             event.acceptProposedAction()
+        elif event.source() == self:
+            self._move_selected_rows(self._drop_row(event.pos()))
+            # Taşıma model üzerinde yapıldı; sürükleme kaynağının satırları silmesini engelle
+            event.setDropAction(Qt.CopyAction)
+            event.accept()
         else:
-            # İçerideki sürükle-bırak işlemi için temel sınıfın dropEvent'ini kullan
-            super().dropEvent(event)
-            event.acceptProposedAction()
+            event.ignore()
+
+    def _drop_row(self, pos):
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return self.model().rowCount()
+        if pos.y() >= self.visualRect(index).center().y():
+            return index.row() + 1
+        return index.row()
+
+    def _move_selected_rows(self, destination):
+        """Seçili blokları görünür sıralarını koruyarak destination satırına art arda taşır."""
+        model = self.model()
+        blocks = [(QPersistentModelIndex(model.index(start)), end - start + 1)
+                  for start, end in self.selected_row_ranges()]
+        insert_at = destination
+        for block_start, count in blocks:
+            start = block_start.row()
+            if start <= insert_at <= start + count:
+                insert_at = start + count
+                continue
+            model.moveRows(QModelIndex(), start, count, QModelIndex(), insert_at)
+            new_start = insert_at if insert_at < start else insert_at - count
+            insert_at = new_start + count
+
+
+# --- Klasör Tarama İş Parçacığı ---
+class FolderScanWorker(QThread):
+    """Bırakılan klasörleri os.scandir ile özyinelemeli tarar ve bulunan parçaları gruplar halinde bildirir."""
+    tracks_found = pyqtSignal(list)
+
+    def __init__(self, folders, parent=None):
+        super().__init__(parent)
+        self.folders = list(folders)
+
+    def run(self):
+        batch = []
+        last_emit = time.monotonic()
+        # Klasörler ada göre sıralı ve derinlik öncelikli gezilir; alt klasörler ters sırayla yığına atılır
+        stack = sorted(self.folders, reverse=True)
+        while stack and not self.isInterruptionRequested():
+            folder = stack.pop()
+            try:
+                with os.scandir(folder) as entries:
+                    entries = sorted(entries, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            subfolders = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subfolders.append(entry.path)
+                    elif entry.name.lower().endswith(SUPPORTED_EXTENSIONS) and entry.is_file():
+                        batch.append(entry.path)
+                except OSError:
+                    continue
+            stack.extend(reversed(subfolders))
+
+            if len(batch) >= FOLDER_SCAN_BATCH_SIZE or (batch and time.monotonic() - last_emit >= FOLDER_SCAN_BATCH_INTERVAL):
+                self.tracks_found.emit(batch)
+                batch = []
+                last_emit = time.monotonic()
+
+        if batch and not self.isInterruptionRequested():
+            self.tracks_found.emit(batch)
+
+
+# --- Klasör İçe Aktarma Yöneticisi ---
+class FolderImporter(QObject):
+    """Tarama iş parçacıklarından gelen parçaları biriktirir ve arayüze kare başına sınırlı sayıda aktarır."""
+    tracks_ready = pyqtSignal(list)
+    progress_changed = pyqtSignal(int)
+    finished = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._workers = []
+        self._pending = deque()
+        self._found = 0
+        self._drain_timer = QTimer(self)
+        self._drain_timer.setInterval(FOLDER_IMPORT_TICK_MS)
+        self._drain_timer.timeout.connect(self._drain)
+
+    def is_running(self):
+        return bool(self._workers or self._pending)
+
+    def import_folders(self, folders):
+        worker = FolderScanWorker(folders, self)
+        worker.tracks_found.connect(self._queue_tracks)
+        worker.finished.connect(self._worker_finished)
+        self._workers.append(worker)
+        worker.start()
+        if not self._drain_timer.isActive():
+            self._drain_timer.start()
+
+    def cancel(self):
+        for worker in self._workers:
+            worker.requestInterruption()
+        self._pending.clear()
+
+    def stop(self):
+        """Uygulama kapanırken taramaları iptal eder ve iş parçacıklarının bitmesini bekler."""
+        self.cancel()
+        for worker in self._workers:
+            worker.wait()
+
+    def _queue_tracks(self, file_paths):
+        worker = self.sender()
+        if worker is not None and worker.isInterruptionRequested():
+            return
+        self._pending.extend(file_paths)
+        self._found += len(file_paths)
+        self.progress_changed.emit(self._found)
+
+    def _worker_finished(self):
+        worker = self.sender()
+        if worker in self._workers:
+            self._workers.remove(worker)
+            worker.deleteLater()
+
+    def _drain(self):
+        # Arayüzün akıcı kalması için her tikte en fazla belirli sayıda parça eklenir
+        count = min(len(self._pending), FOLDER_IMPORT_TRACKS_PER_TICK)
+        if count:
+            popleft = self._pending.popleft
+            self.tracks_ready.emit([popleft() for _ in range(count)])
+
+        if not self.is_running():
+            self._drain_timer.stop()
+            self._found = 0
+            self.finished.emit()
+
+
+# --- Dosya Varlığı Denetleyicisi ---
+def read_mount_points():
+    """/proc/self/mounts içindeki bağlama noktalarını en uzundan en kısaya sıralı döndürür."""
+    mount_points = []
+    try:
+        with open("/proc/self/mounts", 'r', encoding='utf-8', errors='surrogateescape') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 2:
+                    # Boşluk gibi karakterler \040 biçiminde sekizlik kaçış dizisiyle yazılır
+                    mount_points.append(re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), fields[1]))
+    except OSError:
+        pass
+    if "/" not in mount_points:
+        mount_points.append("/")
+    return sorted(set(mount_points), key=len, reverse=True)
+
+
+class _MountCheck:
+    """Tek bir bağlama noktasındaki yolların denetim durumu; denetim iş parçacığıyla paylaşılır."""
+
+    def __init__(self, mount_point, file_paths):
+        self.mount_point = mount_point
+        self.file_paths = file_paths
+        self.checked = 0
+        # Zaman aşımı grubun iş parçacığı başladığında saymaya başlar; kuyrukta bekleme süresi sayılmaz
+        self.last_progress = None
+        self.abandoned = False
+
+
+class PathValidator(QThread):
+    """Çalma listesindeki dosyaların varlığını arka planda denetler ve bulunamayanları bildirir.
+
+    Yollar bağlama noktalarına göre gruplanır; her grup kendi iş parçacığında
+    sırayla denetlenir ve aynı anda en fazla VALIDATION_MAX_CONCURRENT_MOUNTS grup
+    çalışır. VALIDATION_MOUNT_TIMEOUT saniye boyunca ilerleme göstermeyen (ör. yanıt
+    vermeyen bir NFS bağlantısı) grubun kalan dosyaları erişilemez sayılır.
+
+    report_present verilirse bulunan dosyalar da present_found ile bildirilir;
+    bulunamadı işaretli parçaları yeniden denetlerken kullanılır.
+    """
+    missing_found = pyqtSignal(list)
+    present_found = pyqtSignal(list)
+
+    def __init__(self, file_paths, parent=None, report_present=False):
+        super().__init__(parent)
+        self.file_paths = file_paths # yollar bu iş parçacığında okunur; depo kopyası ya da liste olmalı
+        self.report_present = report_present
+
+    def run(self):
+        mount_points = read_mount_points()
+        mount_of_dir = {}
+        groups = {}
+        for file_path in self.file_paths:
+            directory = os.path.dirname(file_path)
+            mount_point = mount_of_dir.get(directory)
+            if mount_point is None:
+                mount_point = next(mp for mp in mount_points
+                                   if mp == "/" or directory == mp or directory.startswith(mp + "/"))
+                mount_of_dir[directory] = mount_point
+            groups.setdefault(mount_point, []).append(file_path)
+
+        results = queue.Queue()
+        pending = deque(_MountCheck(mount_point, file_paths) for mount_point, file_paths in groups.items())
+        active = []
+        while (pending or active) and not self.isInterruptionRequested():
+            while pending and len(active) < VALIDATION_MAX_CONCURRENT_MOUNTS:
+                check = pending.popleft()
+                check.last_progress = time.monotonic()
+                threading.Thread(target=self._check_mount, args=(check, results),
+                                 name="LinAMP-path-check", daemon=True).start()
+                active.append(check)
+
+            try:
+                check, missing, present, done = results.get(timeout=0.2)
+                if not check.abandoned:
+                    if missing:
+                        self.missing_found.emit(missing)
+                    if present:
+                        self.present_found.emit(present)
+                    if done:
+                        active.remove(check)
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            for check in list(active):
+                if now - check.last_progress > VALIDATION_MOUNT_TIMEOUT:
+                    # Takılan iş parçacığı bırakılır; grubun kalan dosyaları erişilemez olarak işaretlenir
+                    check.abandoned = True
+                    active.remove(check)
+                    self.missing_found.emit(check.file_paths[check.checked:])
+
+    def _check_mount(self, check, results):
+        missing = []
+        present = []
+        for file_path in check.file_paths:
+            if check.abandoned:
+                return
+            try:
+                os.stat(file_path)
+            except OSError:
+                missing.append(file_path)
+            else:
+                if self.report_present:
+                    present.append(file_path)
+            check.checked += 1
+            check.last_progress = time.monotonic()
+            if check.checked % VALIDATION_REPORT_BATCH == 0:
+                results.put((check, missing, present, False))
+                missing = []
+                present = []
+        results.put((check, missing, present, True))
+
+
+# --- Albüm Kapağı Yükleyici ---
+# Kapak resmi türleri arasında ön kapak (3) tercih edilir
+FRONT_COVER_PICTURE_TYPE = 3
+
+
+def _pick_cover(pictures):
+    """(resim türü, veri) çiftlerinden ön kapağı, yoksa ilk resmi döndürür."""
+    pictures = [(picture_type, data) for picture_type, data in pictures if data]
+    for picture_type, data in pictures:
+        if picture_type == FRONT_COVER_PICTURE_TYPE:
+            return data
+    return pictures[0][1] if pictures else None
+
+
+def _id3_cover(tags):
+    if tags is None:
+        return None
+    return _pick_cover((frame.type, frame.data) for frame in tags.getall('APIC'))
+
+
+def _vorbis_cover(audio):
+    """FLAC PICTURE bloklarından ve Vorbis METADATA_BLOCK_PICTURE yorumlarından kapağı seçer."""
+    pictures = [(picture.type, picture.data) for picture in getattr(audio, 'pictures', [])]
+    for encoded in (audio.tags or {}).get('metadata_block_picture', []):
+        try:
+            picture = Picture(base64.b64decode(encoded))
+        except (ValueError, MutagenError):
+            continue
+        pictures.append((picture.type, picture.data))
+    return _pick_cover(pictures)
+
+
+def read_embedded_cover(file_path):
+    """Dosyaya gömülü kapak resminin baytlarını döndürür; yoksa None.
+
+    Kapsayıcı, dosyanın ilk baytlarından anlaşılır: FLAC PICTURE blokları, Ogg
+    içindeki METADATA_BLOCK_PICTURE yorumları, WAV içindeki ID3 etiketi ve MP3'ün
+    ID3 APIC çerçeveleri okunur.
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return None
+
+    try:
+        header = os.pread(fd, 12, 0)
+        if header.startswith(b'fLaC'):
+            return _pick_cover((picture.type, picture.data) for picture in FLAC(file_path).pictures)
+
+        if header.startswith(b'OggS'):
+            audio = MutagenFile(file_path)
+            if audio is None:
+                return None
+            return _vorbis_cover(audio)
+
+        if header.startswith(b'RIFF') and header[8:12] == b'WAVE':
+            return _id3_cover(WAVE(file_path).tags)
+
+        return _id3_cover(read_id3_from_fd(fd, header))
+    except (MutagenError, OSError, ValueError):
+        # Bozuk ya da etiketsiz dosya (ID3NoHeaderError da buraya düşer)
+        return None
+    except Exception:
+        # Kapak okunamaması yükleyici iş parçacığını durdurmamalı; beklenmeyen hata yine de kaydedilir
+        LOGGER.debug("Gömülü kapak okunamadı: %s", file_path, exc_info=True)
+        return None
+    finally:
+        os.close(fd)
+
+
+class FolderCoverLookup:
+    """Parçanın klasöründeki cover.jpg / folder.jpg gibi kapak dosyalarını bulur.
+
+    Her klasör oturum boyunca en fazla bir kez taranır; sonuç (bulunamadıysa None)
+    hatırlanır. Birden çok iş parçacığından kullanılabilir.
+    """
+
+    def __init__(self):
+        self._covers = {}
+        self._lock = threading.Lock()
+
+    def find(self, directory):
+        with self._lock:
+            if directory in self._covers:
+                return self._covers[directory]
+
+        candidates = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    stem, extension = os.path.splitext(entry.name.lower())
+                    if stem in FOLDER_COVER_NAMES and extension in FOLDER_COVER_EXTENSIONS:
+                        candidates[(FOLDER_COVER_NAMES.index(stem), FOLDER_COVER_EXTENSIONS.index(extension))] = entry.path
+        except OSError:
+            pass
+        cover_path = candidates[min(candidates)] if candidates else None
+
+        with self._lock:
+            self._covers[directory] = cover_path
+        return cover_path
+
+    def read(self, file_path):
+        """Parçanın klasöründeki kapak dosyasının baytlarını döndürür; yoksa None."""
+        cover_path = self.find(os.path.dirname(file_path))
+        if cover_path is None:
+            return None
+        try:
+            with open(cover_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+
+def decode_scaled_cover(image_data, target_size):
+    """Kapak resmini hedef boyuta sığacak şekilde, çözme sırasında küçülterek okur.
+
+    Hedef boyut okuyucuya baştan verildiği için JPEG kapaklar libjpeg'in DCT
+    ölçeklemesiyle doğrudan küçük çözülür; tam çözünürlüklü resim bellekte oluşmaz.
+    """
+    byte_array = QByteArray(image_data)
+    buffer = QBuffer(byte_array)
+    if not buffer.open(QIODevice.ReadOnly):
+        return QImage()
+    reader = QImageReader(buffer)
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if source_size.isValid() and (source_size.width() > target_size.width() or source_size.height() > target_size.height()):
+        reader.setScaledSize(source_size.scaled(target_size, Qt.KeepAspectRatio))
+    image = reader.read()
+    buffer.close()
+    # Boyutunu önceden bildirmeyen biçimler için son ölçekleme
+    if not image.isNull() and (image.width() > target_size.width() or image.height() > target_size.height()):
+        image = image.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return image
+
+
+class AlbumArtCache:
+    """Ekrana hazır, ölçeklenmiş kapakları bellekte tutan bayt bütçeli LRU önbellek.
+
+    Anahtar (yol, boyut) ikilisidir ve kaydedildiği andaki mtime ile birlikte kapak
+    içeriğinin hash'ine eşlenir. Aynı albümün parçaları aynı kapağı paylaştığı için
+    resim yalnızca bir kez saklanır. Kapağı olmayan parçalar da hatırlanır. Her kayıt
+    mtime'ının en son ne zaman denetlendiğini de tutar.
+    """
+
+    def __init__(self, max_bytes=ALBUM_ART_CACHE_BYTES, max_keys=ALBUM_ART_CACHE_KEYS):
+        self.max_bytes = max_bytes
+        self.max_keys = max_keys
+        self.hits = 0
+        self.misses = 0
+        self._keys = OrderedDict()   # (yol, boyut) -> (mtime_ns, içerik hash'i; kapak yoksa "", denetim zamanı)
+        self._pixmaps = OrderedDict() # içerik hash'i -> QPixmap
+        self._bytes = 0
+
+    def get(self, file_path, size):
+        """(mtime_ns, QPixmap, denetlenmeli) döndürür; kapaksız parçalar için boş QPixmap, kayıt yoksa None.
+
+        Kaydın mtime'ı son ALBUM_ART_REVALIDATE_SECONDS içinde denetlendiyse üçüncü
+        değer False'tur ve dosyaya hiç dokunulmamalıdır. True döndüğünde denetim
+        zamanı şimdiye çekilir; denetimi çağıran başlatır.
+        """
+        key = (file_path, size.width(), size.height())
+        entry = self._keys.get(key)
+        if entry is not None:
+            mtime_ns, content_hash, checked_at = entry
+            pixmap = self._pixmaps.get(content_hash) if content_hash else QPixmap()
+            if pixmap is not None:
+                now = time.monotonic()
+                revalidate = now - checked_at >= ALBUM_ART_REVALIDATE_SECONDS
+                if revalidate:
+                    self._keys[key] = (mtime_ns, content_hash, now)
+                self._keys.move_to_end(key)
+                if content_hash:
+                    self._pixmaps.move_to_end(content_hash)
+                self.hits += 1
+                return mtime_ns, pixmap, revalidate
+            # Resim bütçe nedeniyle atılmış
+            del self._keys[key]
+        self.misses += 1
+        return None
+
+    def get_by_hash(self, content_hash):
+        """İçerik hash'i bilinen bir kapağı döndürür; bellekte yoksa None."""
+        pixmap = self._pixmaps.get(content_hash)
+        if pixmap is None:
+            return None
+        self._pixmaps.move_to_end(content_hash)
+        self.hits += 1
+        return pixmap
+
+    def put(self, file_path, size, mtime_ns, content_hash, image):
+        """Kapağı önbelleğe ekler ve gösterilecek QPixmap'i döndürür."""
+        key = (file_path, size.width(), size.height())
+        self._keys[key] = (mtime_ns, content_hash, time.monotonic())
+        self._keys.move_to_end(key)
+        while len(self._keys) > self.max_keys:
+            self._keys.popitem(last=False)
+
+        if not content_hash:
+            return QPixmap()
+        pixmap = self._pixmaps.get(content_hash)
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(image)
+            self._pixmaps[content_hash] = pixmap
+            self._bytes += self._pixmap_bytes(pixmap)
+            self._evict()
+        else:
+            self._pixmaps.move_to_end(content_hash)
+        return pixmap
+
+    def clear(self):
+        self._keys.clear()
+        self._pixmaps.clear()
+        self._bytes = 0
+
+    def set_max_bytes(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and len(self._pixmaps) > 1:
+            _, pixmap = self._pixmaps.popitem(last=False)
+            self._bytes -= self._pixmap_bytes(pixmap)
+
+    @staticmethod
+    def _pixmap_bytes(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+class CoverDiskCache:
+    """Ölçeklenmiş kapak küçük resimlerini yeniden başlatmalar arasında diskte saklar.
+
+    Küçük resimler kapak içeriğinin hash'i ve boyutuyla adlandırılır; aynı kapağı
+    paylaşan parçalar tek dosyayı kullanır. Her ses dosyası için ids/ altında,
+    dosya kimliğinden (yol, boyut, mtime_ns) türetilmiş adla içerik hash'ini
+    tutan küçük bir kayıt bulunur; dosya değişince kimlik de değiştiği için eski
+    kayıt kendiliğinden geçersiz kalır. Toplam boyut max_bytes'ı aşınca en uzun
+    süredir kullanılmayan dosyalar silinir. Birden çok iş parçacığından kullanılabilir.
+    """
+
+    def __init__(self, directory, max_bytes=COVER_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.ids_directory = os.path.join(directory, "ids")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = None
+        try:
+            os.makedirs(self.ids_directory, exist_ok=True)
+            self.available = True
+        except OSError:
+            self.available = False
+
+    def _record_path(self, file_path, stat_result, size):
+        identity = f"{file_path}\0{stat_result.st_size}\0{stat_result.st_mtime_ns}\0{size.width()}x{size.height()}"
+        digest = hashlib.sha1(identity.encode('utf-8', 'surrogateescape')).hexdigest()
+        return os.path.join(self.ids_directory, digest)
+
+    def _thumbnail_path(self, content_hash, size):
+        return os.path.join(self.directory, f"{content_hash}-{size.width()}x{size.height()}.png")
+
+    def lookup(self, file_path, stat_result, size):
+        """(içerik hash'i, QImage) döndürür; kapaksız parçalar için ("", boş QImage), kayıt yoksa None."""
+        if not self.available:
+            return None
+        record_path = self._record_path(file_path, stat_result, size)
+        try:
+            with open(record_path, 'r', encoding='ascii') as f:
+                content_hash = f.read().strip()
+            os.utime(record_path)
+        except (OSError, ValueError):
+            return None
+        if not content_hash:
+            return "", QImage()
+
+        thumbnail_path = self._thumbnail_path(content_hash, size)
+        image = QImage(thumbnail_path)
+        if image.isNull():
+            return None
+        try:
+            os.utime(thumbnail_path)
+        except OSError:
+            pass
+        return content_hash, image
+
+    def store(self, file_path, stat_result, size, content_hash, image):
+        if not self.available:
+            return
+        added_bytes = 0
+        try:
+            if content_hash:
+                thumbnail_path = self._thumbnail_path(content_hash, size)
+                if not os.path.exists(thumbnail_path):
+                    temp_path = f"{thumbnail_path}.{threading.get_ident()}.tmp"
+                    if image.save(temp_path, "PNG"):
+                        os.replace(temp_path, thumbnail_path)
+                        added_bytes += os.path.getsize(thumbnail_path)
+
+            record_path = self._record_path(file_path, stat_result, size)
+            temp_path = f"{record_path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'w', encoding='ascii') as f:
+                f.write(content_hash)
+            os.replace(temp_path, record_path)
+            added_bytes += len(content_hash)
+        except OSError:
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_bytes += added_bytes
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        for directory in (self.directory, self.ids_directory):
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False):
+                            stat_result = entry.stat(follow_symlinks=False)
+                            yield entry.path, stat_result.st_size, stat_result.st_mtime_ns
+            except OSError:
+                continue
+
+    def _evict(self):
+        # En eski kullanılan dosyalardan başlayarak bütçenin %90'ına inene kadar sil
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 9 // 10
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._total_bytes = total
+
+
+class _AlbumArtSignals(QObject):
+    # İstek numarası, dosya yolu, mtime_ns, kapak içerik hash'i, ölçeklenmiş kapak (kapak yoksa boş QImage)
+    art_loaded = pyqtSignal(int, str, object, str, QImage)
+    # İstek numarası, dosya yolu, "Sanatçı - Başlık"
+    title_loaded = pyqtSignal(int, str, str)
+
+
+class _TrackTitleTask(QRunnable):
+    """Çalan parçanın başlığını yalnızca etiket bölgesini okuyarak çıkarır."""
+
+    def __init__(self, loader, request_id, file_path):
+        super().__init__()
+        self.loader = loader
+        self.request_id = request_id
+        self.file_path = file_path
+
+    def run(self):
+        if self.loader.is_stale(self.request_id):
+            return
+        title = format_track_title(read_basic_tags(self.file_path), self.file_path)
+        if not self.loader.is_stale(self.request_id):
+            self.loader.signals.title_loaded.emit(self.request_id, self.file_path, title)
+
+
+class _AlbumArtTask(QRunnable):
+    """Etiket okuma, resim çözme ve ölçekleme işlerini iş parçacığı havuzunda yapar."""
+
+    def __init__(self, loader, request_id, file_path, cached_mtime_ns=None):
+        super().__init__()
+        self.loader = loader
+        self.request_id = request_id
+        self.file_path = file_path
+        self.cached_mtime_ns = cached_mtime_ns
+
+    def run(self):
+        if self.loader.is_stale(self.request_id):
+            return
+        try:
+            stat_result = os.stat(self.file_path)
+            mtime_ns = stat_result.st_mtime_ns
+        except OSError:
+            stat_result = None
+            mtime_ns = None
+        # Önbellekteki kapak hâlâ geçerliyse yapılacak bir şey yok
+        if self.cached_mtime_ns is not None and mtime_ns == self.cached_mtime_ns:
+            return
+
+        # Ses dosyasını açmadan önce diskteki küçük resim önbelleğine bak
+        disk_cache = self.loader.disk_cache
+        if stat_result is not None:
+            cached = disk_cache.lookup(self.file_path, stat_result, self.loader.size)
+            if cached is not None:
+                content_hash, image = cached
+                if not self.loader.is_stale(self.request_id):
+                    self.loader.signals.art_loaded.emit(self.request_id, self.file_path, mtime_ns, content_hash, image)
+                return
+
+        image_data = read_embedded_cover(self.file_path) or self.loader.folder_covers.read(self.file_path)
+
+        image = QImage()
+        content_hash = ""
+        # Bu arada parça yeniden değiştiyse resmi çözmeye gerek yok
+        if image_data and not self.loader.is_stale(self.request_id):
+            image = decode_scaled_cover(image_data, self.loader.size)
+            if not image.isNull():
+                content_hash = hashlib.sha1(image_data).hexdigest()
+        elif image_data:
+            return
+
+        if stat_result is not None:
+            disk_cache.store(self.file_path, stat_result, self.loader.size, content_hash, image)
+        if not self.loader.is_stale(self.request_id):
+            self.loader.signals.art_loaded.emit(self.request_id, self.file_path, mtime_ns, content_hash, image)
+
+
+class AlbumArtLoader(QObject):
+    """Albüm kapaklarını önbellekten ya da arayüz iş parçacığı dışında yükler; yalnızca son isteğin sonucunu iletir.
+
+    Önbellekte bulunan kapak hiç disk erişimi olmadan hemen gösterilir; dosyanın
+    değişip değişmediği en fazla ALBUM_ART_REVALIDATE_SECONDS'da bir, arka planda
+    denetlenir. Aynı albümdeki parçalar arasında geçişte disk erişimi olmaz.
+    """
+    art_ready = pyqtSignal(str, QPixmap)
+    title_ready = pyqtSignal(str, str)
+    # Önceden hazırlama isteklerinin numarası; bunlar iptal edilmez ve sonuçları gösterilmez
+    PREFETCH_REQUEST_ID = -1
+
+    def __init__(self, size, parent=None):
+        super().__init__(parent)
+        self.size = size
+        self.cache = AlbumArtCache()
+        self.disk_cache = CoverDiskCache(COVER_CACHE_DIR)
+        self.folder_covers = FolderCoverLookup()
+        self._request_id = 0
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(ALBUM_ART_THREADS)
+        self.signals = _AlbumArtSignals(self)
+        self.signals.art_loaded.connect(self._deliver)
+        self.signals.title_loaded.connect(self._deliver_title)
+
+    def request(self, file_path, metadata=None):
+        """Parçanın kapağını ve başlığını ister.
+
+        metadata dizinleyiciden gelen TrackMetadata'dır; verilirse başlık için dosya
+        açılmaz, gömülü kapağı bellekte olan parçalar için de hiç iş başlatılmaz.
+        """
+        self._request_id += 1
+        if metadata is None:
+            self._pool.start(_TrackTitleTask(self, self._request_id, file_path))
+        else:
+            self.title_ready.emit(file_path, format_track_title(metadata._asdict(), file_path))
+            pixmap = self.cache.get_by_hash(metadata.cover_hash) if metadata.cover_hash else None
+            if pixmap is not None:
+                self.art_ready.emit(file_path, pixmap)
+                return
+        cached = self.cache.get(file_path, self.size)
+        if cached is not None:
+            mtime_ns, pixmap, revalidate = cached
+            self.art_ready.emit(file_path, pixmap)
+            if revalidate:
+                self._pool.start(_AlbumArtTask(self, self._request_id, file_path, mtime_ns))
+        else:
+            self._pool.start(_AlbumArtTask(self, self._request_id, file_path))
+
+    def prefetch(self, file_path, metadata=None):
+        """Kapağı göstermeden bellek ve disk önbelleğine yükletir."""
+        if metadata is not None and metadata.cover_hash and self.cache.get_by_hash(metadata.cover_hash) is not None:
+            return
+        cached = self.cache.get(file_path, self.size)
+        if cached is not None and not cached[2]:
+            return
+        self._pool.start(_AlbumArtTask(self, self.PREFETCH_REQUEST_ID, file_path,
+                                       cached[0] if cached is not None else None))
+
+    def cancel(self):
+        """Bekleyen ve süren istekleri geçersiz kılar."""
+        self._request_id += 1
+        self._pool.clear()
+
+    def is_stale(self, request_id):
+        return request_id != self._request_id and request_id != self.PREFETCH_REQUEST_ID
+
+    def _deliver(self, request_id, file_path, mtime_ns, content_hash, image):
+        pixmap = self.cache.put(file_path, self.size, mtime_ns, content_hash, image)
+        if request_id == self._request_id:
+            self.art_ready.emit(file_path, pixmap)
+
+    def _deliver_title(self, request_id, file_path, title):
+        if not self.is_stale(request_id):
+            self.title_ready.emit(file_path, title)
+
+
+# --- Parça Bilgisi Dizini ---
+def _vorbis_text(tags, key):
+    values = tags.get(key)
+    if not values:
+        return None
+    return str(values[0]).strip() or None
+
+
+def read_track_metadata(file_path):
+    """Parçanın etiketlerini, süresini, kodlama parametrelerini ve kapak hash'ini tek bir açılışta okur."""
+    try:
+        audio = MutagenFile(file_path)
+    except Exception:
+        audio = None
+    if audio is None:
+        return EMPTY_TRACK_METADATA
+
+    artist = title = album = cover = None
+    tags = audio.tags
+    try:
+        if isinstance(tags, ID3):
+            artist, title, album = (id3_text(tags, frame_id) for frame_id in ('TPE1', 'TIT2', 'TALB'))
+            cover = _id3_cover(tags)
+        elif tags is not None:
+            artist, title, album = (_vorbis_text(tags, key) for key in ('artist', 'title', 'album'))
+            cover = _vorbis_cover(audio)
+    except Exception:
+        pass
+
+    info = audio.info
+    return TrackMetadata(
+        artist, title, album,
+        getattr(info, 'length', None) or None,
+        type(audio).__name__.lower(),
+        getattr(info, 'sample_rate', None),
+        getattr(info, 'channels', None),
+        getattr(info, 'bitrate', None),
+        getattr(info, 'bits_per_sample', None),
+        hashlib.sha1(cover).hexdigest() if cover else "")
+
+
+def file_content_hash(file_path, size):
+    """Dosyanın boyutu ile baş ve son METADATA_HASH_CHUNK baytından bir içerik hash'i üretir."""
+    digest = hashlib.sha1(str(size).encode('ascii'))
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        digest.update(os.pread(fd, METADATA_HASH_CHUNK, 0))
+        if size > METADATA_HASH_CHUNK:
+            digest.update(os.pread(fd, METADATA_HASH_CHUNK, max(size - METADATA_HASH_CHUNK, METADATA_HASH_CHUNK)))
+    finally:
+        os.close(fd)
+    return digest.hexdigest()
+
+
+def read_track_record(file_path, size, content_hash=None):
+    """Dizinleyicinin süreç havuzunda çalışır; (TrackMetadata, içerik hash'i) döndürür."""
+    metadata = read_track_metadata(file_path)
+    if content_hash is None:
+        try:
+            content_hash = file_content_hash(file_path, size)
+        except OSError:
+            content_hash = ""
+    return metadata, content_hash
+
+
+def format_duration(seconds):
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def format_total_duration(seconds):
+    """Liste toplamları için süreyi s:dd:ss (bir saatten kısaysa d:ss) biçiminde yazar."""
+    hours, rest = divmod(int(round(seconds)), 3600)
+    if hours:
+        return f"{hours}:{rest // 60:02d}:{rest % 60:02d}"
+    return format_duration(rest)
+
+
+def format_playlist_entry(metadata, file_name):
+    """Listede gösterilecek "Sanatçı – Başlık [d:ss]" metnini üretir; başlık yoksa dosya adı kullanılır."""
+    if metadata.title:
+        text = f"{metadata.artist} – {metadata.title}" if metadata.artist else metadata.title
+    else:
+        text = file_name
+    if metadata.duration:
+        text += f" [{format_duration(metadata.duration)}]"
+    return text
+
+
+class MetadataCache:
+    """Parça bilgilerini dosya kimliğiyle (aygıt, inode, boyut, mtime_ns) saklayan SQLite önbelleği.
+
+    Geçerlilik denetimi yalnızca bir stat çağrısıdır; ses dosyası açılmaz.
+    Yolu değişmiş ama kimliği aynı kalan dosyalar (taşıma, yeniden adlandırma)
+    ve kimliği değişmiş ama içeriği aynı kalan dosyalar (başka diske kopyalama,
+    yalnızca mtime'ı değişen dosya) eski kaydı kullanır; ikincisi için aynı
+    boyutta bir kayıt varsa dosyanın baş ve sonundan bir içerik hash'i alınır.
+    Yalnızca dizinleyici iş parçacığından kullanılır.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS track_metadata (
+            path BLOB PRIMARY KEY,
+            dev INTEGER NOT NULL,
+            inode INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            content_hash TEXT NOT NULL,
+            artist TEXT,
+            title TEXT,
+            album TEXT,
+            duration REAL,
+            codec TEXT,
+            sample_rate INTEGER,
+            channels INTEGER,
+            bitrate INTEGER,
+            bits_per_sample INTEGER,
+            cover_hash TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS track_metadata_identity ON track_metadata (dev, inode, size, mtime_ns);
+        CREATE INDEX IF NOT EXISTS track_metadata_content ON track_metadata (size, content_hash);
+    """
+    COLUMNS = "artist, title, album, duration, codec, sample_rate, channels, bitrate, bits_per_sample, cover_hash"
+
+    def __init__(self, db_path):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+    @staticmethod
+    def _identity(stat_result):
+        return (stat_result.st_dev, stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns)
+
+    def lookup(self, file_path, stat_result):
+        """(TrackMetadata ya da None, içerik hash'i ya da None) döndürür.
+
+        Kayıt yol dışında bir anahtarla bulunduysa ikinci değer kaydın yeni yola
+        taşınması için kullanılacak içerik hash'idir.
+        """
+        identity = self._identity(stat_result)
+        encoded_path = os.fsencode(file_path)
+        row = self._conn.execute(
+            f"SELECT dev, inode, size, mtime_ns, {self.COLUMNS} FROM track_metadata WHERE path = ?",
+            (encoded_path,)).fetchone()
+        if row is not None and tuple(row[:4]) == identity:
+            return TrackMetadata(*row[4:]), None
+
+        row = self._conn.execute(
+            f"SELECT content_hash, {self.COLUMNS} FROM track_metadata "
+            "WHERE dev = ? AND inode = ? AND size = ? AND mtime_ns = ? LIMIT 1", identity).fetchone()
+        if row is not None:
+            return TrackMetadata(*row[1:]), row[0]
+
+        # İçerik hash'i yalnızca aynı boyutta bir kayıt varsa hesaplanır
+        if self._conn.execute("SELECT 1 FROM track_metadata WHERE size = ? LIMIT 1",
+                              (stat_result.st_size,)).fetchone() is None:
+            return None, None
+        try:
+            content_hash = file_content_hash(file_path, stat_result.st_size)
+        except OSError:
+            return None, None
+        row = self._conn.execute(
+            f"SELECT {self.COLUMNS} FROM track_metadata WHERE size = ? AND content_hash = ? LIMIT 1",
+            (stat_result.st_size, content_hash)).fetchone()
+        return (TrackMetadata(*row) if row is not None else None), content_hash
+
+    def store(self, entries):
+        """(yol, stat, içerik hash'i, TrackMetadata) dörtlülerini tek bir transaction içinde yazar."""
+        if not entries:
+            return
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO track_metadata (path, dev, inode, size, mtime_ns, content_hash, {self.COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(os.fsencode(file_path),) + self._identity(stat_result) + (content_hash,) + tuple(metadata)
+                 for file_path, stat_result, content_hash, metadata in entries])
+
+    def close(self):
+        self._conn.close()
+
+
+class MetadataIndexer(QThread):
+    """Çalma listesindeki parçaların etiketlerini ve sürelerini arka planda okur.
+
+    İşler bir öncelik kuyruğunda tutulur: ekranda görünen satırlar her kaydırmada
+    öne alınır, kalan parçalar eklenme sırasıyla okunur. Önbellekte olmayan
+    parçalar bir süreç havuzunda paralel okunur. Sonuçlar toplu olarak bildirilir
+    ve diskteki önbelleğe yazılır. Okunan yollar burada tutulmaz; bilgisi gelmiş
+    parçaları (TrackStore.is_indexed) kuyruğa almamak çağıranın işidir.
+    """
+    # Yol -> TrackMetadata
+    metadata_ready = pyqtSignal(dict)
+
+    def __init__(self, cache_path, parent=None):
+        super().__init__(parent)
+        self.cache_path = cache_path
+        self._condition = threading.Condition()
+        self._heap = []
+        self._priorities = {}
+        self._sequence = 0
+        self._generation = 0
+        self._cache_errors = 0
+
+    def enqueue(self, file_paths):
+        """Parçaları arka plan önceliğiyle kuyruğa ekler."""
+        with self._condition:
+            self._push(file_paths, 0)
+
+    def prioritize(self, file_paths):
+        """Ekrandaki parçaları kuyruğun önüne alır; en son görünenler en önce okunur."""
+        with self._condition:
+            self._generation += 1
+            self._push(file_paths, -self._generation)
+
+    def _push(self, file_paths, priority):
+        for file_path in file_paths:
+            current = self._priorities.get(file_path)
+            if current is not None and current <= priority:
+                continue
+            self._priorities[file_path] = priority
+            self._sequence += 1
+            heapq.heappush(self._heap, (priority, self._sequence, file_path))
+        self._condition.notify()
+
+    def stop(self):
+        self.requestInterruption()
+        with self._condition:
+            self._condition.notify()
+        self.wait()
+
+    def _next_path(self, timeout):
+        with self._condition:
+            if not self._heap and not self.isInterruptionRequested():
+                self._condition.wait(timeout)
+            while self._heap:
+                priority, _, file_path = heapq.heappop(self._heap)
+                # Öne alınan parçaların eski kuyruk kayıtları atlanır
+                if self._priorities.get(file_path) == priority:
+                    del self._priorities[file_path]
+                    return file_path
+        return None
+
+    def run(self):
+        try:
+            cache = MetadataCache(self.cache_path)
+        except (OSError, sqlite3.Error):
+            cache = None
+        # Süreçler ancak önbellekte olmayan ilk parçada başlatılır
+        try:
+            executor = ProcessPoolExecutor(max_workers=METADATA_WORKERS,
+                                           mp_context=multiprocessing.get_context('spawn'))
+        except (OSError, ValueError):
+            executor = None
+
+        results = {}
+        new_entries = []
+        in_flight = {} # future -> (yol, stat)
+        last_report = time.monotonic()
+        while not self.isInterruptionRequested():
+            file_path = None
+            if len(in_flight) < METADATA_MAX_IN_FLIGHT:
+                if in_flight:
+                    timeout = 0
+                elif results:
+                    timeout = METADATA_REPORT_INTERVAL
+                else:
+                    timeout = None
+                file_path = self._next_path(timeout)
+
+            if file_path is not None:
+                try:
+                    stat_result = os.stat(file_path)
+                except OSError:
+                    stat_result = None
+                if stat_result is not None:
+                    metadata, content_hash = self._cache_lookup(cache, file_path, stat_result)
+                    if metadata is not None:
+                        if content_hash is not None:
+                            # Yolu ya da kimliği değişmiş kayıt yeni anahtarıyla yeniden yazılır
+                            new_entries.append((file_path, stat_result, content_hash, metadata))
+                        results[file_path] = metadata
+                    elif executor is not None:
+                        future = executor.submit(read_track_record, file_path, stat_result.st_size, content_hash)
+                        in_flight[future] = (file_path, stat_result)
+                    else:
+                        metadata, content_hash = read_track_record(file_path, stat_result.st_size, content_hash)
+                        new_entries.append((file_path, stat_result, content_hash, metadata))
+                        results[file_path] = metadata
+            elif in_flight:
+                wait_futures(list(in_flight), timeout=METADATA_REPORT_INTERVAL, return_when=FIRST_COMPLETED)
+
+            for future in [future for future in in_flight if future.done()]:
+                file_path, stat_result = in_flight.pop(future)
+                try:
+                    metadata, content_hash = future.result()
+                except BrokenProcessPool:
+                    # Süreç havuzu çöktüyse kalan okumalar bu iş parçacığında yapılır
+                    executor = None
+                    metadata, content_hash = read_track_record(file_path, stat_result.st_size, None)
+                except Exception:
+                    metadata, content_hash = EMPTY_TRACK_METADATA, ""
+                new_entries.append((file_path, stat_result, content_hash, metadata))
+                results[file_path] = metadata
+
+            now = time.monotonic()
+            if results and (file_path is None or len(results) >= METADATA_REPORT_BATCH
+                            or now - last_report >= METADATA_REPORT_INTERVAL):
+                self.metadata_ready.emit(results)
+                results = {}
+                last_report = now
+                self._cache_store(cache, new_entries)
+                new_entries = []
+
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if cache is not None:
+            self._cache_store(cache, new_entries)
+            cache.close()
+
+    # Önbellek hataları (kilitli ya da bozuk veritabanı) dizinlemeyi durdurmaz: arama başarısızsa
+    # dosya önbelleksiz okunur, yazılamayan kayıt atlanır. Her oturumda ilk hata uyarı olarak yazılır.
+    def _cache_error(self, message, file_path):
+        self._cache_errors += 1
+        level = logging.WARNING if self._cache_errors == 1 else logging.DEBUG
+        LOGGER.log(level, message, file_path, exc_info=True)
+
+    def _cache_lookup(self, cache, file_path, stat_result):
+        if cache is None:
+            return None, None
+        try:
+            return cache.lookup(file_path, stat_result)
+        except sqlite3.Error:
+            self._cache_error("Parça bilgisi önbellekten okunamadı: %s", file_path)
+            return None, None
+
+    def _cache_store(self, cache, entries):
+        if cache is None or not entries:
+            return
+        try:
+            cache.store(entries)
+            return
+        except sqlite3.Error:
+            pass
+        # Toplu yazım başarısız oldu; yazılabilen kayıtlar kaybolmasın diye tek tek dene
+        for entry in entries:
+            try:
+                cache.store([entry])
+            except sqlite3.Error:
+                self._cache_error("Parça bilgisi önbelleğe yazılamadı: %s", entry[0])
+
+
+# --- Sonraki Parçanın Önceden Hazırlanması ---
+class _ReadaheadTask(QRunnable):
+    """Dosyanın ilk baytlarının sayfa önbelleğine okunmasını ister."""
+
+    def __init__(self, file_path, length):
+        super().__init__()
+        self.file_path = file_path
+        self.length = length
+
+    def run(self):
+        try:
+            fd = os.open(self.file_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, self.length, os.POSIX_FADV_WILLNEED)
+            else:
+                # fadvise olmayan sistemlerde baytları okumak aynı işi görür
+                offset = 0
+                while offset < self.length:
+                    chunk = os.pread(fd, min(PREFETCH_READ_CHUNK, self.length - offset), offset)
+                    if not chunk:
+                        break
+                    offset += len(chunk)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+class TrackPrefetcher(QObject):
+    """Bir parça çalarken sıradaki parçanın kapağını, etiketlerini ve ilk baytlarını hazırlar.
+
+    Sıradaki parça QMediaPlaylist.nextIndex(1) ile bulunur; böylece sıralı, döngü
+    ve karışık çalma sırası (Qt'nin ezberlediği rastgele sıra dahil) izlenir.
+    Çalan parçanın açılışıyla yarışmamak için iş PREFETCH_DELAY_MS sonra başlar.
+    """
+
+    def __init__(self, media_playlist, playlist_model, album_art_loader, metadata_indexer, parent=None):
+        super().__init__(parent)
+        self.media_playlist = media_playlist
+        self.playlist_model = playlist_model
+        self.album_art_loader = album_art_loader
+        self.metadata_indexer = metadata_indexer
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(PREFETCH_DELAY_MS)
+        self._timer.timeout.connect(self._prefetch_next)
+        self._last_path = None
+
+    def schedule(self, *args):
+        """Sıradaki parça değişmiş olabilir; hazırlığı yeniden zamanlar."""
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+        self._pool.clear()
+
+    def _prefetch_next(self):
+        current = self.media_playlist.currentIndex()
+        next_index = self.media_playlist.nextIndex(1)
+        if next_index < 0 or next_index == current or next_index >= self.playlist_model.rowCount():
+            return
+        file_path = self.playlist_model.store.path(next_index)
+        if file_path == self._last_path:
+            return
+        self._last_path = file_path
+
+        metadata = self.playlist_model.entry_metadata(file_path)
+        if metadata is None:
+            self.metadata_indexer.prioritize([file_path])
+        self.album_art_loader.prefetch(file_path, metadata)
+        self._pool.start(_ReadaheadTask(file_path, PREFETCH_READAHEAD_BYTES))
 
 
 # --- Ana Pencere Sınıfı ---
 class MusicPlayer(QMainWindow):
+    # Veritabanı yazıcısı bir satır işlemini uygulayamadı; liste baştan yazılmalı (yazıcı iş parçacığından gelir)
+    playlist_resync_requested = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("LinAMP")
@@ -566,7 +2251,7 @@ class MusicPlayer(QMainWindow):
                 background: #000000;
             }
 
-            QListWidget {
+            QListView {
                 background-color: #3a3a3a;
                 border: 1px solid #4a4a4a;
                 color: #ffffff;
@@ -574,17 +2259,16 @@ class MusicPlayer(QMainWindow):
                 selection-color: #ffffff;
                 padding: 5px;
             }
-            QListWidget::item {
+            QListView::item {
                 background-color: #3a3a3a;
-                color: #ffffff;
             }
-            QListWidget::item:alternate {
+            QListView::item:alternate {
                 background-color: #353535;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #4a4a4a;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #555555;
                 color: #ffffff;
             }
@@ -628,7 +2312,7 @@ class MusicPlayer(QMainWindow):
         self.repeat_button.action_triggered.connect(self.on_repeat_button_action)
 
         self.album_art_label = QLabel(self)
-        self.album_art_label.setFixedSize(64, 64)
+        self.album_art_label.setFixedSize(ALBUM_ART_SIZE, ALBUM_ART_SIZE)
         self.album_art_label.setAlignment(Qt.AlignCenter)
         self.album_art_label.setWordWrap(True)
         self.album_art_label.setText("No\nAlbum\nArt") 
@@ -756,6 +2440,17 @@ class MusicPlayer(QMainWindow):
         vu_meters_vbox.addLayout(left_channel_layout)
         vu_meters_vbox.addLayout(right_channel_layout)
 
+        # Spektrum göstergesi VU metrelerin altında, onlarla aynı hizada durur (NumPy yoksa gizlenir)
+        self.spectrum_widget = SpectrumWidget()
+        spectrum_layout = QHBoxLayout()
+        spectrum_layout.setContentsMargins(0, 2, 0, 0)
+        spectrum_layout.setSpacing(0)
+        spectrum_layout.addSpacing(left_label.sizeHint().width() + 8)
+        spectrum_layout.addWidget(self.spectrum_widget)
+        spectrum_layout.addStretch(1)
+        vu_meters_vbox.addLayout(spectrum_layout)
+        self.spectrum_widget.setVisible(np is not None)
+
         mode_and_album_row_layout = QHBoxLayout()
         mode_and_album_row_layout.setContentsMargins(10, 2, 10, 2) 
         mode_and_album_row_layout.setSpacing(10)
@@ -789,14 +2484,57 @@ class MusicPlayer(QMainWindow):
         self.playlist_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.playlist_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         main_layout.addWidget(self.playlist_widget)
+        self.playlist_model = self.playlist_widget.model()
+
+        # Listenin ve seçimin toplam süresi
+        self.playlist_duration_label = QLabel()
+        self.playlist_duration_label.setFont(QFont("Arial", 8))
+        self.playlist_duration_label.setStyleSheet("color: #aaaaaa; border: none; padding: 2px 10px;")
+        self.playlist_duration_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        main_layout.addWidget(self.playlist_duration_label)
+
+        self._duration_label_timer = QTimer(self)
+        self._duration_label_timer.setSingleShot(True)
+        self._duration_label_timer.setInterval(DURATION_LABEL_DELAY_MS)
+        self._duration_label_timer.timeout.connect(self._update_duration_label)
+        self.playlist_model.durations_changed.connect(self._duration_label_timer.start)
+        self.playlist_widget.selectionModel().selectionChanged.connect(self._duration_label_timer.start)
+        self._update_duration_label()
         
-        self.playlist_widget.itemDoubleClicked.connect(self._playlist_item_double_clicked)
+        self.playlist_widget.doubleClicked.connect(self._playlist_item_double_clicked)
         
         # Sürükle-bırak sonrası medya listesini güncellemek için sinyal bağlantısı
-        self.playlist_widget.model().rowsMoved.connect(self._rebuild_media_playlist_on_move)
+        self.playlist_model.rowsMoved.connect(self._sync_media_playlist_on_move)
         
         # Yeni şarkıların eklenmesi için sinyal bağlantısı
         self.playlist_widget.files_dropped.connect(self._add_files_to_playlist)
+        self.playlist_widget.folders_dropped.connect(self._import_folders)
+
+        # Klasör içe aktarma durumu (yalnızca tarama sürerken görünür)
+        self.import_status_label = QLabel()
+        self.import_status_label.setFont(QFont("Arial", 8))
+        self.import_status_label.setStyleSheet("color: #aaaaaa; border: none;")
+
+        self.import_cancel_button = QPushButton("İptal")
+        self.import_cancel_button.setFixedSize(QSize(60, 20))
+        self.import_cancel_button.setFont(QFont("Arial", 8, QFont.Bold))
+        self.import_cancel_button.setStyleSheet(self.about_button.styleSheet())
+
+        self.import_status_widget = QWidget()
+        self.import_status_widget.setStyleSheet("border: none;")
+        import_status_layout = QHBoxLayout(self.import_status_widget)
+        import_status_layout.setContentsMargins(10, 2, 10, 2)
+        import_status_layout.addWidget(self.import_status_label)
+        import_status_layout.addStretch(1)
+        import_status_layout.addWidget(self.import_cancel_button)
+        self.import_status_widget.hide()
+        main_layout.insertWidget(main_layout.indexOf(self.playlist_widget), self.import_status_widget)
+
+        self.folder_importer = FolderImporter(self)
+        self.folder_importer.tracks_ready.connect(self._append_imported_tracks)
+        self.folder_importer.progress_changed.connect(self._update_import_progress)
+        self.folder_importer.finished.connect(self._folder_import_finished)
+        self.import_cancel_button.clicked.connect(self.folder_importer.cancel)
 
 
         # --- QMediaPlayer ve QMediaPlaylist Entegrasyonu ---
@@ -806,6 +2544,7 @@ class MusicPlayer(QMainWindow):
         self.media_player.setVolume(self.volume_slider.value())
 
         self.auto_advance_pending = False
+        self._syncing_media_playlist = False
         
         self._ignoring_position_updates = False
         self._seek_ignore_timer = QTimer(self)
@@ -813,10 +2552,31 @@ class MusicPlayer(QMainWindow):
         self._seek_ignore_timer.timeout.connect(lambda: setattr(self, '_ignoring_position_updates', False))
 
 
+        # Albüm kapakları arka planda yüklenir
+        self.album_art_loader = AlbumArtLoader(QSize(ALBUM_ART_SIZE, ALBUM_ART_SIZE), self)
+        self.album_art_loader.art_ready.connect(self._show_album_art)
+        self.album_art_loader.title_ready.connect(self._show_track_title)
+
         # --- VU Metre için QAudioProbe ---
         self.audio_probe = QAudioProbe(self)
         self.audio_probe.setSource(self.media_player)
         self.audio_probe.audioBufferProbed.connect(self._process_audio_buffer)
+        # Tamponlar biriktirilir, göstergeler sabit kare hızında güncellenir
+        self.visualization_clock = VisualizationClock(VISUALIZATION_FPS, self)
+        self.visualization_clock.frame.connect(self._show_visualization_frame)
+        # NumPy varsa tamponlar ayrı bir iş parçacığında çözümlenir
+        self.audio_analyzer = None
+        if np is not None:
+            self.audio_analyzer = AudioAnalysisWorker(self)
+            self.audio_analyzer.levels_ready.connect(self.visualization_clock.add_peaks)
+            self.audio_analyzer.spectrum_ready.connect(self.visualization_clock.add_spectrum)
+            self.audio_analyzer.start()
+        self.visualization_clock.spectrum_frame.connect(self.spectrum_widget.set_levels)
+        # Ölçüm kipi göstergelerin sağ tık menüsünden seçilir
+        self.meter_mode = METER_MODE_PEAK
+        for meter in (self.left_vu_meter, self.right_vu_meter):
+            meter.setContextMenuPolicy(Qt.CustomContextMenu)
+            meter.customContextMenuRequested.connect(self._show_meter_menu)
 
         self.volume_slider.valueChanged.connect(self.media_player.setVolume)
         self.media_player.positionChanged.connect(self.update_progress_slider_position)
@@ -833,6 +2593,38 @@ class MusicPlayer(QMainWindow):
         self.media_player.positionChanged.connect(self._update_time_display)
         self.media_player.durationChanged.connect(self._update_time_display)
 
+        # Durum kaydı: çalma listesindeki her değişiklik veritabanına satır düzeyinde yansıtılır
+        self._restoring_state = False
+        self._restore_edited = False
+        self._loading_restored_rows = False
+        self.path_validators = []
+        self.library_db = None
+        try:
+            os.makedirs(APP_DATA_DIR, exist_ok=True)
+            self.library_db = LibraryDatabase(LIBRARY_DB_PATH, DB_FILE_PATH,
+                                              resync_requested=self.playlist_resync_requested.emit)
+        except (OSError, sqlite3.Error):
+            pass
+        self.playlist_resync_requested.connect(self._persist_model_reset)
+        self.playlist_model.rowsInserted.connect(self._persist_rows_inserted)
+        self.playlist_model.rowsRemoved.connect(self._persist_rows_removed)
+        self.playlist_model.rowsMoved.connect(self._persist_rows_moved)
+        self.playlist_model.modelReset.connect(self._persist_model_reset)
+
+        # Etiketler arka planda okunur; ekrandaki satırlar önce gelir
+        self.metadata_indexer = MetadataIndexer(METADATA_CACHE_PATH, self)
+        self.metadata_indexer.metadata_ready.connect(self.playlist_model.set_entry_metadata)
+        self.playlist_model.rowsInserted.connect(self._index_rows_inserted)
+        self.playlist_widget.verticalScrollBar().valueChanged.connect(self._index_visible_rows)
+        self.metadata_indexer.start()
+
+        # Sıradaki parça çalan parça sürerken hazırlanır
+        self.track_prefetcher = TrackPrefetcher(self.media_playlist, self.playlist_model,
+                                                self.album_art_loader, self.metadata_indexer, self)
+        self.media_playlist.currentIndexChanged.connect(self.track_prefetcher.schedule)
+        self.media_playlist.playbackModeChanged.connect(self.track_prefetcher.schedule)
+        self.playlist_model.rowsMoved.connect(self.track_prefetcher.schedule)
+
         # Uygulama başlatıldığında ayarları yükle
         self.load_state()
 
@@ -848,83 +2640,129 @@ class MusicPlayer(QMainWindow):
         super().keyPressEvent(event)
 
     def _delete_selected_items(self):
-        """Seçilen öğeleri çalma listesinden ve mediaplayer'dan kaldırır."""
-        selected_items = self.playlist_widget.selectedItems()
-        if not selected_items:
+        """Seçilen öğeleri çalma listesinden ve mediaplayer'dan aralıklar halinde topluca kaldırır."""
+        selected_ranges = self.playlist_widget.selected_row_ranges()
+        if not selected_ranges:
             return
 
         # Oynatılan şarkı siliniyorsa durdur
         current_index = self.media_playlist.currentIndex()
-        
-        # Öğeleri sondan başa doğru silerek indeks kaymalarını önle
-        rows = sorted([self.playlist_widget.row(item) for item in selected_items], reverse=True)
-        
-        for row in rows:
-            if row == current_index:
-                 self.media_player.stop()
-                 current_index = -1
-            self.playlist_widget.takeItem(row)
-            self.media_playlist.removeMedia(row)
+        if any(start <= current_index <= end for start, end in selected_ranges):
+            self.media_player.stop()
 
-        self.save_state()
+        self._syncing_media_playlist = True
+        try:
+            self.playlist_model.remove_ranges(selected_ranges)
+            if self.playlist_model.rowCount() == 0:
+                self.media_playlist.clear()
+            else:
+                # Aralıkları sondan başa doğru silerek indeks kaymalarını önle
+                for start, end in reversed(selected_ranges):
+                    self.media_playlist.removeMedia(start, end)
+        finally:
+            self._syncing_media_playlist = False
+        if self.media_playlist.currentIndex() != current_index:
+            self._playlist_current_index_changed(self.media_playlist.currentIndex())
 
     def _add_files_to_playlist(self, file_paths):
         """Playlist'e dosya ekler, duplicates kontrolü yaparak."""
-        for file_path in file_paths:
-            if file_path not in [self.playlist_widget.item(i).data(Qt.UserRole) for i in range(self.playlist_widget.count())]:
-                list_item = QListWidgetItem(os.path.basename(file_path))
-                list_item.setData(Qt.UserRole, file_path) # Dosya yolunu item'a kaydet
-                self.playlist_widget.addItem(list_item)
-                self.media_playlist.addMedia(QMediaContent(QUrl.fromLocalFile(file_path)))
-        
+        self._append_tracks(file_paths)
+        self._after_tracks_added()
+
+    def _after_tracks_added(self):
         if self.media_playlist.mediaCount() > 0 and self.media_playlist.currentIndex() == -1:
             self.media_playlist.setCurrentIndex(0)
         
         if self.media_player.state() == QMediaPlayer.StoppedState and self.media_playlist.mediaCount() > 0:
             self.play_button.set_persistent_pressed(False)
             self.pause_button.stop_animation()
-        self.save_state() # Yeni playlisti kaydet
 
+    def _import_folders(self, folder_paths):
+        """Bırakılan klasörleri arka planda tarayarak çalma listesine ekler."""
+        self._update_import_progress(0)
+        self.import_status_widget.show()
+        self.folder_importer.import_folders(folder_paths)
 
-    def _rebuild_media_playlist_on_move(self, parent, start, end, destination, row):
-        """QListWidget'in güncel sırasına göre QMediaPlaylist'i yeniden oluşturur."""
-        current_media = self.media_player.currentMedia()
-        
-        # Yeniden oluşturma daha güvenli
-        self.media_playlist.clear()
-        
-        for i in range(self.playlist_widget.count()):
-            item = self.playlist_widget.item(i)
-            # Item'e önceden kaydedilen dosya yolunu al
-            file_path = item.data(Qt.UserRole)
-            if file_path and os.path.exists(file_path):
-                 self.media_playlist.addMedia(QMediaContent(QUrl.fromLocalFile(file_path)))
-
-        if current_media:
-            # Yeniden oluşturulan playlistteki eski şarkıyı bul ve çalmaya devam et
-            for i in range(self.media_playlist.mediaCount()):
-                if self.media_playlist.media(i).canonicalUrl() == current_media.canonicalUrl():
-                    self.media_playlist.setCurrentIndex(i)
-                    if self.media_player.state() == QMediaPlayer.PlayingState:
-                        self.media_player.play()
-                    break
+    def _append_imported_tracks(self, file_paths):
+        self._append_tracks(file_paths)
+        self._after_tracks_added()
 
-        self.save_state()
+    def _update_import_progress(self, found_count):
+        self.import_status_label.setText(f"Klasör taranıyor... {found_count} parça bulundu")
 
+    def _folder_import_finished(self):
+        self.import_status_widget.hide()
+        # Klasör yeniden tarandıysa (ör. sürücü yeniden bağlandı) bulunamayan parçalar geri gelmiş olabilir
+        self._revalidate_missing(self.playlist_model.store.missing_paths())
 
-    def add_to_playlist(self, file_path):
-        if file_path not in [item.data(Qt.UserRole) for item in self.playlist_widget.findItems("", Qt.MatchContains)]:
-            list_item = QListWidgetItem(os.path.basename(file_path))
-            list_item.setData(Qt.UserRole, file_path) # Dosya yolunu item'a kaydet
-            self.playlist_widget.addItem(list_item)
-            self.media_playlist.addMedia(QMediaContent(QUrl.fromLocalFile(file_path)))
+
+    def _sync_media_playlist_on_move(self, parent, start, end, destination, row):
+        """Modeldeki taşımayı QMediaPlaylist'e tek bir aralığı çıkarıp yeniden ekleyerek uygular.
+
+        Bir bloğu taşımak, atladığı komşu bloğu ters yöne taşımakla aynı sonucu verir.
+        Çalan parça taşınan bloktaysa komşu blok taşınır; çalan parçanın medyası
+        hiçbir zaman removeMedia ile çıkarılmaz, böylece çalma baştan başlamaz.
+        Çalan parça iki blokta da yoksa kısa olan taşınır.
+        """
+        count = end - start + 1
+        insert_at = row - count if row > start else row
+        current_index = self.media_playlist.currentIndex()
+
+        # Çalan parçanın taşımadan sonraki satırını hesapla
+        if start <= current_index <= end:
+            new_current_index = insert_at + (current_index - start)
+        elif end < current_index < row:
+            new_current_index = current_index - count
+        elif row <= current_index < start:
+            new_current_index = current_index + count
         else:
-            pass
+            new_current_index = current_index
+
+        # Atlanan komşu blok: aşağı taşımada [end + 1, row - 1], yukarı taşımada [row, start - 1]
+        other_start, other_end = (end + 1, row - 1) if row > end else (row, start - 1)
+        other_count = other_end - other_start + 1
+        current_in_moved = start <= current_index <= end
+        current_in_other = other_start <= current_index <= other_end
+        if current_in_moved or (not current_in_other and other_count < count):
+            # Komşu blok, taşınan bloğun önceki yerine (ters yöne) taşınır
+            insert_at = start if other_start > end else end - other_count + 1
+            start, end, count = other_start, other_end, other_count
+
+        was_playing = self.media_player.state() == QMediaPlayer.PlayingState
+        position = self.media_player.position()
+        moved_media = [self.media_playlist.media(i) for i in range(start, end + 1)]
+
+        self._syncing_media_playlist = True
+        try:
+            self.media_playlist.removeMedia(start, end)
+            self.media_playlist.insertMedia(insert_at, moved_media)
+            # Qt, çalan parçanın önündeki satırlar değişince geçerli indeksi kaydırabilir; aynı parçaya geri dön
+            if new_current_index >= 0 and self.media_playlist.currentIndex() != new_current_index:
+                self.media_playlist.setCurrentIndex(new_current_index)
+                self.media_player.setPosition(position)
+                if was_playing:
+                    self.media_player.play()
+        finally:
+            self._syncing_media_playlist = False
+
+
+    def add_to_playlist(self, file_path):
+        self._append_tracks([file_path])
+
+    def _append_tracks(self, file_paths):
+        """Yolları modele ve QMediaPlaylist'e tek seferde ekler; listede zaten olanları atlar."""
+        new_paths = self.playlist_model.append_paths(file_paths) # Dosya yollarını modele kaydet
+        if new_paths:
+            self.media_playlist.addMedia([QMediaContent(QUrl.fromLocalFile(file_path)) for file_path in new_paths])
+        return new_paths
 
     # --- QMediaPlaylist ile Senkronizasyon Metotları ---
     def _playlist_current_index_changed(self, index):
-        if index >= 0 and index < self.playlist_widget.count():
-            self.playlist_widget.setCurrentRow(index) 
+        if self._syncing_media_playlist:
+            return
+        if index >= 0 and index < self.playlist_model.rowCount():
+            self.playlist_widget.setCurrentIndex(self.playlist_model.index(index))
+            self._revalidate_row(index)
             
             current_media = self.media_playlist.media(index)
             if current_media.canonicalUrl().isLocalFile():
@@ -934,20 +2772,20 @@ class MusicPlayer(QMainWindow):
                 self._load_album_art(file_path) 
             else:
                 self.setWindowTitle("LinAMP")
-                self.album_art_label.clear() 
-                self.album_art_label.setText("No Album Art")
+                self._clear_album_art()
         else:
             self.setWindowTitle("LinAMP")
             if self.media_player.state() != QMediaPlayer.StoppedState:
                 self.media_player.stop()
-            self.album_art_label.clear() 
-            self.album_art_label.setText("No Album Art")
+            self._clear_album_art()
 
 
-    def _playlist_item_double_clicked(self, item):
-        row = self.playlist_widget.row(item)
+    def _playlist_item_double_clicked(self, model_index):
+        row = model_index.row()
         if self.media_playlist.currentIndex() != row:
             self.media_playlist.setCurrentIndex(row)
+        else:
+            self._revalidate_row(row)
         
         if self.media_player.state() != QMediaPlayer.PlayingState:
             self.media_player.play()
@@ -977,22 +2815,30 @@ class MusicPlayer(QMainWindow):
         if state == QMediaPlayer.PlayingState:
             self.play_button.set_persistent_pressed(True)
             self.pause_button.stop_animation()
+            self.visualization_clock.start()
         elif state == QMediaPlayer.PausedState:
             self.play_button.set_persistent_pressed(True)
             self.pause_button.start_animation()
+            self.visualization_clock.stop()
+            if self.audio_analyzer is not None:
+                self.audio_analyzer.reset()
+            self.spectrum_widget.reset()
             self.left_vu_meter.set_level(0.0)
             self.right_vu_meter.set_level(0.0)
         elif state == QMediaPlayer.StoppedState:
             self.play_button.set_persistent_pressed(False)
             self.pause_button.stop_animation()
+            self.visualization_clock.stop()
+            if self.audio_analyzer is not None:
+                self.audio_analyzer.reset()
+            self.spectrum_widget.reset()
             self.left_vu_meter.set_level(0.0)
             self.right_vu_meter.set_level(0.0)
             self.progress_slider.setValue(0)
             self._update_time_display(0, 0) 
             if self.media_playlist.currentIndex() == -1 or self.media_playlist.mediaCount() == 0:
                  self.setWindowTitle("LinAMP")
-                 self.album_art_label.clear() 
-                 self.album_art_label.setText("No Album Art")
+                 self._clear_album_art()
 
     def on_media_player_status_changed(self, status):
         if status == QMediaPlayer.EndOfMedia:
@@ -1000,11 +2846,9 @@ class MusicPlayer(QMainWindow):
         elif status == QMediaPlayer.LoadedMedia:
             pass
         elif status == QMediaPlayer.NoMedia:
-            self.album_art_label.clear()
-            self.album_art_label.setText("No Album Art")
+            self._clear_album_art()
         elif status == QMediaPlayer.InvalidMedia:
-            self.album_art_label.clear()
-            self.album_art_label.setText("No Album Art")
+            self._clear_album_art()
 
     def _update_time_display(self, position_ms=None, duration_ms=None):
         if position_ms is None:
@@ -1031,33 +2875,22 @@ class MusicPlayer(QMainWindow):
 
     # Albüm kapağını yükleme metodu
     def _load_album_art(self, file_path):
-        self.album_art_label.clear() 
-        self.album_art_label.setText("No Album Art") 
+        """Kapağı arka planda yükletir; sonuç gelene kadar mevcut kapak ekranda kalır."""
+        self.album_art_loader.request(file_path, self.playlist_model.entry_metadata(file_path))
 
-        try:
-            audio = MP3(file_path)
-            for tag_name in audio.tags.keys():
-                if tag_name.startswith('APIC'):
-                    apic_tag = audio.tags[tag_name]
-                    if isinstance(apic_tag, APIC):
-                        image_data = apic_tag.data
-                        
-                        image = QImage()
-                        if image.loadFromData(image_data):
-                            pixmap = QPixmap.fromImage(image)
-                            scaled_pixmap = pixmap.scaled(self.album_art_label.size(), 
-                                                           Qt.KeepAspectRatio, 
-                                                           Qt.SmoothTransformation)
-                            self.album_art_label.setPixmap(scaled_pixmap)
-                            self.album_art_label.setText("") 
-                            return
-                        else:
-                            break 
-        except ID3NoHeaderError:
-            pass
-        except Exception as e:
-            pass
-        
+    def _show_album_art(self, file_path, pixmap):
+        if pixmap.isNull():
+            self.album_art_label.clear()
+            self.album_art_label.setText("No Album Art")
+        else:
+            self.album_art_label.setPixmap(pixmap)
+
+    def _show_track_title(self, file_path, title):
+        self.setWindowTitle(f"LinAMP - {title}")
+
+    def _clear_album_art(self):
+        self.album_art_loader.cancel()
+        self.album_art_label.clear()
         self.album_art_label.setText("No Album Art")
 
 
@@ -1068,105 +2901,55 @@ class MusicPlayer(QMainWindow):
             self.right_vu_meter.set_level(0.0)
             return
 
-        fmt = buffer.format()
-        
-        # Desteklenen formatları kontrol et
-        if fmt.sampleType() == QAudioFormat.Float:
-            # Float format için işleme
-            data = buffer.constData().asarray(buffer.byteCount())
-            num_samples = len(data) // (fmt.sampleSize() // 8)
-            max_amplitude = 1.0
-            
-            # Float verilerini uygun şekilde işle
-            try:
-                if fmt.sampleSize() == 32:
-                    samples = struct.unpack(f'<{num_samples}f', data)
-                else:  # 64-bit float
-                    samples = struct.unpack(f'<{num_samples}d', data)
-            except struct.error:
-                return
-            
-        elif fmt.sampleType() == QAudioFormat.SignedInt:
-            # Signed int format için işleme
-            data = buffer.constData().asarray(buffer.byteCount())
-            bytes_per_sample = fmt.sampleSize() // 8
-            num_samples = len(data) // bytes_per_sample
-            
-            # Sample size'a göre uygun format seç
-            if fmt.sampleSize() == 8:
-                fmt_str = 'b'
-                max_amplitude = 127
-            elif fmt.sampleSize() == 16:
-                fmt_str = 'h'
-                max_amplitude = 32767
-            elif fmt.sampleSize() == 32:
-                fmt_str = 'i'
-                max_amplitude = 2147483647
-            else:
-                return
-            
-            try:
-                samples = struct.unpack(f'<{num_samples}{fmt_str}', data)
-            except struct.error:
-                return
-            
-        elif fmt.sampleType() == QAudioFormat.UnSignedInt:
-            # Unsigned int format için işleme
-            data = buffer.constData().asarray(buffer.byteCount())
-            bytes_per_sample = fmt.sampleSize() // 8
-            num_samples = len(data) // bytes_per_sample
-            
-            if fmt.sampleSize() == 8:
-                fmt_str = 'B'
-                max_amplitude = 255
-            elif fmt.sampleSize() == 16:
-                fmt_str = 'H'
-                max_amplitude = 65535
-            elif fmt.sampleSize() == 32:
-                fmt_str = 'I'
-                max_amplitude = 4294967295
-            else:
-                return
-            
-            try:
-                samples = struct.unpack(f'<{num_samples}{fmt_str}', data)
-            except struct.error:
-                return
-        else:
+        if self.audio_analyzer is not None:
+            self.audio_analyzer.push(buffer)
             return
+        peaks = channel_peaks(buffer)
+        if peaks is not None:
+            self.visualization_clock.add_peaks(peaks)
+
+    def _show_meter_menu(self, pos):
+        menu = QMenu(self)
+        for mode, label in METER_MODES.items():
+            action = menu.addAction(label)
+            action.setCheckable(True)
+            action.setChecked(mode == self.meter_mode)
+            # NumPy yoksa yalnızca örnek tepe kipi kullanılabilir
+            action.setEnabled(self.audio_analyzer is not None or mode == METER_MODE_PEAK)
+            action.triggered.connect(lambda checked, mode=mode: self._select_meter_mode(mode))
+        if self.audio_analyzer is not None:
+            menu.addSeparator()
+            stats = menu.addAction(f"Atılan tampon: {self.audio_analyzer.dropped} · "
+                                   f"geciken tampon: {self.audio_analyzer.late}")
+            stats.setEnabled(False)
+        menu.exec_(self.sender().mapToGlobal(pos))
+
+    def _select_meter_mode(self, mode):
+        self._apply_meter_mode(mode)
+        self.save_state()
+
+    def _apply_meter_mode(self, mode):
+        if self.audio_analyzer is None or mode not in METER_MODES:
+            mode = METER_MODE_PEAK
+        self.meter_mode = mode
+        if self.audio_analyzer is not None:
+            self.audio_analyzer.set_meter_mode(mode)
+        for meter in (self.left_vu_meter, self.right_vu_meter):
+            meter.set_db_scale(mode != METER_MODE_PEAK)
+            meter.set_level(0.0)
+
+    def _apply_spectrum_settings(self, bands, falloff):
+        bands = max(1, min(SPECTRUM_FFT_SIZE // 2, int(bands)))
+        self.spectrum_widget.set_band_count(bands)
+        self.spectrum_widget.falloff = max(0.0, float(falloff))
+        if self.audio_analyzer is not None:
+            self.audio_analyzer.set_spectrum_bands(bands)
+
+    def _show_visualization_frame(self, peaks):
+        # Mono ses için sol kanal iki göstergede de kullanılır
+        norm_left = peaks[0]
+        norm_right = peaks[1] if len(peaks) >= 2 else norm_left
 
-        # Kanal sayısına göre örnekleri işle
-        num_channels = fmt.channelCount()
-        if num_channels < 1:
-            return
-            
-        left_peak = 0
-        right_peak = 0
-        
-        # Sol kanal
-        for i in range(0, num_samples, num_channels):
-            if fmt.sampleType() == QAudioFormat.UnSignedInt:
-                # Unsigned değerleri signed'a çevir
-                value = samples[i] - (max_amplitude // 2)
-                left_peak = max(left_peak, abs(value))
-            else:
-                left_peak = max(left_peak, abs(samples[i]))
-        
-        # Sağ kanal (varsa)
-        if num_channels >= 2:
-            for i in range(1, num_samples, num_channels):
-                if fmt.sampleType() == QAudioFormat.UnSignedInt:
-                    value = samples[i] - (max_amplitude // 2)
-                    right_peak = max(right_peak, abs(value))
-                else:
-                    right_peak = max(right_peak, abs(samples[i]))
-        else:
-            right_peak = left_peak  # Mono ses için sol kanalı kullan
-        
-        # Normalize et ve güncelle
-        norm_left = left_peak / (max_amplitude if fmt.sampleType() != QAudioFormat.Float else 1.0)
-        norm_right = right_peak / (max_amplitude if fmt.sampleType() != QAudioFormat.Float else 1.0)
-        
         self.left_vu_meter.set_level(norm_left)
         self.right_vu_meter.set_level(norm_right)
 
@@ -1244,85 +3027,215 @@ class MusicPlayer(QMainWindow):
         self.save_state()
 
     def load_state(self):
-        """Uygulama ayarlarını ve çalma listesini bir JSON dosyasından yükler."""
-        # Klasör ve dosyanın varlığını program başlar başlamaz kontrol et ve oluştur
-        if not os.path.exists(APP_DATA_DIR):
-            try:
-                os.makedirs(APP_DATA_DIR)
-            except OSError:
-                return
+        """Ayarları ve çalma listesinin ilk sayfasını veritabanından yükler; kalan satırlar pencere açıldıktan sonra gelir."""
+        if self.library_db is None:
+            return
 
-        if not os.path.exists(DB_FILE_PATH):
-            try:
-                with open(DB_FILE_PATH, 'w', encoding='utf-8') as f:
-                    json.dump({}, f)
-            except IOError:
-                return
+        state = self.library_db.load_settings()
 
-        try:
-            with open(DB_FILE_PATH, 'r', encoding='utf-8') as f:
-                state = json.load(f)
+        self.album_art_loader.cache.set_max_bytes(state.get('album_art_cache_bytes', ALBUM_ART_CACHE_BYTES))
+        self.visualization_clock.set_fps(state.get('visualization_fps', VISUALIZATION_FPS))
+        self._apply_meter_mode(state.get('meter_mode', METER_MODE_PEAK))
+        self._apply_spectrum_settings(state.get('spectrum_bands', SPECTRUM_BANDS),
+                                      state.get('spectrum_falloff', SPECTRUM_FALLOFF))
 
-            volume = state.get('volume', 25)
-            self.volume_slider.setValue(volume)
-            self.media_player.setVolume(volume)
+        volume = state.get('volume', 25)
+        self.volume_slider.setValue(volume)
+        self.media_player.setVolume(volume)
 
-            shuffle_mode = state.get('shuffle_mode', False)
-            repeat_mode = state.get('repeat_mode', False)
-            
-            self.shuffle_button.is_active = shuffle_mode
-            self.repeat_button.is_active = repeat_mode
-            
-            if shuffle_mode:
-                self.media_playlist.setPlaybackMode(QMediaPlaylist.Random)
-            elif repeat_mode:
-                self.media_playlist.setPlaybackMode(QMediaPlaylist.Loop)
-            else:
-                self.media_playlist.setPlaybackMode(QMediaPlaylist.Sequential)
-            
-            playlist_files = state.get('playlist', [])
-            self.media_playlist.clear()
-            self.playlist_widget.clear()
-            for file_path in playlist_files:
-                if os.path.exists(file_path):
-                    list_item = QListWidgetItem(os.path.basename(file_path))
-                    list_item.setData(Qt.UserRole, file_path) # Dosya yolunu item'a kaydet
-                    self.playlist_widget.addItem(list_item)
-                    self.media_playlist.addMedia(QMediaContent(QUrl.fromLocalFile(file_path)))
-
-            if self.media_playlist.mediaCount() > 0:
-                self.media_playlist.setCurrentIndex(0)
-            
-        except (IOError, json.JSONDecodeError):
-            try:
-                 with open(DB_FILE_PATH, 'w', encoding='utf-8') as f:
-                    json.dump({}, f)
-            except IOError:
-                pass
+        shuffle_mode = state.get('shuffle_mode', False)
+        repeat_mode = state.get('repeat_mode', False)
+
+        self.shuffle_button.is_active = shuffle_mode
+        self.repeat_button.is_active = repeat_mode
+
+        if shuffle_mode:
+            self.media_playlist.setPlaybackMode(QMediaPlaylist.Random)
+        elif repeat_mode:
+            self.media_playlist.setPlaybackMode(QMediaPlaylist.Loop)
+        else:
+            self.media_playlist.setPlaybackMode(QMediaPlaylist.Sequential)
 
+        # Geri yükleme sırasında modele eklenen satırlar zaten veritabanında; tekrar yazılmaz
+        self._restoring_state = True
+        self._restore_edited = False
+        self._loading_restored_rows = True
+        self.media_playlist.clear()
+        self.playlist_model.clear()
+        first_page, last_position = self.library_db.load_playlist(limit=PLAYLIST_FIRST_PAGE_SIZE)
+        self._append_tracks(first_page)
+        self._loading_restored_rows = False
+
+        if self.media_playlist.mediaCount() > 0:
+            self.media_playlist.setCurrentIndex(0)
+
+        if len(first_page) < PLAYLIST_FIRST_PAGE_SIZE:
+            self._finish_restoring_state()
+        else:
+            QTimer.singleShot(0, lambda: self._load_remaining_playlist(last_position))
+
+    def _load_remaining_playlist(self, after):
+        """Kalan satırları her tikte bir sayfa olarak ekler; arayüz yükleme boyunca akıcı kalır."""
+        if self.library_db is None:
+            return
+        page, last_position = self.library_db.load_playlist(after, PLAYLIST_RESTORE_PAGE_SIZE)
+        self._loading_restored_rows = True
+        try:
+            self._append_tracks(page)
+        finally:
+            self._loading_restored_rows = False
+        if len(page) == PLAYLIST_RESTORE_PAGE_SIZE:
+            QTimer.singleShot(PLAYLIST_RESTORE_TICK_MS, lambda: self._load_remaining_playlist(last_position))
+            return
+        self._after_tracks_added()
+        self._finish_restoring_state()
+
+    def _finish_restoring_state(self):
+        self._restoring_state = False
+        if self._restore_edited:
+            # Yükleme sürerken yapılan değişiklikler satır satır yazılmadı; liste bir kez topluca yazılır
+            self._persist_model_reset()
+        # Dosyaların varlığı pencereyi bekletmeden arka planda denetlenir
+        if self.playlist_model.rowCount() > 0:
+            self._start_path_validator(self.playlist_model.store.snapshot().paths())
+
+    # --- Dosya varlığı denetimi ---
+    def _start_path_validator(self, file_paths, report_present=False):
+        validator = PathValidator(file_paths, self, report_present)
+        validator.missing_found.connect(self.playlist_model.mark_missing)
+        if report_present:
+            validator.present_found.connect(self._mark_present)
+        validator.finished.connect(lambda: self._path_validator_finished(validator))
+        self.path_validators.append(validator)
+        validator.start()
+
+    def _path_validator_finished(self, validator):
+        if validator in self.path_validators:
+            self.path_validators.remove(validator)
+        validator.deleteLater()
+
+    def _mark_present(self, file_paths):
+        self.playlist_model.mark_missing(file_paths, False)
+
+    def _revalidate_row(self, row):
+        """Bulunamadı işaretli satır etkinleştirilince dosyası arka planda yeniden denetlenir."""
+        store = self.playlist_model.store
+        if store.is_missing(row):
+            self._revalidate_missing([store.path(row)])
+
+    def _revalidate_missing(self, file_paths):
+        """Bulunamadı işaretli yolları yeniden denetler; yeniden bulunanların işareti kaldırılır."""
+        if file_paths:
+            self._start_path_validator(file_paths, report_present=True)
 
     def save_state(self):
-        """Uygulama ayarlarını ve çalma listesini bir JSON dosyasına kaydeder."""
-        state = {
-            'playlist': [item.data(Qt.UserRole) for item in [self.playlist_widget.item(i) for i in range(self.playlist_widget.count())] if item.data(Qt.UserRole)],
+        """Ayarları kaydetmek üzere veritabanı yazıcısına gönderir."""
+        if self.library_db is not None:
+            self.library_db.set_settings(self._settings_state())
+
+    def _settings_state(self):
+        return {
             'volume': self.volume_slider.value(),
             'shuffle_mode': self.shuffle_button.is_active,
-            'repeat_mode': self.repeat_button.is_active
+            'repeat_mode': self.repeat_button.is_active,
+            'visualization_fps': self.visualization_clock.fps,
+            'meter_mode': self.meter_mode,
+            'spectrum_bands': self.spectrum_widget.bands,
+            'spectrum_falloff': self.spectrum_widget.falloff
         }
 
-        try:
-            with open(DB_FILE_PATH, 'w', encoding='utf-8') as f:
-                json.dump(state, f, indent=4)
-        except IOError:
-            pass
+    # --- Çalma listesi değişikliklerinin veritabanına yansıtılması ---
+    def _restoring_state_blocks_persist(self):
+        """Geri yükleme sürerken satır değişiklikleri yazılmaz.
+
+        Veritabanı yükleme bitene kadar kaynak olarak kalır; kullanıcı bu sırada
+        listeyi değiştirirse bu işaretlenir ve yükleme sonunda liste topluca yazılır.
+        """
+        if not self._restoring_state:
+            return False
+        if not self._loading_restored_rows:
+            self._restore_edited = True
+        return True
+
+    def _persist_rows_inserted(self, parent, first, last):
+        if self.library_db is None or self._restoring_state_blocks_persist():
+            return
+        store = self.playlist_model.store
+        self.library_db.insert_tracks(first, [store.path(row) for row in range(first, last + 1)])
+
+    def _persist_rows_removed(self, parent, first, last):
+        if self.library_db is None or self._restoring_state_blocks_persist():
+            return
+        self.library_db.remove_rows(first, last)
+
+    def _persist_rows_moved(self, parent, start, end, destination, row):
+        if self.library_db is None or self._restoring_state_blocks_persist():
+            return
+        self.library_db.move_rows(start, end, row)
+
+    def _persist_model_reset(self):
+        if self.library_db is None or self._restoring_state_blocks_persist():
+            return
+        self.library_db.replace_playlist(self.playlist_model.store.snapshot())
+
+    def _update_duration_label(self):
+        """Liste ve seçim toplamlarını gösterir; süresi henüz okunmamış parça varsa toplamın sonuna + eklenir."""
+        store = self.playlist_model.store
+        text = self._duration_summary(store.total_duration, store.timed_count, len(store))
+        selected_ranges = self.playlist_widget.selected_row_ranges()
+        if selected_ranges:
+            text = f"Seçili: {self._duration_summary(*store.duration_of_ranges(selected_ranges))}   |   {text}"
+        self.playlist_duration_label.setText(text)
+
+    @staticmethod
+    def _duration_summary(total, timed_count, count):
+        suffix = "+" if timed_count < count else ""
+        return f"{count} parça · {format_total_duration(total)}{suffix}"
+
+    # --- Parça bilgisi dizinleme ---
+    def _index_rows_inserted(self, parent, first, last):
+        store = self.playlist_model.store
+        self.metadata_indexer.enqueue([store.path(row) for row in range(first, last + 1)])
+        self._index_visible_rows()
+
+    def _index_visible_rows(self, *args):
+        row_count = self.playlist_model.rowCount()
+        if row_count == 0:
+            return
+        viewport = self.playlist_widget.viewport()
+        first = self.playlist_widget.indexAt(QPoint(0, 0)).row()
+        last = self.playlist_widget.indexAt(QPoint(0, viewport.height() - 1)).row()
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = row_count - 1
+        store = self.playlist_model.store
+        # Bilgisi gelmiş satırlar yeniden kuyruğa alınmaz
+        paths = [store.path(row) for row in range(first, last + 1) if not store.is_indexed(row)]
+        if paths:
+            self.metadata_indexer.prioritize(paths)
 
     def closeEvent(self, event):
-        self.save_state()
+        self.folder_importer.stop()
+        self.track_prefetcher.stop()
+        self.metadata_indexer.stop()
+        self.album_art_loader.cancel()
+        for validator in list(self.path_validators):
+            validator.requestInterruption()
+            validator.wait()
+        # Son ayarları sıraya ekle ve bekleyen tüm değişikliklerin yazılmasını bekle
+        if self.library_db is not None:
+            self.save_state()
+            # Geri yükleme bitmediyse model listenin tamamını içermez; o durumda kopya verilmez
+            self.library_db.close(None if self._restoring_state else self.playlist_model.store.snapshot())
+            self.library_db = None
 
         if self.media_player.state() != QMediaPlayer.StoppedState:
             self.media_player.stop()
         
         self.audio_probe.setSource(None)
+        if self.audio_analyzer is not None:
+            self.audio_analyzer.stop()
         self.media_playlist.clear()
 
         super().closeEvent(event)
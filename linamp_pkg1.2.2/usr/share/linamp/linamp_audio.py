@@ -0,0 +1,365 @@
+"""Linamp ses örneği çözme ve analiz yardımcıları.
+
+Qt'ye bağlı değildir; tamponlar QAudioBuffer arayüzüyle (format, frameCount,
+byteCount, constData) okunur. Böylece aynı kod arayüz olmadan da sınanabilir.
+"""
+
+import math
+import sys
+import time
+from array import array
+from collections import namedtuple
+
+# NumPy isteğe bağlıdır; yoksa ses seviyeleri saf Python ile hesaplanır
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# --- Sabitler ---
+# QAudioFormat.SampleType ve QAudioFormat.Endian değerleri
+SAMPLE_SIGNED_INT = 1
+SAMPLE_UNSIGNED_INT = 2
+SAMPLE_FLOAT = 3
+BIG_ENDIAN = 0
+LITTLE_ENDIAN = 1
+
+# Ses analizi halkası: yuva sayısı, yuva başına kare ve en fazla kanal
+AUDIO_RING_SLOTS = 32
+AUDIO_RING_SLOT_FRAMES = 8192
+AUDIO_RING_MAX_CHANNELS = 8
+
+# Spektrum analizi: FFT boyu, varsayılan bant sayısı ve frekans aralığı
+SPECTRUM_FFT_SIZE = 2048
+SPECTRUM_BANDS = 20
+SPECTRUM_MIN_FREQ = 40.0
+SPECTRUM_MAX_FREQ = 16000.0
+
+
+# --- Ses Örneklerinden Seviye Hesaplama ---
+# (örnek türü, örnek başına bayt) -> (memoryview/array kodu, NumPy türü).
+# 3 baytlık örnekler sıkıştırılmış 24 bittir; 24 bitlik örnek 4 baytlık kapta da gelebilir
+# (sampleSize 24, örnek başına 4 bayt), bu durumda tam ölçek sampleSize'dan alınır.
+SAMPLE_CONTAINERS = {
+    (SAMPLE_SIGNED_INT, 1): ('b', 'i1'),
+    (SAMPLE_SIGNED_INT, 2): ('h', 'i2'),
+    (SAMPLE_SIGNED_INT, 3): ('h', 'i1'),
+    (SAMPLE_SIGNED_INT, 4): ('i', 'i4'),
+    (SAMPLE_UNSIGNED_INT, 1): ('B', 'u1'),
+    (SAMPLE_UNSIGNED_INT, 2): ('H', 'u2'),
+    (SAMPLE_UNSIGNED_INT, 3): ('H', 'u1'),
+    (SAMPLE_UNSIGNED_INT, 4): ('I', 'u4'),
+    (SAMPLE_FLOAT, 4): ('f', 'f4'),
+    (SAMPLE_FLOAT, 8): ('d', 'f8'),
+}
+
+# Tampon biçiminden çıkarılan okuma bilgisi; full_scale ve zero normalize etmek için kullanılır
+SampleLayout = namedtuple('SampleLayout', (
+    'code', 'dtype', 'sample_bytes', 'channels', 'frames', 'full_scale', 'zero', 'big_endian', 'sample_rate'))
+
+
+def sample_layout(buffer):
+    """Tamponun örnek düzenini SAMPLE_CONTAINERS tablosundan çıkarır; desteklenmeyen biçimde None."""
+    fmt = buffer.format()
+    channels = fmt.channelCount()
+    frames = buffer.frameCount()
+    if channels < 1 or frames <= 0:
+        return None
+    # Kap boyutu sampleSize'dan değil tamponun kendisinden hesaplanır (24 bit / 32 bit kap ayrımı)
+    sample_bytes = buffer.byteCount() // (frames * channels)
+    container = SAMPLE_CONTAINERS.get((fmt.sampleType(), sample_bytes))
+    if container is None:
+        return None
+
+    if fmt.sampleType() == SAMPLE_FLOAT:
+        full_scale, zero = 1.0, 0
+    else:
+        bits = min(fmt.sampleSize(), sample_bytes * 8) or sample_bytes * 8
+        full_scale = 1 << (bits - 1)
+        # İşaretsiz örneklerde sessizlik aralığın ortasıdır
+        zero = full_scale if fmt.sampleType() == SAMPLE_UNSIGNED_INT else 0
+    return SampleLayout(container[0], container[1], sample_bytes, channels, frames,
+                        full_scale, zero, fmt.byteOrder() == BIG_ENDIAN, fmt.sampleRate())
+
+
+def _buffer_view(buffer):
+    """QAudioBuffer verisini kopyalamadan okunabilir bir bellek nesnesi olarak döndürür."""
+    data = buffer.constData()
+    data.setsize(buffer.byteCount())
+    return data
+
+
+def _numpy_samples(data, layout):
+    """Veriyi (kare, kanal) biçiminde bir NumPy dizisi olarak döndürür; sıkıştırılmış 24 bit dışında kopya yapılmaz."""
+    count = layout.frames * layout.channels
+    if layout.sample_bytes == 3:
+        raw = np.frombuffer(data, dtype=np.uint8, count=count * 3).reshape(layout.frames, layout.channels, 3)
+        high, middle, low = (0, 1, 2) if layout.big_endian else (2, 1, 0)
+        # En üst bayt işaretiyle genişletilir, diğer ikisi altına eklenir
+        samples = raw[..., high].astype(layout.dtype).astype(np.int32) << 16
+        samples |= raw[..., middle].astype(np.int32) << 8
+        samples |= raw[..., low]
+    else:
+        dtype = ('>' if layout.big_endian else '<') + layout.dtype
+        samples = np.frombuffer(data, dtype=dtype, count=count).reshape(layout.frames, layout.channels)
+    return samples
+
+
+def _numpy_extremes(data, layout):
+    samples = _numpy_samples(data, layout)
+    # Kanal sütunları ayrı ayrı indirgenir; birkaç sütunlu dizide axis=0 indirgemesi yaklaşık 10 kat yavaştır
+    channels = [samples[:, channel] for channel in range(layout.channels)]
+    return [column.max().item() for column in channels], [column.min().item() for column in channels]
+
+
+def _python_extremes(data, layout):
+    count = layout.frames * layout.channels
+    view = memoryview(data)
+    scale = 1
+    if layout.sample_bytes == 3:
+        # Sıkıştırılmış 24 bitin üst iki baytı yerel bayt sırasıyla 16 bitlik örneklere dizilir
+        raw = view[:count * 3]
+        high, middle = (0, 1) if layout.big_endian else (2, 1)
+        first, second = (middle, high) if sys.byteorder == 'little' else (high, middle)
+        top = bytearray(count * 2)
+        top[0::2] = raw[first::3]
+        top[1::2] = raw[second::3]
+        samples = memoryview(top).cast(layout.code)
+        scale = 256
+    elif layout.big_endian != (sys.byteorder == 'big') and layout.sample_bytes > 1:
+        samples = array(layout.code)
+        samples.frombytes(view[:count * layout.sample_bytes])
+        samples.byteswap()
+    else:
+        samples = view[:count * layout.sample_bytes].cast(layout.code)
+    channels = layout.channels
+    highs = [max(samples[channel::channels]) * scale for channel in range(channels)]
+    lows = [min(samples[channel::channels]) * scale for channel in range(channels)]
+    return highs, lows
+
+
+def channel_peaks(buffer):
+    """Tamponun her kanalı için 0..1 aralığına ölçeklenmiş tepe değerlerini döndürür; desteklenmeyen biçimde None.
+
+    NumPy varsa veri (kare, kanal) biçiminde bir görünüme çevrilir ve kanal başına
+    en büyük/en küçük değer tek geçişte bulunur; yoksa memoryview dilimleriyle
+    aynı hesap yapılır.
+    """
+    layout = sample_layout(buffer)
+    if layout is None:
+        return None
+    extremes = _numpy_extremes if np is not None else _python_extremes
+    highs, lows = extremes(_buffer_view(buffer), layout)
+    # Tam sayılar Python tarafında karşılaştırılır; -32768 gibi değerlerde taşma olmaz
+    zero = layout.zero
+    return [max(high - zero, zero - low) / layout.full_scale for high, low in zip(highs, lows)]
+
+
+# --- Ölçüm Kipleri ---
+METER_MODE_PEAK = 'peak'
+METER_MODE_RMS = 'rms'
+METER_MODE_PPM = 'ppm'
+METER_MODE_TRUE_PEAK = 'true_peak'
+# Kip -> menüde görünen ad
+METER_MODES = {
+    METER_MODE_PEAK: "Örnek tepe (doğrusal)",
+    METER_MODE_RMS: "RMS / VU (300 ms)",
+    METER_MODE_PPM: "PPM (EBU, 10 ms / 24 dB 2,8 s)",
+    METER_MODE_TRUE_PEAK: "Gerçek tepe (4× BS.1770)",
+}
+# Logaritmik kiplerde göstergenin alt sınırı ve ölçek çizgileri (dBFS)
+METER_DB_FLOOR = -60.0
+METER_DB_TICKS = (-50, -40, -30, -20, -10, -6, -3)
+# VU: 300 ms'de son değerin %99'una ulaşan tek kutuplu integratör
+VU_TIME_CONSTANT = 0.3 / math.log(100)
+# EBU PPM (IEC 60268-10 Tip IIa): 10 ms'lik yükselme, 2,8 saniyede 24 dB düşüş
+PPM_ATTACK_SECONDS = 0.010
+PPM_DECAY_DB_PER_SECOND = 24 / 2.8
+
+# ITU-R BS.1770-4 Ek 2: 4 kat örnekleme için 48 katsayılı çok fazlı FIR süzgeç (faz başına 12)
+_TRUE_PEAK_PHASE_0 = (0.0017089843750, 0.0109863281250, -0.0196533203125, 0.0332031250000,
+                      -0.0594482421875, 0.1373291015625, 0.9721679687500, -0.1022949218750,
+                      0.0476074218750, -0.0266113281250, 0.0148925781250, -0.0083007812500)
+_TRUE_PEAK_PHASE_1 = (-0.0291748046875, 0.0292968750000, -0.0517578125000, 0.0891113281250,
+                      -0.1665039062500, 0.4650878906250, 0.7797851562500, -0.2003173828125,
+                      0.1015625000000, -0.0582275390625, 0.0330810546875, -0.0189208984375)
+TRUE_PEAK_PHASES = (_TRUE_PEAK_PHASE_0, _TRUE_PEAK_PHASE_1,
+                    _TRUE_PEAK_PHASE_1[::-1], _TRUE_PEAK_PHASE_0[::-1])
+TRUE_PEAK_TAPS = len(_TRUE_PEAK_PHASE_0)
+
+
+def db_meter_position(levels):
+    """Doğrusal genlikleri METER_DB_FLOOR..0 dBFS ölçeğinde 0..1 gösterge konumuna çevirir."""
+    db = 20 * np.log10(np.maximum(levels, 1e-10))
+    return np.clip((db - METER_DB_FLOOR) / -METER_DB_FLOOR, 0.0, 1.0).tolist()
+
+
+class LevelMeter:
+    """Seçilen ölçüm kipine göre tampon başına kanal seviyelerini hesaplar; yalnızca NumPy ile kullanılır.
+
+    RMS ve PPM kipleri tamponlar arasında durum taşır; zaman sabitleri tamponun
+    süresine göre uygulanır. Gerçek tepe kipinde son TRUE_PEAK_TAPS - 1 örnek
+    bir sonraki tampona aktarılır. Örnek tepe dışındaki kipler dBFS ölçeğinde döner.
+    """
+
+    def __init__(self, mode=METER_MODE_PEAK):
+        # Süzgeç matrisi (dokunuş, faz); kayan pencereler zaman sırasında olduğu için katsayılar ters çevrilir
+        self._phases = np.array([phase[::-1] for phase in TRUE_PEAK_PHASES], dtype=np.float32).T
+        self.set_mode(mode)
+
+    def set_mode(self, mode):
+        self.mode = mode if mode in METER_MODES else METER_MODE_PEAK
+        self.reset()
+
+    def reset(self):
+        self._state = None
+        self._history = None
+
+    def process(self, block, sample_rate):
+        """block: (kare, kanal) float32 örnekler; kanal başına 0..1 gösterge konumu döndürür."""
+        frames, channels = block.shape
+        if self._state is None or len(self._state) != channels:
+            self._state = np.zeros(channels)
+            self._history = np.zeros((TRUE_PEAK_TAPS - 1, channels), dtype=np.float32)
+        dt = frames / sample_rate if sample_rate > 0 else 0.0
+
+        if self.mode == METER_MODE_RMS:
+            mean_square = np.einsum('ij,ij->j', block, block) / frames
+            self._state += (mean_square - self._state) * (1.0 - math.exp(-dt / VU_TIME_CONSTANT))
+            return db_meter_position(np.sqrt(self._state))
+
+        peaks = np.abs(block).max(axis=0)
+        if self.mode == METER_MODE_PPM:
+            decayed = self._state * 10 ** (-PPM_DECAY_DB_PER_SECOND * dt / 20)
+            rising = self._state + (peaks - self._state) * (1.0 - math.exp(-dt / PPM_ATTACK_SECONDS))
+            self._state = np.where(peaks > decayed, np.maximum(rising, decayed), decayed)
+            return db_meter_position(self._state)
+
+        if self.mode == METER_MODE_TRUE_PEAK:
+            signal = np.concatenate((self._history, block))
+            self._history = signal[-(TRUE_PEAK_TAPS - 1):].copy()
+            windows = np.lib.stride_tricks.sliding_window_view(signal, TRUE_PEAK_TAPS, axis=0)
+            oversampled = windows @ self._phases # (kare, kanal, faz)
+            return db_meter_position(np.maximum(np.abs(oversampled).max(axis=(0, 2)), peaks))
+
+        return peaks.tolist()
+
+
+# --- Spektrum Analizi ---
+class SpectrumAnalyzer:
+    """Kanalların ortalamasından örtüşen pencerelerle FFT alır ve logaritmik frekans bantlarına indirger.
+
+    Pencere ve bant sınırları yalnızca FFT boyu, örnekleme hızı ya da bant sayısı
+    değişince yeniden hesaplanır. Tamponlar arasında kalan örnekler bir sonraki
+    tamponun başına eklenir; pencereler SPECTRUM_HOP örnekte bir alınır.
+    Yalnızca NumPy ile kullanılır.
+    """
+
+    def __init__(self, bands=SPECTRUM_BANDS, fft_size=SPECTRUM_FFT_SIZE):
+        self.fft_size = fft_size
+        self.hop = fft_size // 2
+        self.window = np.hanning(fft_size).astype(np.float32)
+        # Tam ölçekli bir sinüs 0 dBFS görünsün diye genlikler pencere kazancına bölünür
+        self._magnitude_scale = 2.0 / float(self.window.sum())
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._edges = None
+        self._end = 0
+        self._edges_key = None
+        self.set_bands(bands)
+
+    def set_bands(self, bands):
+        self.bands = max(1, int(bands))
+        self._edges_key = None
+
+    def reset(self):
+        self._pending = np.zeros(0, dtype=np.float32)
+
+    def _band_edges(self, sample_rate):
+        key = (sample_rate, self.bands)
+        if self._edges_key != key:
+            bins = self.fft_size // 2 + 1
+            high = min(SPECTRUM_MAX_FREQ, sample_rate / 2)
+            frequencies = np.geomspace(SPECTRUM_MIN_FREQ, high, self.bands + 1)[:-1]
+            # Her bant en az bir FFT kutusu içerir; alçak frekanslarda bantlar kutulara yuvarlanır
+            edges = np.round(frequencies * self.fft_size / sample_rate).astype(np.intp)
+            self._end = min(bins, int(high * self.fft_size / sample_rate) + 1)
+            self._edges = np.clip(edges, 1, self._end - 1)
+            self._edges_key = key
+        return self._edges
+
+    def process(self, block, sample_rate):
+        """block: (kare, kanal) örnekler; yeni pencere oluşmadıysa None, yoksa bant başına 0..1 değerler döndürür."""
+        if sample_rate <= 0:
+            return None
+        self._pending = np.concatenate((self._pending, block.mean(axis=1)))
+        if len(self._pending) < self.fft_size:
+            return None
+
+        edges = self._band_edges(sample_rate)
+        bands = None
+        start = 0
+        while start + self.fft_size <= len(self._pending):
+            spectrum = np.abs(np.fft.rfft(self._pending[start:start + self.fft_size] * self.window))
+            frame_bands = np.maximum.reduceat(spectrum[:self._end], edges)
+            bands = frame_bands if bands is None else np.maximum(bands, frame_bands)
+            start += self.hop
+        self._pending = self._pending[start:].copy()
+        return db_meter_position(bands * self._magnitude_scale)
+
+
+# --- Ses Analizi Halkası ---
+def decode_samples_into(data, layout, out):
+    """Örnekleri -1..1 aralığına ölçekleyerek out dizisine (kare, kanal) yazar; out'a sığmayan kanallar atılır."""
+    samples = _numpy_samples(data, layout)
+    # Çıkarma float32'de yapılır; işaretsiz kaynak türünde yapılsa sıfırın altındaki örnekler taşardı
+    np.subtract(samples[:, :out.shape[1]], layout.zero, out=out, dtype=np.float32)
+    out *= 1.0 / layout.full_scale
+
+
+class AudioRingBuffer:
+    """Tek üretici ve tek tüketici için önceden ayrılmış, kilitsiz tampon halkası.
+
+    Üretici (arayüz iş parçacığı) örnekleri doğrudan boş bir yuvaya çözer ve
+    ancak yazma bittikten sonra baş sayacını ilerletir; tüketici (analiz iş
+    parçacığı) yalnızca kuyruk sayacını ilerletir. Sayaçların her birini tek bir
+    iş parçacığı yazdığı için kilit gerekmez. Halka doluysa yeni tampon atılır.
+    """
+
+    def __init__(self, slots=AUDIO_RING_SLOTS, slot_frames=AUDIO_RING_SLOT_FRAMES, max_channels=AUDIO_RING_MAX_CHANNELS):
+        self.slots = slots
+        self.slot_frames = slot_frames
+        self.max_channels = max_channels
+        self.samples = np.zeros((slots, slot_frames, max_channels), dtype=np.float32)
+        self.frames = array('I', bytes(4 * slots))
+        self.channels = array('I', bytes(4 * slots))
+        self.rates = array('I', bytes(4 * slots))
+        self.stamps = array('d', bytes(8 * slots))
+        self.head = 0 # yalnızca üretici yazar
+        self.tail = 0 # yalnızca tüketici yazar
+        self.dropped = 0
+
+    def push(self, buffer, layout):
+        """Tamponu bir ya da (uzunsa) birkaç yuvaya yazar; yer yoksa atlanan tamponu sayar."""
+        channels = min(layout.channels, self.max_channels)
+        slots_needed = -(-layout.frames // self.slot_frames)
+        if self.head - self.tail + slots_needed > self.slots:
+            self.dropped += 1
+            return False
+
+        data = _buffer_view(buffer)
+        frame_bytes = layout.sample_bytes * layout.channels
+        now = time.monotonic()
+        for start in range(0, layout.frames, self.slot_frames):
+            frames = min(self.slot_frames, layout.frames - start)
+            slot = self.head % self.slots
+            view = memoryview(data)[start * frame_bytes:(start + frames) * frame_bytes]
+            decode_samples_into(view, layout._replace(frames=frames), self.samples[slot, :frames, :channels])
+            self.frames[slot] = frames
+            self.channels[slot] = channels
+            self.rates[slot] = layout.sample_rate
+            self.stamps[slot] = now
+            self.head += 1
+        return True
+
+    def pending(self):
+        return self.head - self.tail
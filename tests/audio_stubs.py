@@ -0,0 +1,75 @@
+"""Testler için QAudioBuffer/QAudioFormat taklitleri ve örnek kodlayıcı."""
+
+import struct
+
+from linamp_audio import BIG_ENDIAN, LITTLE_ENDIAN, SAMPLE_SIGNED_INT, SAMPLE_UNSIGNED_INT
+
+
+class _Pointer(bytes):
+    """sip.voidptr gibi setsize çağrısını kabul eden bayt dizisi."""
+
+    def setsize(self, size):
+        pass
+
+
+class StubFormat:
+    def __init__(self, sample_type, sample_size, channels, byte_order, sample_rate=44100):
+        self._sample_type = sample_type
+        self._sample_size = sample_size
+        self._channels = channels
+        self._byte_order = byte_order
+        self._sample_rate = sample_rate
+
+    def sampleType(self):
+        return self._sample_type
+
+    def sampleSize(self):
+        return self._sample_size
+
+    def channelCount(self):
+        return self._channels
+
+    def byteOrder(self):
+        return self._byte_order
+
+    def sampleRate(self):
+        return self._sample_rate
+
+
+class StubBuffer:
+    def __init__(self, fmt, data, frames):
+        self._format = fmt
+        self._data = _Pointer(data)
+        self._frames = frames
+
+    def format(self):
+        return self._format
+
+    def frameCount(self):
+        return self._frames
+
+    def byteCount(self):
+        return len(self._data)
+
+    def constData(self):
+        return self._data
+
+
+def encode_buffer(frames, sample_type, bits, container_bytes, big_endian=False, sample_rate=44100):
+    """frames: kare başına kanal değerleri listesi (tam sayı kiplerinde işaretli, float kipinde -1..1).
+
+    İşaretsiz kiplerde değerler tam ölçek kadar kaydırılarak yazılır.
+    """
+    byte_order = 'big' if big_endian else 'little'
+    full_scale = 1 << (bits - 1)
+    data = bytearray()
+    for frame in frames:
+        for value in frame:
+            if sample_type == SAMPLE_SIGNED_INT:
+                data += int(value).to_bytes(container_bytes, byte_order, signed=True)
+            elif sample_type == SAMPLE_UNSIGNED_INT:
+                data += int(value + full_scale).to_bytes(container_bytes, byte_order, signed=False)
+            else:
+                data += struct.pack(('>' if big_endian else '<') + ('f' if container_bytes == 4 else 'd'), value)
+    fmt = StubFormat(sample_type, bits, len(frames[0]), BIG_ENDIAN if big_endian else LITTLE_ENDIAN, sample_rate)
+    return StubBuffer(fmt, bytes(data), len(frames))
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Uygulama modülleri paket dizininde, linamp.py'nin yanında durur
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       "linamp_pkg1.2.2", "usr", "share", "linamp")
+sys.path.insert(0, APP_DIR)
@@ -0,0 +1,50 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from audio_stubs import encode_buffer
+from linamp_audio import SAMPLE_FLOAT, SAMPLE_SIGNED_INT, SAMPLE_UNSIGNED_INT, AudioRingBuffer, sample_layout
+
+
+def _push(ring, buffer):
+    layout = sample_layout(buffer)
+    assert ring.push(buffer, layout)
+    slot = (ring.head - 1) % ring.slots
+    return ring.samples[slot, :ring.frames[slot], :ring.channels[slot]]
+
+
+@pytest.mark.parametrize("sample_type", [SAMPLE_UNSIGNED_INT, SAMPLE_SIGNED_INT])
+@pytest.mark.parametrize("bits, container", [(8, 1), (16, 2), (24, 3), (32, 4)])
+@pytest.mark.parametrize("big_endian", [False, True])
+def test_ring_decodes_integer_samples(sample_type, bits, container, big_endian):
+    full_scale = 1 << (bits - 1)
+    frames = [[-full_scale, full_scale - 1], [-1, 0], [1, full_scale // 2], [-full_scale // 2, 0]]
+    block = _push(AudioRingBuffer(slots=2, slot_frames=16, max_channels=2),
+                  encode_buffer(frames, sample_type, bits, container, big_endian))
+    np.testing.assert_allclose(block, np.array(frames) / full_scale, atol=1e-6)
+
+
+def test_unsigned_below_midpoint_does_not_wrap():
+    # 127 (u8) sessizliğin bir adım altıdır; kaynak türünde çıkarılırsa 255'e sarıp ~1.99 olur
+    block = _push(AudioRingBuffer(slots=2, slot_frames=16, max_channels=1),
+                  encode_buffer([[-1], [-128]], SAMPLE_UNSIGNED_INT, 8, 1))
+    assert block[:, 0].tolist() == pytest.approx([-1 / 128, -1.0])
+
+
+def test_ring_splits_long_buffers_and_drops_extra_channels():
+    frames = [[value / 64, -value / 64, 0.5] for value in range(-32, 32)]
+    ring = AudioRingBuffer(slots=8, slot_frames=16, max_channels=2)
+    layout = sample_layout(encode_buffer(frames, SAMPLE_FLOAT, 32, 4))
+    assert ring.push(encode_buffer(frames, SAMPLE_FLOAT, 32, 4), layout)
+    assert ring.head == 4
+    decoded = np.concatenate([ring.samples[slot, :ring.frames[slot], :ring.channels[slot]] for slot in range(4)])
+    np.testing.assert_allclose(decoded, np.array(frames, dtype=np.float32)[:, :2])
+
+
+def test_full_ring_drops_buffer():
+    ring = AudioRingBuffer(slots=1, slot_frames=4, max_channels=1)
+    buffer = encode_buffer([[0.0]] * 4, SAMPLE_FLOAT, 32, 4)
+    layout = sample_layout(buffer)
+    assert ring.push(buffer, layout)
+    assert not ring.push(buffer, layout)
+    assert ring.dropped == 1
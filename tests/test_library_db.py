@@ -0,0 +1,107 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+import linamp_db
+from linamp_db import LibraryDatabase
+from linamp_store import TrackStore
+
+
+@pytest.fixture(autouse=True)
+def short_delays(monkeypatch):
+    monkeypatch.setattr(linamp_db, 'STATE_SAVE_DELAY_MS', 50)
+    monkeypatch.setattr(linamp_db, 'STATE_SAVE_MAX_DELAY_MS', 300)
+
+
+class FlakyDatabase(LibraryDatabase):
+    """Satır silme işlemlerinde disk hatası veren veritabanı."""
+
+    def _apply_remove(self, conn, start, end):
+        raise sqlite3.OperationalError("disk I/O error")
+
+
+def _stored_paths(db_path):
+    db = LibraryDatabase(db_path)
+    try:
+        return db.load_playlist()[0]
+    finally:
+        db.close()
+
+
+def _insert(db, store, row, paths):
+    # Model yalnızca sona ekler; veritabanı işlemi satır numarasıyla gelir
+    assert row == len(store)
+    store.extend(paths)
+    db.insert_tracks(row, paths)
+
+
+def test_failed_row_op_resyncs_from_model(tmp_path):
+    db_path = str(tmp_path / "library.db")
+    resync = threading.Event()
+    db = FlakyDatabase(db_path, resync_requested=resync.set)
+    store = TrackStore()
+    _insert(db, store, 0, [f"/music/{i:02d}.mp3" for i in range(20)])
+    time.sleep(0.2)
+    assert not resync.is_set()
+
+    # Aynı grupta: taşıma, başarısız silme, ardından satır numarasına dayanan işlemler
+    store.move(0, 2, 10)
+    db.move_rows(0, 1, 10)
+    store.remove(3, 4)
+    db.remove_rows(3, 6)
+    store.move(10, 3, 0)
+    db.move_rows(10, 12, 0)
+    _insert(db, store, len(store), ["/music/new.mp3"])
+    assert resync.wait(2)
+
+    db.replace_playlist(store.snapshot())
+    db.close()
+    assert _stored_paths(db_path) == list(store.paths())
+
+
+def test_resync_snapshot_is_used_on_close(tmp_path):
+    db_path = str(tmp_path / "library.db")
+    db = FlakyDatabase(db_path)
+    store = TrackStore()
+    _insert(db, store, 0, [f"/music/{i:02d}.mp3" for i in range(8)])
+    store.remove(0, 2)
+    db.remove_rows(0, 1)
+    store.move(0, 1, 3)
+    db.move_rows(0, 0, 3)
+    db.close(store.snapshot())
+    assert _stored_paths(db_path) == list(store.paths())
+
+
+def test_failed_settings_op_keeps_rows_in_sync(tmp_path):
+    db_path = str(tmp_path / "library.db")
+    resync = threading.Event()
+    db = LibraryDatabase(db_path, resync_requested=resync.set)
+    store = TrackStore()
+    _insert(db, store, 0, [f"/music/{i:02d}.mp3" for i in range(6)])
+    db.set_settings({'volume': 30, 'broken': object()})
+    store.move(4, 2, 0)
+    db.move_rows(4, 5, 0)
+    db.close()
+    assert not resync.is_set()
+    assert _stored_paths(db_path) == list(store.paths())
+
+
+def test_continuous_changes_are_flushed_within_max_delay(tmp_path):
+    db_path = str(tmp_path / "library.db")
+    db = LibraryDatabase(db_path)
+    reader = sqlite3.connect(db_path)
+    try:
+        flushed_after = None
+        start = time.monotonic()
+        # Sessizlik aralığından (50 ms) sık gelen değişiklikler 1 saniye boyunca sürer
+        for i in range(100):
+            db.insert_tracks(i, [f"/music/{i:03d}.mp3"])
+            time.sleep(0.01)
+            if flushed_after is None and reader.execute("SELECT COUNT(*) FROM playlist_entries").fetchone()[0]:
+                flushed_after = time.monotonic() - start
+        assert flushed_after is not None and flushed_after < 0.6
+    finally:
+        reader.close()
+        db.close()
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+import linamp_audio
+from audio_stubs import encode_buffer
+from linamp_audio import SAMPLE_FLOAT, SAMPLE_SIGNED_INT, SAMPLE_UNSIGNED_INT, channel_peaks, sample_layout
+
+# (ad, örnek türü, bit, kap boyutu)
+FORMATS = [
+    ("s8", SAMPLE_SIGNED_INT, 8, 1),
+    ("u8", SAMPLE_UNSIGNED_INT, 8, 1),
+    ("s16", SAMPLE_SIGNED_INT, 16, 2),
+    ("u16", SAMPLE_UNSIGNED_INT, 16, 2),
+    ("s24-packed", SAMPLE_SIGNED_INT, 24, 3),
+    ("u24-packed", SAMPLE_UNSIGNED_INT, 24, 3),
+    ("s24-in-32", SAMPLE_SIGNED_INT, 24, 4),
+    ("s32", SAMPLE_SIGNED_INT, 32, 4),
+    ("f32", SAMPLE_FLOAT, 32, 4),
+    ("f64", SAMPLE_FLOAT, 64, 8),
+]
+
+PATHS = ["numpy", "python"]
+
+
+@pytest.fixture(params=PATHS)
+def decode_path(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(linamp_audio, "np", None)
+    return request.param
+
+
+def _frames(sample_type, bits, channels, count=97, seed=0):
+    rng = random.Random(seed)
+    if sample_type == SAMPLE_FLOAT:
+        frames = [[rng.uniform(-0.9, 0.9) for _ in range(channels)] for _ in range(count)]
+        frames[5][0] = -1.0
+        return frames
+    full_scale = 1 << (bits - 1)
+    frames = [[rng.randint(-full_scale // 2, full_scale // 2) for _ in range(channels)] for _ in range(count)]
+    # En negatif değer işaret uzatması ve taşma hatalarını yakalar
+    frames[5][0] = -full_scale
+    frames[9][-1] = full_scale - 1
+    return frames
+
+
+def _expected_peaks(frames, sample_type, bits, container):
+    full_scale = 1.0 if sample_type == SAMPLE_FLOAT else float(1 << (bits - 1))
+    peaks = []
+    for channel in range(len(frames[0])):
+        values = [frame[channel] for frame in frames]
+        if container == 3:
+            # Saf Python yolu yalnızca üst 16 biti okur; beklenen değer de o çözünürlüğe indirilir
+            values = [value >> 8 << 8 for value in values]
+        peaks.append(max(max(values), -min(values)) / full_scale)
+    return peaks
+
+
+@pytest.mark.parametrize("name, sample_type, bits, container", FORMATS, ids=[f[0] for f in FORMATS])
+@pytest.mark.parametrize("big_endian", [False, True], ids=["le", "be"])
+@pytest.mark.parametrize("channels", [1, 2], ids=["mono", "stereo"])
+def test_channel_peaks(decode_path, name, sample_type, bits, container, big_endian, channels):
+    frames = _frames(sample_type, bits, channels)
+    buffer = encode_buffer(frames, sample_type, bits, container, big_endian)
+    peaks = channel_peaks(buffer)
+    expected = _expected_peaks(frames, sample_type, bits, container)
+    # Paketli 24 bitte NumPy tam çözünürlüklü okur; alt baytın farkı 1/32768'den küçüktür
+    tolerance = 1 / 32768 if container == 3 else 1e-6
+    assert peaks == pytest.approx(expected, abs=tolerance)
+
+
+@pytest.mark.parametrize("name, sample_type, bits, container", FORMATS, ids=[f[0] for f in FORMATS])
+def test_numpy_and_python_paths_agree(monkeypatch, name, sample_type, bits, container):
+    pytest.importorskip("numpy")
+    for big_endian in (False, True):
+        buffer = encode_buffer(_frames(sample_type, bits, 2, seed=1), sample_type, bits, container, big_endian)
+        with_numpy = channel_peaks(buffer)
+        monkeypatch.setattr(linamp_audio, "np", None)
+        without_numpy = channel_peaks(buffer)
+        monkeypatch.undo()
+        assert with_numpy == pytest.approx(without_numpy, abs=1 / 32768)
+
+
+def test_silence_is_zero_for_unsigned_formats(decode_path):
+    for bits, container in ((8, 1), (16, 2), (24, 3)):
+        buffer = encode_buffer([[0, 0]] * 16, SAMPLE_UNSIGNED_INT, bits, container)
+        assert channel_peaks(buffer) == [0.0, 0.0]
+
+
+def test_layout_uses_buffer_container_size():
+    packed = sample_layout(encode_buffer([[0]] * 4, SAMPLE_SIGNED_INT, 24, 3))
+    padded = sample_layout(encode_buffer([[0]] * 4, SAMPLE_SIGNED_INT, 24, 4))
+    assert (packed.sample_bytes, packed.full_scale) == (3, 1 << 23)
+    assert (padded.sample_bytes, padded.full_scale) == (4, 1 << 23)
+
+
+def test_unsupported_format_returns_none():
+    buffer = encode_buffer([[0.0]] * 4, SAMPLE_FLOAT, 32, 4)
+    buffer.format()._sample_type = 0 # QAudioFormat.Unknown
+    assert channel_peaks(buffer) is None
@@ -0,0 +1,97 @@
+import os
+
+import pytest
+from mutagen.id3 import ID3, TIT2, TPE1, APIC
+
+import linamp_tags
+from linamp_tags import format_track_title, read_basic_tags, read_id3_header_tags
+
+# MPEG-1 Layer III, 128 kbit/s, 44,1 kHz; çerçeve boyu 417 bayt
+MP3_FRAME = b'\xff\xfb\x90\x00' + bytes(413)
+
+
+def _write_mp3(path, audio_bytes, title="Başlık", artist="Sanatçı", cover_bytes=0, v1=None):
+    with open(path, 'wb') as f:
+        f.write(MP3_FRAME * (audio_bytes // len(MP3_FRAME)))
+    tags = ID3()
+    tags.add(TIT2(encoding=3, text=title))
+    tags.add(TPE1(encoding=3, text=artist))
+    if cover_bytes:
+        tags.add(APIC(encoding=3, mime='image/jpeg', type=3, desc='', data=bytes(cover_bytes)))
+    # Dolgu sabit tutulur; mutagen aksi halde dosya boyutuyla büyüyen bir dolgu seçer
+    tags.save(path, v1=0, padding=lambda info: 1024)
+    if v1 is not None:
+        with open(path, 'ab') as f:
+            f.write(v1)
+    return path
+
+
+def _id3v1(title, album):
+    def field(text, size):
+        return text.encode('latin-1').ljust(size, b'\0')
+    return b'TAG' + field(title, 30) + field("", 30) + field(album, 30) + b'2001' + field("", 30) + b'\xff'
+
+
+@pytest.fixture
+def counted_reads(monkeypatch):
+    """linamp_tags'in pread/read ile okuduğu toplam baytı sayar."""
+    counter = {'bytes': 0, 'calls': 0}
+    pread, read = os.pread, os.read
+
+    def counting_pread(fd, size, offset):
+        data = pread(fd, size, offset)
+        counter['bytes'] += len(data)
+        counter['calls'] += 1
+        return data
+
+    def counting_read(fd, size):
+        data = read(fd, size)
+        counter['bytes'] += len(data)
+        counter['calls'] += 1
+        return data
+
+    monkeypatch.setattr(linamp_tags.os, 'pread', counting_pread)
+    monkeypatch.setattr(linamp_tags.os, 'read', counting_read)
+    return counter
+
+
+def test_header_reader_reads_only_tag_regions(tmp_path, counted_reads):
+    small = _write_mp3(str(tmp_path / "small.mp3"), 64 * 1024)
+    large = _write_mp3(str(tmp_path / "large.mp3"), 8 * 1024 * 1024)
+
+    read_id3_header_tags(small)
+    small_bytes = counted_reads['bytes']
+    counted_reads['bytes'] = counted_reads['calls'] = 0
+    tags = read_id3_header_tags(large)
+
+    assert str(tags['TIT2']) == "Başlık"
+    # Okunan bayt ses akışının boyutundan bağımsızdır: etiket + 128 baytlık ID3v1 bölgesi
+    assert counted_reads['bytes'] == small_bytes
+    assert counted_reads['bytes'] < 8 * 1024
+    assert counted_reads['calls'] <= 3
+
+
+def test_header_reader_skips_cover_payload_only_by_tag_size(tmp_path, counted_reads):
+    path = _write_mp3(str(tmp_path / "cover.mp3"), 1024 * 1024, cover_bytes=200 * 1024)
+    tags = read_id3_header_tags(path)
+    assert tags.getall('APIC')[0].type == 3
+    # Gömülü kapak etiketin içindedir; ses verisi yine okunmaz
+    assert 200 * 1024 < counted_reads['bytes'] < 200 * 1024 + 8 * 1024
+
+
+def test_id3v1_fills_missing_frames(tmp_path):
+    path = str(tmp_path / "v1.mp3")
+    _write_mp3(path, 32 * 1024, v1=_id3v1("Old title", "Old album"))
+    tags = read_basic_tags(path)
+    # ID3v2'deki alanlar önceliklidir, eksik olan albüm ID3v1'den gelir
+    assert tags == {'artist': "Sanatçı", 'title': "Başlık", 'album': "Old album"}
+    assert format_track_title(tags, path) == "Sanatçı - Başlık"
+
+
+def test_untagged_and_unreadable_files(tmp_path):
+    path = str(tmp_path / "plain.mp3")
+    with open(path, 'wb') as f:
+        f.write(MP3_FRAME * 10)
+    assert read_id3_header_tags(path) is None
+    assert read_id3_header_tags(str(tmp_path / "missing.mp3")) is None
+    assert format_track_title(read_basic_tags(path), path) == "plain.mp3"
@@ -0,0 +1,123 @@
+import random
+
+from linamp_store import EMPTY_TRACK_METADATA, TrackStore
+
+
+def _metadata(artist, title, duration):
+    return EMPTY_TRACK_METADATA._replace(artist=artist, title=title, duration=duration)
+
+
+def _store(count):
+    store = TrackStore()
+    store.extend([f"/music/album{i // 10}/track{i}.mp3" for i in range(count)])
+    return store
+
+
+def test_paths_round_trip():
+    store = _store(25)
+    assert list(store.paths())[:2] == ["/music/album0/track0.mp3", "/music/album0/track1.mp3"]
+    assert "/music/album2/track24.mp3" in store
+    assert "/music/album2/track99.mp3" not in store
+
+
+def test_metadata_is_stored_per_track():
+    store = _store(3)
+    assert store.metadata(0) is None
+    changed = store.set_metadata([("/music/album0/track1.mp3", _metadata("Artist", "Şarkı", 61.0)),
+                                  ("/not/in/list.mp3", _metadata("X", "Y", 5.0))])
+    assert changed
+    assert store.is_indexed(1) and not store.is_indexed(0)
+    metadata = store.metadata(1)
+    assert (metadata.artist, metadata.title, metadata.duration) == ("Artist", "Şarkı", 61.0)
+    assert store.metadata_of("/music/album0/track1.mp3") == metadata
+    assert store.total_duration == 61.0 and store.timed_count == 1
+
+
+def test_metadata_follows_moves():
+    store = _store(4)
+    store.set_metadata([("/music/album0/track0.mp3", _metadata("A", "First", 10.0))])
+    store.move(0, 1, 4)
+    assert store.metadata(3).title == "First"
+    assert store.metadata(0) is None
+
+
+def test_removed_rows_release_metadata():
+    store = _store(100)
+    store.set_metadata([(path, _metadata(f"Artist {i % 3}", f"Title {i}", 1.0))
+                        for i, path in enumerate(store.paths())])
+    store.remove_ranges([(0, 79)])
+    assert len(store) == 20
+    assert store.total_duration == 20.0 and store.timed_count == 20
+    # Silinen satırların başlıkları ve etiketleri sıkıştırmada atılır
+    assert len(store._texts) == sum(len(f"Title {i}") for i in range(80, 100))
+    assert sorted(label for label in store._labels if label) == ["Artist 0", "Artist 1", "Artist 2"]
+    assert [store.metadata(row).title for row in (0, 19)] == ["Title 80", "Title 99"]
+    assert "/music/album0/track0.mp3" not in store
+
+    # Yeniden eklenen yol eski bilgisini taşımaz
+    store.append("/music/album0/track0.mp3")
+    assert store.metadata(len(store) - 1) is None
+
+
+def test_clear_releases_metadata():
+    store = _store(10)
+    store.set_metadata([(path, _metadata("A", "T", 2.0)) for path in store.paths()])
+    store.remove_ranges([(0, 9)])
+    assert len(store) == 0 and store.total_duration == 0 and len(store._texts) == 0
+
+
+def test_duration_of_ranges():
+    store = _store(5)
+    store.set_metadata([(store.path(row), _metadata(None, None, 30.0)) for row in (0, 2)])
+    assert store.duration_of_ranges([(0, 1), (2, 3)]) == (60.0, 2, 4)
+
+
+def test_album_and_cover_hash_are_stored_and_released():
+    store = _store(40)
+    cover = "0123456789abcdef0123456789abcdef01234567"
+    store.set_metadata([(path, EMPTY_TRACK_METADATA._replace(
+        title="T", album=f"Album {row // 10}", cover_hash=cover if row % 2 else "", codec="mp3"))
+        for row, path in enumerate(store.paths())])
+    metadata = store.metadata(11)
+    assert (metadata.album, metadata.cover_hash) == ("Album 1", cover)
+    assert store.metadata(10).cover_hash == ""
+    # Kodlama parametreleri bellekte tutulmaz
+    assert metadata.codec is None
+
+    store.remove_ranges([(0, 29)])
+    assert len(store._covers) == 10 * len(bytes.fromhex(cover))
+    assert [label for label in store._labels if label] == ["Album 3"]
+    assert store.metadata(1).cover_hash == cover and store.metadata(1).album == "Album 3"
+
+
+def test_path_index_survives_churn():
+    store = TrackStore()
+    expected = []
+    rng = random.Random(7)
+    for step in range(3000):
+        if expected and rng.random() < 0.45:
+            row = rng.randrange(len(expected))
+            store.remove(row)
+            del expected[row]
+        else:
+            path = f"/music/{rng.randrange(50)}/{step}.mp3"
+            store.append(path)
+            expected.append(path)
+        if step % 250 == 0:
+            assert list(store.paths()) == expected
+    assert all(path in store for path in expected)
+    assert not any(f"/music/{i}/gone.mp3" in store for i in range(50))
+    removed = set(f"/music/{d}/{s}.mp3" for d in range(50) for s in range(3000)) - set(expected)
+    assert not any(path in store for path in list(removed)[:500])
+
+
+def test_missing_marks_can_be_listed_and_cleared():
+    store = _store(5)
+    paths = list(store.paths())
+    assert store.set_missing([paths[3], paths[1], "/not/in/list.mp3"]) == 2
+    assert store.missing_paths() == [paths[1], paths[3]]
+    store.move(3, 1, 0)
+    assert store.missing_paths() == [paths[3], paths[1]]
+    assert store.set_missing([paths[3]], missing=False) == 1
+    assert store.missing_paths() == [paths[1]]
+    assert not store.is_missing(0) and store.is_missing(2)